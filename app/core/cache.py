@@ -0,0 +1,183 @@
+"""
+분석 결과 캐시 모듈
+(로그 지문 + 알고리즘 + 정규화된 파라미터) 키로 MinerResult를 저장합니다.
+메모리 LRU 계층과 디스크(pickle) 계층 두 단계로 구성되며, 디스크 계층은 용량 한도를 넘으면
+가장 오래 사용하지 않은 항목부터 삭제합니다.
+"""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get("PROCESSENG_CACHE_DIR", Path.home() / ".cache" / "processeng")
+)
+LOG_KEY_COLUMNS = ["case:concept:name", "concept:name", "time:timestamp"]
+# 캐시된 결과 형식 버전. MinerResult 필드나 DFG · 성능 통계 형식을 바꾸면 올립니다
+# (디스크 계층은 코드보다 오래 남으므로, 이전 형식의 결과는 키가 달라져 조회되지 않음).
+CACHE_FORMAT_VERSION = 1
+
+
+# ─── 캐시 키 ────────────────────────────────────────────────────────────────
+def log_fingerprint(frame: pd.DataFrame) -> str:
+    """
+    PM4Py 형식 이벤트 로그 DataFrame의 내용 지문(SHA-1)을 계산합니다.
+    Discovery에 쓰이는 Case ID / Activity / Timestamp 컬럼만 해시합니다.
+    """
+    hashed = pd.util.hash_pandas_object(frame[LOG_KEY_COLUMNS], index=False)
+    digest = hashlib.sha1(hashed.to_numpy().tobytes())
+    digest.update(str(len(frame)).encode())
+    return digest.hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    """파라미터 값을 JSON 직렬화 가능한 정규형으로 변환합니다 (실수는 소수점 6자리)."""
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def make_cache_key(fingerprint: str, algorithm: str, params: dict) -> str:
+    """결과 형식 버전 + 로그 지문 + 알고리즘 + 파라미터로 캐시 키를 만듭니다."""
+    payload = json.dumps(
+        {
+            "format": CACHE_FORMAT_VERSION,
+            "log": fingerprint,
+            "algorithm": algorithm,
+            "params": _normalize(params),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+# ─── 캐시 ───────────────────────────────────────────────────────────────────
+class MinerCache:
+    """
+    MinerResult 2단계 캐시.
+
+    Parameters
+    ----------
+    max_entries    : 메모리 계층에 보관할 최대 결과 수
+    cache_dir      : 디스크 계층 디렉토리 (None이면 디스크 계층 사용 안 함)
+    max_disk_bytes : 디스크 계층 용량 한도 (바이트)
+
+    저장 시 `event_log`는 제외하며, 조회 시 호출자가 현재 로그를 다시 연결합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR / "miner",
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ── 조회 / 저장 ──────────────────────────────────────────────────────────
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 MinerResult를 반환합니다. 없으면 None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        result = self._disk_get(key)
+        if result is not None:
+            self._memory_put(key, result)
+        return result
+
+    def put(self, key: str, result: Any) -> None:
+        """MinerResult를 메모리·디스크 계층에 저장합니다."""
+        result = dataclasses.replace(result, event_log=None)
+        self._memory_put(key, result)
+        self._disk_put(key, result)
+
+    def clear(self) -> None:
+        """두 계층을 모두 비웁니다."""
+        with self._lock:
+            self._memory.clear()
+        for path in self._disk_entries():
+            path.unlink(missing_ok=True)
+
+    # ── 메모리 계층 ───────────────────────────────────────────────────────────
+    def _memory_put(self, key: str, result: Any) -> None:
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    # ── 디스크 계층 ───────────────────────────────────────────────────────────
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def _disk_entries(self) -> list[Path]:
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return []
+        return list(self.cache_dir.glob("*.pkl"))
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)  # LRU 순서 갱신
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # 손상되었거나 호환되지 않는 항목은 삭제
+            path.unlink(missing_ok=True)
+            return None
+
+    def _disk_put(self, key: str, result: Any) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            # pickle 불가 모델 등은 메모리 계층에만 보관
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        """디스크 계층이 용량 한도를 넘으면 오래된 항목부터 삭제합니다."""
+        entries = []
+        for path in self._disk_entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
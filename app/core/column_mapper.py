@@ -2,20 +2,36 @@
 컬럼 자동 추론 모듈
 CSV/Excel 컬럼을 Process Mining 필수 필드(Case ID / Activity / Timestamp)에
 키워드 + 타입 + 통계 기반으로 자동 매핑합니다.
+
+컬럼 프로필은 행 수와 관계없이 상한이 있는 층화 표본(연속 행 블록)으로 한 번만 계산하고,
+고유값 수는 HyperLogLog 스케치로 추정합니다. 넓은 테이블은 컬럼 묶음을 워커 프로세스에 나눠 프로파일링합니다. 같은 프로필을 `map`과 `validate`가 공유합니다.
+확정된 매핑은 스키마 지문(컬럼명 + dtype) 키로 `MappingStore`에 저장해, 같은 양식의 파일은
+프로파일링 없이 바로 매핑합니다.
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from core.cache import DEFAULT_CACHE_DIR
+from core.timestamps import MIN_SUCCESS_RATIO, infer_format
+
 # ─── 키워드 사전 ────────────────────────────────────────────────────────────
 KEYWORDS: dict[str, dict[str, set]] = {
     "case_id": {
         "exact": {
             "caseid", "case_id", "traceid", "trace_id", "instanceid",
-            "process_id", "orderid", "order_id",
+            "process_id", "orderid", "order_id", "case:concept:name",
         },
         "partial": {
             "case", "trace", "instance", "order", "id", "key",
@@ -58,6 +74,16 @@ KEYWORDS: dict[str, dict[str, set]] = {
     },
 }
 
+PROFILE_SAMPLE_ROWS = 20_000  # 프로파일링 표본 행 수 상한
+PROFILE_BLOCKS = 20           # 표본 블록 수 (행 범위를 균등 분할한 구간마다 연속 행 블록 1개)
+HLL_PRECISION = 12            # HyperLogLog 레지스터 2^12개 (표준 오차 약 1.6%)
+PROFILE_WORKERS = min(os.cpu_count() or 1, 8)  # 병렬 프로파일링 기본 워커 수
+PARALLEL_PROFILE_COLUMNS = 200  # 이 컬럼 수 이상일 때만 프로세스 풀 사용 (풀 기동 비용 때문)
+
+MAPPING_STORE_FILE = DEFAULT_CACHE_DIR / "mappings.json"
+MAPPING_STORE_SIZE = 500      # 저장소에 보관할 최대 스키마 수 (최근 저장 순)
+STORED_LABEL = "💾 저장됨"     # 저장소에서 가져온 매핑의 신뢰도 표시
+
 _CONFIDENCE_TABLE = [
     (80, "high",   "🟢 높음"),
     (50, "medium", "🟡 보통"),
@@ -77,6 +103,7 @@ class ColumnProfile:
     sample_values: list
     is_parseable_datetime: bool
     avg_str_length: float = 0.0
+    n_rows: int = 0               # 프로필 계산에 사용한 표본 행 수
 
 
 @dataclass
@@ -91,48 +118,162 @@ class MappingResult:
 
 # ─── 내부 헬퍼 ──────────────────────────────────────────────────────────────
 def _try_parse_datetime(series: pd.Series, sample_size: int = 50) -> float:
-    """datetime 파싱 성공률을 반환 (0~1)."""
-    sample = series.dropna().head(sample_size)
-    if len(sample) == 0:
-        return 0.0
-    try:
-        parsed = pd.to_datetime(sample, errors="coerce")
-        return float(parsed.notna().sum()) / len(sample)
-    except Exception:
-        return 0.0
+    """datetime 파싱 성공률을 반환 (0~1). 숫자 컬럼은 epoch 범위 값일 때만 파싱 가능으로 봅니다."""
+    return infer_format(series, sample_size).success_ratio
+
+
+def _sample_rows(
+    df: pd.DataFrame,
+    n: int = PROFILE_SAMPLE_ROWS,
+    blocks: int = PROFILE_BLOCKS,
+) -> pd.DataFrame:
+    """
+    프로파일링용 층화 표본을 추출합니다.
+
+    행 범위를 blocks개 구간으로 나눠 각 구간 앞에서 연속 행 n // blocks개씩 가져옵니다.
+    연속 블록을 쓰므로 같은 케이스의 이벤트가 붙어 있는 로그에서도 Case ID의
+    고유값 비율(이벤트 수 / 케이스 수)이 전체와 비슷하게 유지됩니다.
+    """
+    total = len(df)
+    if total <= n:
+        return df
+    size = n // blocks
+    starts = (np.arange(blocks) * (total / blocks)).astype(np.int64)
+    return df.iloc[(starts[:, None] + np.arange(size)).ravel()]
+
+
+def _hash_strings(values: pd.Series) -> Optional[np.ndarray]:
+    """
+    Arrow 기반 문자열 컬럼의 64비트 해시를 UTF-8 버퍼에서 직접 계산합니다 (다항식 해시 + splitmix64 혼합).
+    hash_pandas_object는 문자열마다 Python 객체를 거쳐 표본 크기에서 HyperLogLog 비용의 대부분을 차지합니다.
+    Arrow 문자열이 아니면 None.
+    """
+    import pyarrow as pa
+
+    if not isinstance(values.dtype, pd.StringDtype) or values.dtype.storage != "pyarrow":
+        return None
+    arr = pa.array(values, from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    arr = arr.cast(pa.large_string())
+    n = len(arr)
+    _, offset_buf, data_buf = arr.buffers()
+    offsets = np.frombuffer(offset_buf, dtype=np.int64)[arr.offset:arr.offset + n + 1]
+    data = np.frombuffer(data_buf, dtype=np.uint8)[offsets[0]:offsets[-1]]
+    starts = offsets[:-1] - offsets[0]
+    lengths = np.diff(offsets)
+
+    hashes = lengths.astype(np.uint64)
+    with np.errstate(over="ignore"):
+        if len(data):
+            powers = np.cumprod(np.full(int(lengths.max()), np.uint64(0x100000001B3)))
+            terms = data.astype(np.uint64) * powers[np.arange(len(data)) - np.repeat(starts, lengths)]
+            nonempty = lengths > 0
+            hashes[nonempty] ^= np.add.reduceat(terms, starts[nonempty])
+        hashes ^= hashes >> np.uint64(30)
+        hashes *= np.uint64(0xBF58476D1CE4E5B9)
+        hashes ^= hashes >> np.uint64(27)
+        hashes *= np.uint64(0x94D049BB133111EB)
+        hashes ^= hashes >> np.uint64(31)
+    return hashes
+
+
+def _hll_distinct(series: pd.Series, precision: int = HLL_PRECISION) -> int:
+    """
+    HyperLogLog로 결측을 제외한 고유값 수를 추정합니다 (해시 · 레지스터 갱신 모두 벡터 연산).
+    고유값이 적을 때는 linear counting 보정으로 사실상 정확한 값을 반환합니다.
+    """
+    values = series.dropna()
+    if values.empty:
+        return 0
+    hashes = _hash_strings(values)
+    if hashes is None:
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    m = 1 << precision
+    register = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+    # 나머지 비트의 선행 0 개수 + 1 (상위 32비트 기준, float64로 정확히 표현됨)
+    rest = ((hashes << np.uint64(precision)) >> np.uint64(32)).astype(np.float64)
+    _, bit_length = np.frexp(rest)
+    rank = (33 - bit_length).astype(np.uint8)
+
+    registers = np.zeros(m, dtype=np.uint8)
+    np.maximum.at(registers, register, rank)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.exp2(-registers.astype(np.float64)).sum()
+    zeros = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return int(round(min(estimate, len(values))))
+
+
+def _dtype_label(series: pd.Series) -> str:
+    """스코어링용 dtype 이름. 문자열 컬럼은 저장 방식(object / str / string)과 관계없이 "object"."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return "category"
+    if pd.api.types.is_string_dtype(series.dtype):
+        return "object"
+    return str(series.dtype)
 
 
 def _profile_columns(df: pd.DataFrame) -> list[ColumnProfile]:
-    """모든 컬럼의 프로필을 생성합니다."""
-    total = max(len(df), 1)
+    """
+    모든 컬럼의 프로필을 생성합니다.
+    층화 표본(최대 PROFILE_SAMPLE_ROWS행)만 사용하므로 비용은 전체 행 수와 무관합니다.
+    """
+    sample = _sample_rows(df)
+    total = max(len(sample), 1)
+    null_ratios = sample.isna().mean()
     profiles = []
 
-    for col in df.columns:
-        series = df[col]
-        null_ratio = float(series.isna().sum()) / total
-        unique_count = int(series.nunique())
-        unique_ratio = unique_count / total
-        sample_vals = series.dropna().head(50).tolist()
-        is_dt = _try_parse_datetime(series) >= 0.85
+    for col in sample.columns:
+        series = sample[col]
+        unique_count = _hll_distinct(series)
+        dtype = _dtype_label(series)
+        non_null = series.dropna()
 
         avg_len = 0.0
-        if series.dtype == object:
-            lengths = series.dropna().astype(str).str.len()
-            avg_len = float(lengths.mean()) if len(lengths) > 0 else 0.0
+        if dtype == "object" and len(non_null) > 0:
+            lengths = non_null.str.len() if pd.api.types.is_string_dtype(non_null) else None
+            if lengths is None or lengths.isna().any():  # 숫자 등이 섞인 object 컬럼
+                lengths = non_null.astype(str).str.len()
+            avg_len = float(lengths.mean())
 
         profiles.append(ColumnProfile(
             name=col,
-            dtype=str(series.dtype),
-            null_ratio=null_ratio,
+            dtype=dtype,
+            null_ratio=float(null_ratios[col]) if len(sample) else 0.0,
             unique_count=unique_count,
-            unique_ratio=unique_ratio,
-            sample_values=sample_vals,
-            is_parseable_datetime=is_dt,
+            unique_ratio=unique_count / total,
+            sample_values=non_null.head(50).tolist(),
+            is_parseable_datetime=_try_parse_datetime(non_null) >= MIN_SUCCESS_RATIO,
             avg_str_length=avg_len,
+            n_rows=len(sample),
         ))
     return profiles
 
 
+def profile_columns(
+    df: pd.DataFrame,
+    max_workers: Optional[int] = None,
+) -> dict[str, ColumnProfile]:
+    """
+    {컬럼명: ColumnProfile}. `ColumnMapper.map` / `validate`에 넘겨 재계산을 피합니다.
+
+    max_workers : 워커 프로세스 수 (None이면 PROFILE_WORKERS, 1이면 현재 프로세스에서 순차 처리)
+
+    표본을 뽑은 뒤 컬럼이 PARALLEL_PROFILE_COLUMNS개 이상이면 컬럼 묶음 단위로 워커에 나눕니다.
+    """
+    sample = _sample_rows(df)
+    workers = min(max_workers or PROFILE_WORKERS, sample.shape[1])
+    if workers <= 1 or sample.shape[1] < PARALLEL_PROFILE_COLUMNS:
+        return {p.name: p for p in _profile_columns(sample)}
+
+    chunks = [sample.iloc[:, idx] for idx in np.array_split(np.arange(sample.shape[1]), workers)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = list(executor.map(_profile_columns, chunks))
+    return {p.name: p for part in parts for p in part}
+
+
 def _keyword_score(col_name: str, role: str) -> float:
     """키워드 매칭 스코어 (0~80)."""
     normalized = col_name.lower().replace(" ", "").replace("_", "").replace(":", "")
@@ -156,13 +297,11 @@ def _type_score(profile: ColumnProfile, role: str) -> float:
     if role == "timestamp":
         if "datetime" in dtype:
             return 60.0
+        if "int" in dtype or "float" in dtype:
+            return 30.0 if profile.is_parseable_datetime else -20.0  # UNIX epoch 범위 값
         if profile.is_parseable_datetime:
             return 50.0
-        if ("int" in dtype or "float" in dtype) and profile.sample_values:
-            if any(1e9 < v < 2e9 for v in profile.sample_values
-                   if isinstance(v, (int, float))):
-                return 30.0  # UNIX timestamp 가능성
-        return -20.0 if ("int" in dtype or "float" in dtype) else 0.0
+        return 0.0
 
     elif role == "case_id":
         if "int" in dtype:
@@ -253,9 +392,20 @@ class ColumnMapper:
     OPTIONAL_FIELDS = ["resource"]
     ALL_FIELDS = REQUIRED_FIELDS + OPTIONAL_FIELDS
 
-    def map(self, df: pd.DataFrame) -> list[MappingResult]:
-        """컬럼 매핑을 수행하고 결과를 반환합니다."""
-        profiles = _profile_columns(df)
+    def map(
+        self,
+        df: pd.DataFrame,
+        profiles: Optional[dict[str, ColumnProfile]] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[MappingResult]:
+        """
+        컬럼 매핑을 수행하고 결과를 반환합니다.
+        profiles(`profile_columns` 결과)를 주면 프로파일링을 건너뜁니다.
+        max_workers는 프로파일링 워커 수입니다 (`profile_columns` 참고).
+        """
+        if profiles is None:
+            profiles = profile_columns(df, max_workers=max_workers)
+        profiles = list(profiles.values())
 
         score_matrix = {
             f: {p.name: _score_column(p, f) for p in profiles}
@@ -284,6 +434,28 @@ class ColumnMapper:
             ))
         return results
 
+    def stored_results(
+        self,
+        mapping: dict[str, Optional[str]],
+        columns: list[str],
+    ) -> list[MappingResult]:
+        """
+        저장소에서 찾은 확정 매핑을 MappingResult 목록으로 변환합니다 (프로파일링 · 스코어링 없음).
+        현재 컬럼에 없는 컬럼은 매핑하지 않습니다.
+        """
+        results = []
+        for f in self.ALL_FIELDS:
+            col = mapping.get(f)
+            col = col if col in columns else None
+            results.append(MappingResult(
+                field=f,
+                column=col,
+                score=100.0 if col else 0.0,
+                confidence_level="high" if col else "failed",
+                confidence_label=STORED_LABEL if col else _get_confidence(0.0)[1],
+            ))
+        return results
+
     def _resolve_conflicts(
         self, score_matrix: dict[str, dict[str, float]]
     ) -> dict[str, Optional[str]]:
@@ -314,10 +486,15 @@ class ColumnMapper:
         return assigned
 
     def validate(
-        self, df: pd.DataFrame, mapping: dict[str, Optional[str]]
+        self,
+        df: pd.DataFrame,
+        mapping: dict[str, Optional[str]],
+        profiles: Optional[dict[str, ColumnProfile]] = None,
     ) -> list[dict]:
         """
         매핑 결과를 검증합니다.
+        profiles(`map`에 사용한 `profile_columns` 결과)를 주면 컬럼을 다시 훑지 않습니다.
+        profiles에 없는 매핑 컬럼만 프로파일링해 profiles에 추가합니다 (저장된 매핑으로 시작한 경우).
 
         Returns
         -------
@@ -325,6 +502,12 @@ class ColumnMapper:
         """
         msgs = []
         total = max(len(df), 1)
+        if profiles is None:
+            profiles = {}
+        missing = [c for c in dict.fromkeys(mapping.values())
+                   if c and c in df.columns and c not in profiles]
+        if missing:
+            profiles.update(profile_columns(df[missing]))
 
         for f in self.REQUIRED_FIELDS:
             col = mapping.get(f)
@@ -333,8 +516,8 @@ class ColumnMapper:
                              "message": f"필수 필드 '{f}'가 매핑되지 않았습니다."})
                 continue
 
-            series = df[col]
-            null_ratio = series.isna().sum() / total
+            profile = profiles[col]
+            null_ratio = profile.null_ratio
 
             if f == "case_id" and null_ratio > 0:
                 msgs.append({"level": "error",
@@ -344,7 +527,7 @@ class ColumnMapper:
                 if null_ratio > 0:
                     msgs.append({"level": "error",
                                  "message": f"Activity 컬럼 '{col}'에 결측값이 있습니다."})
-                if series.nunique() < 2:
+                if profile.unique_count < 2:
                     msgs.append({"level": "warning",
                                  "message": "Activity 종류가 1개뿐입니다. 분석 결과가 제한적일 수 있습니다."})
 
@@ -352,14 +535,12 @@ class ColumnMapper:
                 if null_ratio > 0.05:
                     msgs.append({"level": "warning",
                                  "message": f"Timestamp 컬럼 '{col}'에 결측값이 {null_ratio*100:.1f}% 있습니다."})
-                try:
-                    pd.to_datetime(series.dropna().head(10), errors="raise")
-                except Exception:
+                if infer_format(pd.Series(profile.sample_values)).success_ratio < MIN_SUCCESS_RATIO:
                     msgs.append({"level": "error",
                                  "message": f"Timestamp 컬럼 '{col}'의 날짜 형식을 인식할 수 없습니다."})
 
         case_col = mapping.get("case_id")
-        if case_col and case_col in df.columns and df[case_col].nunique() < 2:
+        if case_col and case_col in df.columns and profiles[case_col].unique_count < 2:
             msgs.append({"level": "error",
                          "message": "케이스 수가 1개입니다. 최소 2개 이상 필요합니다."})
 
@@ -368,3 +549,77 @@ class ColumnMapper:
                          "message": f"이벤트 수가 {total}개로 매우 적습니다. 분석 결과가 제한적일 수 있습니다."})
 
         return msgs
+
+
+# ─── 매핑 저장소 ─────────────────────────────────────────────────────────────
+def schema_fingerprint(df: pd.DataFrame) -> str:
+    """
+    컬럼명과 dtype 순서쌍으로 스키마 지문(SHA-1)을 계산합니다.
+    문자열 컬럼은 저장 방식과 관계없이 같은 dtype으로 보므로 CSV와 Excel 양식이 같으면 지문도 같습니다.
+    """
+    schema = [[str(name), _dtype_label(df.iloc[:, i])] for i, name in enumerate(df.columns)]
+    payload = json.dumps(schema, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class MappingStore:
+    """
+    스키마 지문 → 확정 매핑 JSON 저장소.
+
+    Parameters
+    ----------
+    path        : 저장 파일 경로 (`~/.cache/processeng/mappings.json`)
+    max_entries : 보관할 최대 스키마 수. 넘으면 가장 오래전에 저장한 항목부터 삭제
+
+    파일은 수정 시각이 바뀐 경우에만 다시 읽으므로, 조회는 메모리 사전 조회 비용입니다.
+    저장할 때는 파일을 다시 읽어 병합한 뒤 임시 파일 교체로 기록합니다 (여러 프로세스 공유).
+    """
+
+    def __init__(self, path: Path = MAPPING_STORE_FILE, max_entries: int = MAPPING_STORE_SIZE):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._entries: dict = {}
+        self._mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        try:
+            mtime = self.path.stat().st_mtime
+        except FileNotFoundError:
+            self._entries, self._mtime = {}, None
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._entries = {}
+        self._mtime = mtime
+
+    def get(self, fingerprint: str) -> Optional[dict[str, Optional[str]]]:
+        """저장된 매핑 {field: column} (없으면 None)."""
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(fingerprint)
+        return dict(entry["mapping"]) if entry else None
+
+    def put(self, fingerprint: str, mapping: dict[str, Optional[str]]) -> None:
+        """매핑을 저장합니다. 이미 같은 매핑이 저장돼 있으면 파일을 쓰지 않습니다."""
+        mapping = {f: mapping.get(f) for f in ColumnMapper.ALL_FIELDS}
+        with self._lock:
+            self._refresh()
+            entry = self._entries.get(fingerprint)
+            if entry and entry["mapping"] == mapping:
+                return
+            self._entries[fingerprint] = {"mapping": mapping, "saved": time.time()}
+            if len(self._entries) > self.max_entries:
+                oldest = sorted(self._entries, key=lambda k: self._entries[k]["saved"])
+                for key in oldest[:len(self._entries) - self.max_entries]:
+                    del self._entries[key]
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            self._mtime = self.path.stat().st_mtime
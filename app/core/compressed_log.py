@@ -0,0 +1,252 @@
+"""
+바리언트 압축 로그 모듈
+이벤트 로그를 고유 바리언트(활동 시퀀스) + 케이스 수 + 바리언트별 시간 집계로 압축합니다.
+Discovery(Alpha / Heuristics / Inductive)와 DFG 계산은 케이스 수가 아니라
+바리언트 수에 비례하는 비용으로 이 표현 위에서 수행합니다.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from core.dfg import DfgStatistics, group_quantile, to_seconds
+from core.variants import build_variant_index, encode_activities
+
+
+# ─── 결과 데이터 클래스 ──────────────────────────────────────────────────────
+@dataclass
+class CompressedLog:
+    """
+    바리언트 압축 로그.
+
+    activities         : 코드 → 활동명
+    flat               : 바리언트별 활동 코드 시퀀스를 이어 붙인 배열
+    offsets            : 바리언트 v의 시퀀스는 flat[offsets[v]:offsets[v + 1]]
+    counts             : 바리언트별 케이스 수
+    step_sum / step_count / step_max
+                       : 바리언트 내 연속 이벤트 쌍(step)별 시간 차 합계 · 유효 건수 · 최댓값(초).
+                         바리언트 v의 k번째 step은 인덱스 offsets[v] - v + k
+    arc_quantiles      : {(src, tgt): (median, p90)} — 분위수는 바리언트 집계로 복원할 수 없어
+                         압축 시 이벤트 단위로 한 번 계산해 둡니다.
+    """
+    activities: list
+    flat: np.ndarray
+    offsets: np.ndarray
+    counts: np.ndarray
+    step_sum: np.ndarray
+    step_count: np.ndarray
+    step_max: np.ndarray
+    arc_quantiles: dict = field(default_factory=dict)
+
+    @property
+    def n_variants(self) -> int:
+        return len(self.counts)
+
+    @property
+    def n_cases(self) -> int:
+        return int(self.counts.sum())
+
+    def sequence(self, variant_id: int) -> tuple:
+        """바리언트의 활동명 시퀀스."""
+        codes = self.flat[self.offsets[variant_id]:self.offsets[variant_id + 1]]
+        return tuple(self.activities[c] for c in codes if c >= 0)
+
+    def to_uvcl(self) -> Counter:
+        """PM4Py 바리언트 압축 로그(UVCL: Counter[활동 시퀀스 tuple]) 형식으로 변환합니다."""
+        uvcl: Counter = Counter()
+        for v, count in enumerate(self.counts.tolist()):
+            uvcl[self.sequence(v)] += count
+        return uvcl
+
+    # ── 바리언트 단위 DFG ─────────────────────────────────────────────────────
+    def _variant_of(self) -> np.ndarray:
+        """flat의 각 위치가 속한 바리언트 ID."""
+        return np.repeat(np.arange(self.n_variants), np.diff(self.offsets))
+
+    def _window_pairs(self, window: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """같은 바리언트 안에서 window 칸 떨어진 (src 위치, tgt 위치, 케이스 수 가중치)."""
+        variant_of = self._variant_of()
+        src = np.arange(len(self.flat) - window)
+        tgt = src + window
+        same = variant_of[src] == variant_of[tgt]
+        src, tgt = src[same], tgt[same]
+        keep = (self.flat[src] >= 0) & (self.flat[tgt] >= 0)
+        src, tgt = src[keep], tgt[keep]
+        return src, tgt, self.counts[variant_of[src]]
+
+    def _count_codes(self, codes: np.ndarray, weights: np.ndarray) -> dict:
+        valid = codes >= 0
+        totals = np.bincount(codes[valid], weights=weights[valid], minlength=len(self.activities))
+        return {self.activities[i]: int(c) for i, c in enumerate(totals) if c > 0}
+
+    def window_dfg(self, window: int = 1) -> dict:
+        """window 칸 떨어진 활동 쌍의 빈도 ({(src, tgt): frequency}). window=1이면 DFG."""
+        src, tgt, weight = self._window_pairs(window)
+        k = max(len(self.activities), 1)
+        pair = self.flat[src].astype(np.int64) * k + self.flat[tgt]
+        codes, inverse = np.unique(pair, return_inverse=True)
+        freq = np.bincount(inverse, weights=weight)
+        return {
+            (self.activities[c // k], self.activities[c % k]): int(f)
+            for c, f in zip(codes.tolist(), freq.tolist())
+        }
+
+    def freq_triples(self) -> dict:
+        """연속된 활동 3개 (a, b, c)의 빈도. Heuristics Miner의 길이 2 루프 판정에 사용."""
+        src, tgt, weight = self._window_pairs(2)
+        triples: Counter = Counter()
+        for a, b, c, w in zip(
+            self.flat[src].tolist(), self.flat[src + 1].tolist(),
+            self.flat[tgt].tolist(), weight.tolist(),
+        ):
+            if b >= 0:
+                triples[(self.activities[a], self.activities[b], self.activities[c])] += w
+        return dict(triples)
+
+    def dfg_statistics(self) -> DfgStatistics:
+        """
+        빈도 DFG, Performance DFG(평균·중앙값·p90·최댓값), 활동 빈도, 시작/종료 활동을
+        바리언트 단위 집계로 계산합니다.
+        """
+        if self.n_variants == 0:
+            return DfgStatistics({}, {}, {}, {}, {})
+
+        variant_of = self._variant_of()
+        starts = self.offsets[:-1]
+        ends = self.offsets[1:] - 1
+        nonempty = ends >= starts
+        activities_count = self._count_codes(self.flat, self.counts[variant_of])
+        start_activities = self._count_codes(self.flat[starts[nonempty]], self.counts[nonempty])
+        end_activities = self._count_codes(self.flat[ends[nonempty]], self.counts[nonempty])
+
+        # step 인덱스 = flat 위치 - 바리언트 번호 (바리언트마다 step이 1개 적음)
+        src, tgt, weight = self._window_pairs(1)
+        step = src - variant_of[src]
+        k = max(len(self.activities), 1)
+        pair = self.flat[src].astype(np.int64) * k + self.flat[tgt]
+        codes, inverse = np.unique(pair, return_inverse=True)
+
+        freq = np.bincount(inverse, weights=weight, minlength=len(codes))
+        sums = np.bincount(inverse, weights=self.step_sum[step], minlength=len(codes))
+        n_valid = np.bincount(inverse, weights=self.step_count[step], minlength=len(codes))
+        maximum = np.full(len(codes), -np.inf)
+        np.maximum.at(maximum, inverse, self.step_max[step])
+
+        dfg: dict = {}
+        performance_dfg: dict = {}
+        performance_stats: dict = {}
+        for i, code in enumerate(codes.tolist()):
+            arc = (self.activities[code // k], self.activities[code % k])
+            dfg[arc] = int(freq[i])
+            if n_valid[i] > 0:
+                mean = float(sums[i] / n_valid[i])
+                median, p90 = self.arc_quantiles.get(arc, (np.nan, np.nan))
+                performance_dfg[arc] = mean
+                performance_stats[arc] = {
+                    "mean":   mean,
+                    "median": float(median),
+                    "p90":    float(p90),
+                    "max":    float(maximum[i]),
+                }
+
+        return DfgStatistics(
+            dfg=dfg,
+            performance_dfg=performance_dfg,
+            activities_count=activities_count,
+            start_activities=start_activities,
+            end_activities=end_activities,
+            performance_stats=performance_stats,
+        )
+
+
+# ─── 압축 ─────────────────────────────────────────────────────────────────────
+def compress_log(
+    case: pd.Series,
+    activity: pd.Series,
+    timestamp: pd.Series,
+) -> CompressedLog:
+    """
+    이벤트 로그를 바리언트 압축 로그로 변환합니다.
+
+    Parameters
+    ----------
+    case      : Case ID (같은 케이스의 이벤트가 연속, 케이스 내 시간순 정렬 상태)
+    activity  : 활동명
+    timestamp : datetime
+
+    이벤트 단위 연산은 이 함수에서 한 번만 수행합니다 (NumPy 벡터 연산).
+    음수 시간 차(데이터 오류)와 NaT는 시간 집계에서 제외합니다.
+    """
+    case_codes, _ = pd.factorize(case)
+    act_codes, labels = encode_activities(activity)
+    activities = labels.tolist()
+    index = build_variant_index(case_codes, act_codes, labels)
+
+    n = len(act_codes)
+    n_variants = index.n_variants
+    starts = index.starts
+    if n == 0:
+        empty = np.empty(0)
+        return CompressedLog(
+            activities, np.empty(0, dtype=np.int32), np.zeros(1, dtype=np.int64),
+            np.empty(0, dtype=np.int64), empty, empty, empty,
+        )
+
+    # ── 바리언트 시퀀스 (대표 케이스) ────────────────────────────────────────
+    lengths = np.diff(np.append(starts, n))
+    rep = index.representatives
+    rep_len = lengths[rep]
+    offsets = np.concatenate([[0], np.cumsum(rep_len)])
+    rep_start = np.repeat(starts[rep], rep_len)
+    flat = act_codes[rep_start + np.arange(offsets[-1]) - np.repeat(offsets[:-1], rep_len)]
+    counts = index.counts()
+
+    # ── step별 시간 집계 ────────────────────────────────────────────────────
+    seconds = to_seconds(timestamp)
+    case_of = np.repeat(np.arange(len(starts)), lengths)
+    same_case = case_codes[1:] == case_codes[:-1]
+    src_pos = np.flatnonzero(same_case)
+    case_of_pair = case_of[src_pos]
+    variant_of_pair = index.variant_id[case_of_pair]
+    step = offsets[variant_of_pair] - variant_of_pair + (src_pos - starts[case_of_pair])
+
+    duration = np.diff(seconds)[same_case]
+    valid = duration >= 0  # NaN 포함 제외
+    n_steps = int(offsets[-1] - n_variants)
+    step_sum = np.bincount(step[valid], weights=duration[valid], minlength=n_steps)
+    step_count = np.bincount(step[valid], minlength=n_steps).astype(np.float64)
+    step_max = np.full(n_steps, -np.inf)
+    np.maximum.at(step_max, step[valid], duration[valid])
+
+    # ── arc별 분위수 (이벤트 단위) ──────────────────────────────────────────
+    k = max(len(activities), 1)
+    src = act_codes[:-1][same_case][valid]
+    tgt = act_codes[1:][same_case][valid]
+    keep = (src >= 0) & (tgt >= 0)
+    pair = src[keep].astype(np.int64) * k + tgt[keep]
+    dur = duration[valid][keep]
+    arc_quantiles: dict = {}
+    if len(pair):
+        order = np.lexsort((dur, pair))
+        pair_sorted, dur_sorted = pair[order], dur[order]
+        bounds = np.flatnonzero(np.r_[True, pair_sorted[1:] != pair_sorted[:-1]])
+        size = np.diff(np.append(bounds, len(pair_sorted)))
+        median = group_quantile(dur_sorted, bounds, size, 0.5)
+        p90 = group_quantile(dur_sorted, bounds, size, 0.9)
+        for i, code in enumerate(pair_sorted[bounds].tolist()):
+            arc = (activities[code // k], activities[code % k])
+            arc_quantiles[arc] = (float(median[i]), float(p90[i]))
+
+    return CompressedLog(
+        activities=activities,
+        flat=flat,
+        offsets=offsets,
+        counts=counts,
+        step_sum=step_sum,
+        step_count=step_count,
+        step_max=step_max,
+        arc_quantiles=arc_quantiles,
+    )
@@ -0,0 +1,487 @@
+"""
+적합도 검사(Conformance Checking) 모듈
+발견된 Petri Net과 이벤트 로그를 비교하여 Fitness · Precision을 계산합니다.
+
+같은 바리언트의 케이스는 재생(replay) 결과가 동일하므로 고유 바리언트만 재생하고
+케이스 수로 가중 집계합니다. 재생 결과는 (모델 지문, 바리언트) 단위로 캐시하며,
+바리언트 묶음을 프로세스 풀에 분산하고 시간 제한을 넘긴 묶음은 중단합니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ALL_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.miner import as_dataframe
+from core.pool import shutdown_pool
+from core.variants import build_variant_index, encode_activities
+
+METHODS = ("token_replay", "alignments")
+CONFORMANCE_WORKERS = min(os.cpu_count() or 1, 8)
+CHUNK_SIZE = 32            # 워커 작업 1건당 재생할 바리언트(또는 접두사) 수
+CACHE_SIZE = 200_000       # 캐시에 보관할 (모델, 시퀀스) 재생 결과 수
+
+_MISSING = object()
+
+
+# ─── 결과 데이터 클래스 ──────────────────────────────────────────────────────
+@dataclass
+class ConformanceResult:
+    """
+    적합도 검사 결과.
+
+    fitness              : 로그 수준 Fitness (token_replay: 토큰 기반, alignments: 비용 기반)
+    average_fitness      : 케이스별 Fitness의 평균
+    percentage_fit_cases : 모델로 완전히 재생되는 케이스 비율(%)
+    precision            : ETConformance 토큰 기반 Precision (미계산 · 시간 초과 시 None)
+    case_fitness         : 케이스별 결과 — columns = case, variant_id, fitness, is_fit
+    variant_fitness      : 바리언트별 결과 — columns = variant_id, variant, cases, fitness, is_fit
+    n_evaluated          : 재생을 마친 바리언트 수 (캐시 적중 포함)
+    coverage             : 재생을 마친 바리언트에 속한 케이스 비율 (0~1)
+
+    시간 초과로 재생하지 못한 바리언트는 fitness · is_fit이 결측이며 집계에서 제외됩니다.
+    """
+    method: str
+    fitness: float
+    average_fitness: float
+    percentage_fit_cases: float
+    precision: Optional[float]
+    case_fitness: pd.DataFrame
+    variant_fitness: pd.DataFrame
+    n_variants: int
+    n_evaluated: int
+    coverage: float
+    cache_hits: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None    # 시간 초과 사유 (결과는 재생을 마친 바리언트 기준)
+    details: dict = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        """모든 바리언트를 재생했는지 여부."""
+        return self.n_evaluated == self.n_variants
+
+
+# ─── 모델 지문 · 캐시 ────────────────────────────────────────────────────────
+def model_fingerprint(net: Any, initial_marking: Any, final_marking: Any) -> str:
+    """Petri Net 구조(플레이스 · 전이 · 아크)와 초기/종료 마킹의 SHA-1 지문."""
+    payload = json.dumps(
+        [
+            sorted(p.name for p in net.places),
+            sorted((t.name, t.label is None, t.label or "") for t in net.transitions),
+            sorted((a.source.name, a.target.name, a.weight) for a in net.arcs),
+            sorted((p.name, n) for p, n in initial_marking.items()),
+            sorted((p.name, n) for p, n in final_marking.items()),
+        ],
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class ConformanceCache:
+    """
+    (모델 지문, 재생 방식, 활동 시퀀스) → 재생 결과 메모리 LRU 캐시.
+
+    재생 결과는 모델과 시퀀스만으로 결정되므로 로그가 달라도(필터 · 재업로드) 공유됩니다.
+    """
+
+    def __init__(self, max_entries: int = CACHE_SIZE):
+        self.max_entries = max_entries
+        self._memory: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        """캐시된 재생 결과를 반환합니다. 없으면 default."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        return default
+
+    def put(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+
+# ─── 적합도 검사 ─────────────────────────────────────────────────────────────
+def check_conformance(
+    event_log: Any,
+    net: Any,
+    initial_marking: Any,
+    final_marking: Any,
+    method: str = "token_replay",
+    precision: bool = True,
+    cache: Optional[ConformanceCache] = None,
+    max_workers: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> ConformanceResult:
+    """
+    이벤트 로그와 Petri Net의 적합도를 바리언트 단위로 계산합니다.
+
+    Parameters
+    ----------
+    event_log       : PM4Py 형식 DataFrame / EventLog / pyarrow.Table
+    net, initial_marking, final_marking : MinerResult의 Petri Net과 마킹
+    method          : "token_replay" (빠름) | "alignments" (정확, 느림)
+    precision       : ETConformance Precision 계산 여부
+    cache           : 바리언트 재생 결과 캐시 (None이면 캐시 사용 안 함)
+    max_workers     : 워커 프로세스 수 (기본: CPU 수, 최대 8 — 1이면 현재 프로세스에서 순차 실행)
+    time_budget     : 제한 시간(초). 초과 시 끝나지 않은 묶음을 중단하고
+                      재생을 마친 바리언트만으로 집계합니다 (error 설정).
+
+    Fitness 집계는 PM4Py `fitness_token_based_replay` / `fitness_alignments`와,
+    Precision은 `precision_token_based_replay`와 같은 식을 케이스 수 가중으로 계산합니다.
+    바리언트는 케이스 수 내림차순으로 재생하므로 시간 초과 시에도 주요 흐름이 먼저 평가됩니다.
+    """
+    if method not in METHODS:
+        raise ValueError(f"지원하지 않는 적합도 검사 방식: {method}")
+    if method == "alignments":
+        from pm4py.objects.petri_net.utils import check_soundness
+
+        # PM4Py 정렬(A*)은 easy sound 모델만 지원 — 워커에 분산하기 전에 확인
+        if not check_soundness.check_easy_soundness_net_in_fin_marking(
+            net, initial_marking, final_marking
+        ):
+            raise ValueError(
+                "Alignments는 종료 마킹에 도달 가능한(easy sound) 모델에서만 계산할 수 있습니다. "
+                "Token Replay를 사용하세요."
+            )
+
+    start = time.monotonic()
+    frame = as_dataframe(event_log)
+    case_codes, case_labels = pd.factorize(frame["case:concept:name"])
+    act_codes, activities = encode_activities(frame["concept:name"])
+    index = build_variant_index(case_codes, act_codes, activities)
+    counts = index.counts()
+    sequences = [tuple(index.sequence(v)) for v in range(index.n_variants)]
+    order = np.argsort(-counts, kind="stable")
+
+    model_key = model_fingerprint(net, initial_marking, final_marking)
+
+    # ── 재생 대상 수집 (캐시 적중분 제외) ────────────────────────────────────
+    replayed: dict[tuple, Any] = {}
+    cache_hits = 0
+
+    def pending(kind: str, seqs: list[tuple]) -> list[tuple]:
+        nonlocal cache_hits
+        missing = []
+        for seq in seqs:
+            value = cache.get((model_key, kind, seq), _MISSING) if cache is not None else _MISSING
+            if value is _MISSING:
+                missing.append(seq)
+            else:
+                replayed[(kind, seq)] = value
+                cache_hits += 1
+        return missing
+
+    tasks = _chunk(method, pending(method, [sequences[v] for v in order]))
+    if precision:
+        next_activities, prefix_weight = _log_prefixes(sequences, counts)
+        prefixes = sorted(prefix_weight, key=prefix_weight.get, reverse=True)
+        tasks += _chunk("prefix", pending("prefix", prefixes))
+
+    outputs, timed_out = _run_tasks(
+        (net, initial_marking, final_marking),
+        tasks,
+        max_workers or CONFORMANCE_WORKERS,
+        None if time_budget is None else time_budget - (time.monotonic() - start),
+    )
+    for (kind, seqs), values in zip(tasks, outputs):
+        if values is None:
+            continue
+        for seq, value in zip(seqs, values):
+            replayed[(kind, seq)] = value
+            # 재생 불가 접두사(None)는 결과이므로 저장하고, 정렬 실패(None)는 다음에 재시도
+            if cache is not None and (value is not None or kind == "prefix"):
+                cache.put((model_key, kind, seq), value)
+
+    # ── 집계 ─────────────────────────────────────────────────────────────────
+    per_variant = [replayed.get((method, seq)) for seq in sequences]
+    summary = _summarize(method, per_variant, counts)
+
+    precision_value = None
+    if precision and all(("prefix", p) in replayed for p in prefix_weight):
+        precision_value = _etc_precision(
+            net, initial_marking, sequences, counts,
+            next_activities, prefix_weight,
+            {p: replayed[("prefix", p)] for p in prefix_weight},
+        )
+
+    fitness = np.array([np.nan if r is None else r["fitness"] for r in per_variant])
+    is_fit = pd.array(
+        np.array([np.nan if r is None else float(r["is_fit"]) for r in per_variant]),
+        dtype="boolean",
+    )
+    evaluated = ~np.isnan(fitness)
+
+    variant_fitness = pd.DataFrame({
+        "variant_id": np.arange(index.n_variants),
+        "variant":    [" → ".join(seq) for seq in sequences],
+        "cases":      counts,
+        "fitness":    fitness,
+        "is_fit":     is_fit,
+    }).iloc[order].reset_index(drop=True)
+
+    vid = index.variant_id
+    case_fitness = pd.DataFrame({
+        "case":       case_labels,
+        "variant_id": vid,
+        "fitness":    fitness[vid] if len(vid) else np.empty(0),
+        "is_fit":     is_fit.take(vid) if len(vid) else pd.array([], dtype="boolean"),
+    })
+
+    n_cases = int(counts.sum())
+    error = None
+    if timed_out:
+        error = f"시간 초과 ({time_budget:g}초) — 바리언트 {int(evaluated.sum()):,}/{index.n_variants:,}개만 평가"
+
+    return ConformanceResult(
+        method=method,
+        fitness=summary["fitness"],
+        average_fitness=summary["average_fitness"],
+        percentage_fit_cases=summary["percentage_fit_cases"],
+        precision=precision_value,
+        case_fitness=case_fitness,
+        variant_fitness=variant_fitness,
+        n_variants=index.n_variants,
+        n_evaluated=int(evaluated.sum()),
+        coverage=float(counts[evaluated].sum() / n_cases) if n_cases else 0.0,
+        cache_hits=cache_hits,
+        elapsed=time.monotonic() - start,
+        error=error,
+        details=summary["details"],
+    )
+
+
+# ─── 집계 헬퍼 ───────────────────────────────────────────────────────────────
+def _summarize(method: str, per_variant: list, counts: np.ndarray) -> dict:
+    """재생을 마친 바리언트의 결과를 케이스 수 가중으로 로그 수준 지표로 집계합니다."""
+    done = [(r, int(c)) for r, c in zip(per_variant, counts.tolist()) if r is not None]
+    total = sum(c for _, c in done)
+    if total == 0:
+        return {"fitness": math.nan, "average_fitness": math.nan,
+                "percentage_fit_cases": math.nan, "details": {}}
+
+    def weighted(name: str) -> float:
+        return float(sum(r[name] * c for r, c in done))
+
+    if method == "token_replay":
+        details = {k: weighted(k) for k in ("missing", "consumed", "remaining", "produced")}
+        if details["consumed"] > 0 and details["produced"] > 0:
+            fitness = 0.5 * (1 - details["missing"] / details["consumed"]) + 0.5 * (
+                1 - details["remaining"] / details["produced"]
+            )
+        else:
+            fitness = 0.0
+    else:
+        details = {k: weighted(k) for k in ("cost", "bwc")}
+        fitness = 1.0 - details["cost"] / details["bwc"] if details["bwc"] > 0 else 0.0
+
+    return {
+        "fitness": fitness,
+        "average_fitness": weighted("fitness") / total,
+        "percentage_fit_cases": 100.0 * weighted("is_fit") / total,
+        "details": details,
+    }
+
+
+def _log_prefixes(sequences: list[tuple], counts: np.ndarray) -> tuple[dict, Counter]:
+    """
+    바리언트별 접두사의 다음 활동 집합과 케이스 수 가중 등장 횟수.
+    PM4Py `precision_utils.get_log_prefixes`를 바리언트 단위로 계산한 것과 같습니다.
+    """
+    next_activities: dict[tuple, set] = {}
+    weight: Counter = Counter()
+    for seq, count in zip(sequences, counts.tolist()):
+        for i in range(1, len(seq)):
+            prefix = seq[:i]
+            next_activities.setdefault(prefix, set()).add(seq[i])
+            weight[prefix] += count
+    return next_activities, weight
+
+
+def _etc_precision(
+    net: Any,
+    initial_marking: Any,
+    sequences: list[tuple],
+    counts: np.ndarray,
+    next_activities: dict,
+    prefix_weight: Counter,
+    enabled: dict,
+) -> float:
+    """
+    ETConformance Precision = 1 - Σ(탈출 엣지) / Σ(활성 전이).
+    초기 마킹(빈 접두사) 항은 PM4Py와 같이 케이스 수 × 초기 마킹 활성 전이로 더합니다.
+    """
+    from pm4py.objects.petri_net.utils.align_utils import (
+        get_visible_transitions_eventually_enabled_by_marking,
+    )
+
+    n_traces = int(counts.sum())
+    start_activities = {seq[0] for seq in sequences if seq}
+    initial = {
+        t.label
+        for t in get_visible_transitions_eventually_enabled_by_marking(net, initial_marking)
+    }
+    sum_at = n_traces * len(initial)
+    sum_ee = n_traces * len(initial - start_activities)
+    for prefix, labels in enabled.items():
+        if labels is None:  # 재생 불가 접두사는 제외
+            continue
+        sum_at += len(labels) * prefix_weight[prefix]
+        sum_ee += len(labels - next_activities[prefix]) * prefix_weight[prefix]
+    return 1.0 - sum_ee / sum_at if sum_at > 0 else 1.0
+
+
+# ─── 재생 실행 ───────────────────────────────────────────────────────────────
+def _chunk(kind: str, seqs: list[tuple]) -> list[tuple[str, list[tuple]]]:
+    return [(kind, seqs[i:i + CHUNK_SIZE]) for i in range(0, len(seqs), CHUNK_SIZE)]
+
+
+def _run_tasks(
+    model: tuple,
+    tasks: list[tuple[str, list[tuple]]],
+    max_workers: int,
+    time_budget: Optional[float],
+) -> tuple[list[Optional[list]], bool]:
+    """
+    재생 작업을 실행하고 (작업별 결과 — 미완료는 None, 시간 초과 여부)를 반환합니다.
+
+    워커가 1개면 현재 프로세스에서 순차 실행하며 시간 제한은 작업 사이에서만 확인합니다.
+    워커가 여러 개면 모델은 워커 초기화 시 한 번만 전달하고, 제한 시간이 지나면
+    남은 작업을 취소하고 실행 중인 워커를 강제 종료합니다.
+    """
+    outputs: list[Optional[list]] = [None] * len(tasks)
+    if not tasks:
+        return outputs, False
+    deadline = math.inf if time_budget is None else time.monotonic() + time_budget
+
+    if max_workers <= 1:
+        for i, (kind, seqs) in enumerate(tasks):
+            if time.monotonic() >= deadline:
+                return outputs, True
+            outputs[i] = _replay(*model, kind, seqs)
+        return outputs, False
+
+    executor = ProcessPoolExecutor(
+        max_workers=min(max_workers, len(tasks)),
+        initializer=_init_worker,
+        initargs=model,
+    )
+    timed_out = False
+    try:
+        futures = {
+            executor.submit(_replay_worker, kind, seqs): i
+            for i, (kind, seqs) in enumerate(tasks)
+        }
+        done, not_done = wait(
+            futures,
+            timeout=None if deadline == math.inf else max(deadline - time.monotonic(), 0),
+            return_when=ALL_COMPLETED,
+        )
+        timed_out = bool(not_done)
+        for future in done:
+            outputs[futures[future]] = future.result()
+    finally:
+        shutdown_pool(executor, terminate=timed_out)
+    return outputs, timed_out
+
+
+def _replay(net: Any, im: Any, fm: Any, kind: str, seqs: list[tuple]) -> list:
+    """
+    활동 시퀀스 묶음을 재생합니다.
+
+    token_replay : {fitness, is_fit, missing, consumed, remaining, produced}
+    alignments   : {fitness, is_fit, cost, bwc} (정렬 실패 시 None)
+    prefix       : 재생 후 활성화된 가시 전이 레이블 frozenset (재생 불가 시 None)
+    """
+    from pm4py.objects.log.obj import Event, EventLog, Trace
+
+    log = EventLog([Trace([Event({"concept:name": a}) for a in seq]) for seq in seqs])
+
+    if kind == "alignments":
+        from pm4py.algo.conformance.alignments.petri_net import algorithm as alignments
+
+        aligned = alignments.apply_log(
+            log, net, im, fm,
+            parameters={alignments.Parameters.SHOW_PROGRESS_BAR: False},
+        )
+        return [
+            None if a is None else {
+                "fitness":  float(a["fitness"]),
+                "is_fit":   a["fitness"] == 1.0,
+                "cost":     float(a["cost"]),
+                "bwc":      float(a["bwc"]),
+            }
+            for a in aligned
+        ]
+
+    from pm4py.algo.conformance.tokenreplay.variants import token_replay
+
+    keys = token_replay.Parameters
+    if kind == "prefix":
+        # ETConformance와 같은 재생 옵션 (불일치 즉시 중단, 종료 마킹 무시)
+        parameters = {
+            keys.SHOW_PROGRESS_BAR:                         False,
+            keys.CONSIDER_REMAINING_IN_FITNESS:             False,
+            keys.TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN: False,
+            keys.STOP_IMMEDIATELY_UNFIT:                    True,
+            keys.WALK_THROUGH_HIDDEN_TRANS:                 True,
+        }
+        replayed = token_replay.apply(log, net, im, fm, parameters=parameters)
+        return [
+            frozenset(
+                t.label for t in r["enabled_transitions_in_marking"] if t.label is not None
+            ) if r["trace_is_fit"] else None
+            for r in replayed
+        ]
+
+    replayed = token_replay.apply(
+        log, net, im, fm, parameters={keys.SHOW_PROGRESS_BAR: False}
+    )
+    return [
+        {
+            "fitness":   float(r["trace_fitness"]),
+            "is_fit":    bool(r["trace_is_fit"]),
+            "missing":   r["missing_tokens"],
+            "consumed":  r["consumed_tokens"],
+            "remaining": r["remaining_tokens"],
+            "produced":  r["produced_tokens"],
+        }
+        for r in replayed
+    ]
+
+
+# ─── 프로세스 풀 헬퍼 ─────────────────────────────────────────────────────────
+_WORKER_MODEL: Optional[tuple] = None
+
+
+def _init_worker(net: Any, im: Any, fm: Any) -> None:
+    """워커 시작 시 모델을 한 번만 받아 둡니다 (작업마다 Petri Net을 직렬화하지 않도록)."""
+    global _WORKER_MODEL
+    _WORKER_MODEL = (net, im, fm)
+
+
+def _replay_worker(kind: str, seqs: list[tuple]) -> list:
+    return _replay(*_WORKER_MODEL, kind, seqs)
@@ -0,0 +1,375 @@
+"""
+데이터베이스 연결 모듈
+DB-API 2.0 드라이버로 이벤트 테이블을 직접 읽습니다.
+
+- 컬럼 projection · 시간 범위 · 행 수 제한은 SQL로 내려 보내 DB에서 걸러냅니다.
+- 결과는 서버 측 커서(PostgreSQL named cursor, MySQL SSCursor)에서 `fetchmany`로
+  배치 단위로 가져오므로 테이블 전체를 클라이언트 메모리에 올리지 않습니다.
+- 워터마크(마지막으로 가져온 타임스탬프) 이후 이벤트만 가져오는 증분 적재를 지원합니다.
+
+SQLite(`sqlite:///경로`)는 표준 라이브러리만으로 동작하므로 로컬 파일로 바로 시험할 수 있습니다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import unquote, urlparse
+
+import pandas as pd
+
+from core.cache import DEFAULT_CACHE_DIR
+
+FETCH_BATCH_ROWS = 50_000
+WATERMARK_FILE = DEFAULT_CACHE_DIR / "watermarks.json"
+
+# dialect → (식별자 인용 문자, DB-API paramstyle)
+_DIALECTS = {
+    "sqlite":     ('"', "qmark"),
+    "postgresql": ('"', "pyformat"),
+    "mysql":      ("`", "pyformat"),
+    "generic":    ('"', "qmark"),
+}
+_URL_SCHEMES = {
+    "sqlite": "sqlite",
+    "postgres": "postgresql",
+    "postgresql": "postgresql",
+    "mysql": "mysql",
+}
+
+
+# ─── 결과 데이터 클래스 ──────────────────────────────────────────────────────
+@dataclass
+class IncrementalPull:
+    """
+    증분 적재 결과.
+
+    frame     : 워터마크 이후 이벤트
+    watermark : 다음 적재에 넘길 워터마크 (가져온 행이 없으면 이전 값 그대로)
+    """
+    frame: pd.DataFrame
+    watermark: Any
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.frame)
+
+
+# ─── 연결 ─────────────────────────────────────────────────────────────────────
+class DatabaseConnector:
+    """
+    이벤트 테이블을 배치 단위로 읽는 DB 커넥터.
+
+    Parameters
+    ----------
+    connection_string  : "sqlite:///경로" | "postgresql://user:pw@host:port/db" | "mysql://..."
+    connection_factory : 그 밖의 DB-API 드라이버용 연결 생성 함수 (connection_string 대신 사용)
+    paramstyle         : connection_factory 사용 시 드라이버의 paramstyle ("qmark" | "format" | "pyformat")
+
+    연결은 작업마다 새로 열고 닫습니다 (Streamlit 재실행 스레드 간 연결 공유 방지).
+    """
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        connection_factory: Optional[Callable[[], Any]] = None,
+        paramstyle: str = "qmark",
+    ):
+        if connection_factory is not None:
+            self.dialect = "generic"
+            self._factory = connection_factory
+            self._paramstyle = paramstyle
+        elif connection_string:
+            scheme = urlparse(connection_string).scheme.split("+", 1)[0].lower()
+            if scheme not in _URL_SCHEMES:
+                raise ValueError(f"지원하지 않는 연결 문자열입니다: {scheme or connection_string}")
+            self.dialect = _URL_SCHEMES[scheme]
+            self._factory = lambda: _open_connection(self.dialect, connection_string)
+            self._paramstyle = _DIALECTS[self.dialect][1]
+        else:
+            raise ValueError("connection_string 또는 connection_factory가 필요합니다.")
+        self._quote_char = _DIALECTS[self.dialect][0]
+
+    def connect(self):
+        """새 DB-API 연결을 엽니다."""
+        return self._factory()
+
+    # ── 스키마 ────────────────────────────────────────────────────────────────
+    def columns(self, table: str) -> list[str]:
+        """테이블 컬럼명 목록 (행은 읽지 않음)."""
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT * FROM {self._quote_table(table)} WHERE 1 = 0")
+            names = [d[0] for d in cursor.description]
+            cursor.close()
+            return names
+        finally:
+            conn.close()
+
+    def tables(self) -> list[str]:
+        """
+        테이블 목록 (SQLite · PostgreSQL · MySQL).
+        DB-API 연결 함수(connection_factory)로 만든 generic 연결은 목록 조회 방법을 알 수 없어 ValueError.
+        """
+        queries = {
+            "sqlite": "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') ORDER BY name",
+            "postgresql": (
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = current_schema() ORDER BY table_name"
+            ),
+            "mysql": "SHOW TABLES",
+        }
+        if self.dialect not in queries:
+            raise ValueError(
+                f"{self.dialect} 연결은 테이블 목록을 지원하지 않습니다. 테이블 이름을 직접 지정하세요."
+            )
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(queries[self.dialect])
+            names = [row[0] for row in cursor.fetchall()]
+            cursor.close()
+            return names
+        finally:
+            conn.close()
+
+    # ── 읽기 ──────────────────────────────────────────────────────────────────
+    def iter_batches(
+        self,
+        table: str,
+        columns: Optional[list[str]] = None,
+        timestamp_col: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        after: Any = None,
+        limit: Optional[int] = None,
+        batch_size: int = FETCH_BATCH_ROWS,
+        output: str = "dataframe",
+    ) -> Iterator[Any]:
+        """
+        테이블을 배치 단위로 읽습니다.
+
+        Parameters
+        ----------
+        table         : 테이블명 (스키마.테이블 가능)
+        columns       : 읽을 컬럼 목록 (None이면 전체) — SELECT 절로 projection
+        timestamp_col : 시간 조건에 사용할 컬럼
+        start, end    : timestamp_col >= start AND timestamp_col < end (None이면 조건 없음)
+        after         : timestamp_col > after (증분 적재 워터마크)
+        limit         : 최대 행 수 (미리보기용, LIMIT 절)
+        batch_size    : fetchmany 배치 크기
+        output        : "dataframe" | "arrow"
+
+        컬럼명은 테이블의 실제 컬럼과 대조한 뒤 인용하고, 조건 값은 바인드 파라미터로 넘깁니다.
+        """
+        if output not in ("dataframe", "arrow"):
+            raise ValueError(f"지원하지 않는 출력 형식: {output}")
+        sql, params = self._select(table, columns, timestamp_col, start, end, after, limit)
+
+        conn = self.connect()
+        try:
+            cursor = self._server_cursor(conn, batch_size)
+            cursor.execute(sql, params)
+            names = [d[0] for d in cursor.description]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield _to_batch(rows, names, output)
+            cursor.close()
+        finally:
+            conn.close()
+
+    def load(
+        self,
+        table: str,
+        columns: Optional[list[str]] = None,
+        timestamp_col: Optional[str] = None,
+        start: Any = None,
+        end: Any = None,
+        limit: Optional[int] = None,
+        batch_size: int = FETCH_BATCH_ROWS,
+    ) -> pd.DataFrame:
+        """`iter_batches` 결과를 하나의 DataFrame으로 합칩니다."""
+        batches = list(self.iter_batches(
+            table, columns, timestamp_col, start, end,
+            limit=limit, batch_size=batch_size,
+        ))
+        if not batches:
+            return pd.DataFrame(columns=columns or self.columns(table))
+        if len(batches) == 1:
+            return batches[0]
+        return pd.concat(batches, ignore_index=True)
+
+    def pull_incremental(
+        self,
+        table: str,
+        timestamp_col: str,
+        watermark: Any = None,
+        columns: Optional[list[str]] = None,
+        batch_size: int = FETCH_BATCH_ROWS,
+    ) -> IncrementalPull:
+        """
+        워터마크 이후(timestamp_col > watermark) 이벤트만 가져옵니다.
+        watermark가 None이면 전체를 가져오며, 반환된 watermark를 다음 호출에 넘기면 됩니다.
+
+        워터마크와 같은 시각에 나중에 적재된 이벤트는 가져오지 않으므로,
+        원본 테이블은 시각 순서대로 적재된다고 가정합니다.
+        """
+        if columns is not None and timestamp_col not in columns:
+            columns = list(columns) + [timestamp_col]
+        frames: list[pd.DataFrame] = []
+        maxima: list = []
+        for batch in self.iter_batches(
+            table, columns, timestamp_col, after=watermark, batch_size=batch_size
+        ):
+            # SQL 조건으로 가져온 행은 모두 기존 워터마크 이후이므로 배치 최댓값만 비교
+            batch_max = batch[timestamp_col].dropna().max()
+            if not pd.isna(batch_max):
+                maxima.append(batch_max)
+            frames.append(batch)
+        latest = max(maxima) if maxima else watermark
+
+        if not frames:
+            frame = pd.DataFrame(columns=columns or self.columns(table))
+        else:
+            frame = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        return IncrementalPull(frame=frame, watermark=latest)
+
+    # ── SQL 생성 ──────────────────────────────────────────────────────────────
+    def _quote(self, name: str) -> str:
+        q = self._quote_char
+        return f"{q}{name.replace(q, q * 2)}{q}"
+
+    def _quote_table(self, table: str) -> str:
+        return ".".join(self._quote(part) for part in table.split("."))
+
+    def _placeholder(self) -> str:
+        return "?" if self._paramstyle == "qmark" else "%s"
+
+    def _select(
+        self,
+        table: str,
+        columns: Optional[list[str]],
+        timestamp_col: Optional[str],
+        start: Any,
+        end: Any,
+        after: Any,
+        limit: Optional[int],
+    ) -> tuple[str, list]:
+        """SELECT 문과 바인드 파라미터를 만듭니다."""
+        available = self.columns(table)
+        requested = list(columns or []) + ([timestamp_col] if timestamp_col else [])
+        missing = [c for c in requested if c not in available]
+        if missing:
+            raise ValueError(f"테이블 {table}에 없는 컬럼입니다: {missing}")
+
+        select = ", ".join(self._quote(c) for c in columns) if columns else "*"
+        sql = f"SELECT {select} FROM {self._quote_table(table)}"
+
+        conditions: list[str] = []
+        params: list = []
+        if timestamp_col:
+            ts = self._quote(timestamp_col)
+            for op, value in ((">=", start), ("<", end), (">", after)):
+                if value is not None:
+                    conditions.append(f"{ts} {op} {self._placeholder()}")
+                    params.append(_bind_value(value, self.dialect))
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return sql, params
+
+    def _server_cursor(self, conn, batch_size: int):
+        """
+        결과를 서버에 두고 조금씩 가져오는 커서를 엽니다.
+        PostgreSQL은 named cursor, MySQL은 SSCursor를 사용하며, SQLite 커서는 원래 지연 평가입니다.
+        """
+        if self.dialect == "postgresql":
+            cursor = conn.cursor(name=f"processeng_{uuid.uuid4().hex[:12]}")
+            cursor.itersize = batch_size
+            return cursor
+        if self.dialect == "mysql":
+            import pymysql.cursors
+
+            return conn.cursor(pymysql.cursors.SSCursor)
+        return conn.cursor()
+
+
+def _open_connection(dialect: str, connection_string: str):
+    """연결 문자열로 드라이버별 연결을 엽니다 (PostgreSQL · MySQL 드라이버는 필요할 때만 import)."""
+    url = urlparse(connection_string)
+    if dialect == "sqlite":
+        # sqlite:///relative.db, sqlite:////absolute.db, sqlite:///:memory:
+        import sqlite3
+
+        path = connection_string.split(":///", 1)[1] if ":///" in connection_string else ""
+        return sqlite3.connect(path or ":memory:")
+    if dialect == "postgresql":
+        import psycopg2
+
+        return psycopg2.connect(connection_string.replace("postgresql+psycopg2://", "postgresql://"))
+    if dialect == "mysql":
+        import pymysql
+
+        return pymysql.connect(
+            host=url.hostname or "localhost",
+            port=url.port or 3306,
+            user=unquote(url.username or ""),
+            password=unquote(url.password or ""),
+            database=url.path.lstrip("/") or None,
+        )
+    raise ValueError(f"지원하지 않는 DB 종류입니다: {dialect}")
+
+
+def _bind_value(value: Any, dialect: str) -> Any:
+    """조건 값을 드라이버가 받을 수 있는 형태로 바꿉니다 (SQLite는 ISO 문자열로 비교)."""
+    if isinstance(value, pd.Timestamp):
+        value = value.to_pydatetime()
+    if dialect == "sqlite" and isinstance(value, (datetime, date)):
+        return value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()
+    return value
+
+
+def _to_batch(rows: list, names: list[str], output: str) -> Any:
+    """fetchmany 결과(튜플 목록)를 DataFrame 또는 pyarrow.Table로 변환합니다."""
+    if output == "arrow":
+        import pyarrow as pa
+
+        columns = list(zip(*rows))
+        return pa.table({name: pa.array(col) for name, col in zip(names, columns)})
+    return pd.DataFrame.from_records(rows, columns=names)
+
+
+# ─── 워터마크 저장소 ──────────────────────────────────────────────────────────
+def load_watermark(key: str, path: Path = WATERMARK_FILE) -> Any:
+    """저장된 워터마크를 읽습니다 (없으면 None). key는 예: "연결:테이블:컬럼"."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get(key)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def save_watermark(key: str, value: Any, path: Path = WATERMARK_FILE) -> None:
+    """워터마크를 저장합니다. 날짜 값은 ISO 문자열로 저장합니다."""
+    if isinstance(value, (datetime, date, pd.Timestamp)):
+        value = value.isoformat()
+    path = Path(path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            store = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        store = {}
+    store[key] = value
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(store, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
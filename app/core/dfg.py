@@ -0,0 +1,48 @@
+"""
+DFG 통계 모듈
+DFG 결과 데이터 클래스와 시간 차 집계에 쓰는 공용 수치 헬퍼를 제공합니다.
+DFG 자체는 바리언트 압축 로그 위에서 계산합니다 (core.compressed_log.CompressedLog.dfg_statistics).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+_UNIT_PER_SECOND = {"s": 1.0, "ms": 1e3, "us": 1e6, "ns": 1e9}
+
+
+# ─── 결과 데이터 클래스 ──────────────────────────────────────────────────────
+@dataclass
+class DfgStatistics:
+    dfg: dict                            # {(src, tgt): frequency}
+    performance_dfg: dict                # {(src, tgt): mean_duration_seconds}
+    activities_count: dict               # {activity: frequency}
+    start_activities: dict               # {activity: frequency}
+    end_activities: dict                 # {activity: frequency}
+    performance_stats: dict = field(default_factory=dict)
+    # {(src, tgt): {"mean", "median", "p90", "max"}} (초 단위)
+
+
+def to_seconds(timestamp: pd.Series) -> np.ndarray:
+    """datetime Series를 epoch 초(float) 배열로 변환합니다. NaT는 NaN."""
+    ts = pd.Series(timestamp)
+    seconds = ts.array.asi8 / _UNIT_PER_SECOND[ts.dt.unit]
+    seconds[ts.isna().to_numpy()] = np.nan
+    return seconds
+
+
+def group_quantile(
+    values: np.ndarray, starts: np.ndarray, n_valid: np.ndarray, q: float
+) -> np.ndarray:
+    """
+    그룹별로 정렬된 값 배열에서 분위수를 계산합니다 (numpy 기본 linear 보간).
+    n_valid 가 0인 그룹은 NaN.
+    """
+    pos = starts + (np.maximum(n_valid, 1) - 1) * q
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.ceil(pos).astype(np.int64)
+    result = values[lo] + (values[hi] - values[lo]) * (pos - lo)
+    result[n_valid == 0] = np.nan
+    return result
@@ -0,0 +1,266 @@
+"""
+Petri Net 성능 강화(Enhancement) 모듈
+이벤트 로그를 Petri Net 위에서 재생하여 전이별 발화 빈도와 플레이스별 대기(체류) 시간을 계산합니다.
+
+재생은 고유 바리언트마다 한 번만 수행하고(PM4Py 토큰 재생 + 주석), 케이스별 시간 차는
+바리언트 주석을 전체 케이스로 펼친 뒤 NumPy 벡터 연산으로 집계합니다.
+"""
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from core.dfg import group_quantile, to_seconds
+from core.miner import as_dataframe
+from core.variants import build_variant_index, encode_activities
+
+ENHANCE_WORKERS = min(os.cpu_count() or 1, 8)
+PARALLEL_VARIANTS = 1_000  # 이 수 이상의 바리언트부터 워커 프로세스로 나눠 재생
+CHUNK_SIZE = 256           # 워커 작업 1건당 재생할 바리언트 수
+
+
+# ─── 결과 데이터 클래스 ──────────────────────────────────────────────────────
+@dataclass
+class EnhancedNet:
+    """
+    Petri Net 요소별 성능 통계. 요소는 이름(`name`)으로 식별하므로 MinerResult와 함께 직렬화됩니다.
+
+    transition_frequency : {전이 이름: 발화 횟수} (숨은 전이 포함)
+    place_frequency      : {플레이스 이름: 들어온 토큰 수}
+    arc_frequency        : {(출발 이름, 도착 이름): 토큰 이동 횟수}
+    place_sojourn        : {플레이스 이름: {"mean", "median", "p90", "max"}} — 토큰 체류 시간(초)
+    arc_sojourn          : {(플레이스 이름, 전이 이름): 평균 체류 시간(초)} — 플레이스 → 전이 아크
+
+    체류 시간은 토큰을 만든 이벤트부터 소비한 이벤트까지의 시간 차이며(PM4Py 성능 주석과 동일),
+    음수(데이터 오류)와 NaT는 제외합니다.
+    """
+    transition_frequency: dict = field(default_factory=dict)
+    place_frequency: dict = field(default_factory=dict)
+    arc_frequency: dict = field(default_factory=dict)
+    place_sojourn: dict = field(default_factory=dict)
+    arc_sojourn: dict = field(default_factory=dict)
+    n_variants: int = 0
+    n_cases: int = 0
+    elapsed: float = 0.0
+
+
+# ─── 성능 강화 ───────────────────────────────────────────────────────────────
+def enhance_with_performance(
+    net: Any, im: Any, fm: Any, event_log: Any, max_workers: Optional[int] = None
+) -> EnhancedNet:
+    """
+    이벤트 로그를 Petri Net 위에서 재생하여 성능 통계를 계산합니다.
+
+    Parameters
+    ----------
+    net, im, fm : MinerResult의 Petri Net과 초기/종료 마킹
+    event_log   : PM4Py 형식 DataFrame / EventLog / pyarrow.Table
+    max_workers : 워커 프로세스 수 (None이면 ENHANCE_WORKERS, 1이면 현재 프로세스에서 순차 처리)
+
+    1. 고유 바리언트를 PM4Py 토큰 재생으로 한 번씩 재생하고, 발화된 전이 순서를 다시 따라가며
+       요소별 횟수와 아크별 (소비 이벤트 위치, 생산 이벤트 위치) 쌍을 주석으로 얻습니다(`_annotate`).
+       바리언트가 PARALLEL_VARIANTS개 이상이면 CHUNK_SIZE개씩 워커 프로세스에 나눕니다.
+    2. 횟수는 바리언트 케이스 수를 곱해 합산합니다.
+    3. 위치 쌍은 해당 바리언트의 모든 케이스로 펼쳐 타임스탬프 차를 한 번에 계산하고,
+       아크 · 플레이스별로 bincount · 정렬 분위수로 집계합니다.
+    """
+    start = time.monotonic()
+    frame = as_dataframe(event_log)
+    case_codes, _ = pd.factorize(frame["case:concept:name"])
+    act_codes, activities = encode_activities(frame["concept:name"])
+    index = build_variant_index(case_codes, act_codes, activities)
+    counts = index.counts()
+    if index.n_variants == 0:
+        return EnhancedNet(elapsed=time.monotonic() - start)
+
+    # ── 1. 바리언트별 재생 · 주석 ────────────────────────────────────────────
+    sequences = [index.sequence(v) for v in range(index.n_variants)]
+    annotations = _replay_all(net, im, fm, sequences, max_workers or ENHANCE_WORKERS)
+
+    transition_frequency: Counter = Counter()
+    place_frequency: Counter = Counter()
+    arc_frequency: Counter = Counter()
+    arc_ids: dict[tuple, int] = {}
+    rows: list[tuple[int, int, int, int]] = []   # (아크 ID, 바리언트, 소비 위치, 생산 위치)
+    for v, (transitions, places, arcs, performance) in enumerate(annotations):
+        weight = int(counts[v])
+        for name, n in transitions.items():
+            transition_frequency[name] += n * weight
+        for name, n in places.items():
+            place_frequency[name] += n * weight
+        for key, n in arcs.items():
+            arc_frequency[key] += n * weight
+        for key, i, j in performance:
+            rows.append((arc_ids.setdefault(key, len(arc_ids)), v, i, j))
+
+    # ── 2. 케이스로 펼쳐 시간 차 계산 ────────────────────────────────────────
+    place_sojourn: dict = {}
+    arc_sojourn: dict = {}
+    if rows:
+        arc_of, variant_of, consumed, produced = np.array(rows, dtype=np.int64).T
+        seconds = to_seconds(frame["time:timestamp"])
+        cases_by_variant = np.argsort(index.variant_id, kind="stable")
+        variant_start = np.concatenate([[0], np.cumsum(counts)])
+
+        repeat = counts[variant_of]
+        row = np.repeat(np.arange(len(rows)), repeat)
+        within = np.arange(len(row)) - np.repeat(np.cumsum(repeat) - repeat, repeat)
+        case = cases_by_variant[variant_start[variant_of[row]] + within]
+        base = index.starts[case]
+        duration = seconds[base + consumed[row]] - seconds[base + produced[row]]
+        valid = duration >= 0   # NaN · 음수 제외
+        arc_of, duration = arc_of[row][valid], duration[valid]
+
+        # ── 3. 아크 · 플레이스별 집계 ─────────────────────────────────────────
+        arc_keys = list(arc_ids)
+        n_arcs = len(arc_keys)
+        arc_sum = np.bincount(arc_of, weights=duration, minlength=n_arcs)
+        arc_n = np.bincount(arc_of, minlength=n_arcs)
+        for k, key in enumerate(arc_keys):
+            if arc_n[k]:
+                arc_sojourn[key] = float(arc_sum[k] / arc_n[k])
+
+        # 플레이스별 체류 시간 (플레이스의 모든 출력 아크 합산) — 값이 있는 플레이스만 그룹으로
+        place_names = sorted({key[0] for key in arc_keys})
+        place_code = {name: p for p, name in enumerate(place_names)}
+        place_of = np.array([place_code[key[0]] for key in arc_keys], dtype=np.int64)[arc_of]
+        groups, place_of = np.unique(place_of, return_inverse=True)
+        order = np.lexsort((duration, place_of))
+        place_of, duration = place_of[order], duration[order]
+        n_valid = np.bincount(place_of, minlength=len(groups))
+        starts = np.concatenate([[0], np.cumsum(n_valid)[:-1]])
+        sums = np.bincount(place_of, weights=duration, minlength=len(groups))
+        median = group_quantile(duration, starts, n_valid, 0.5)
+        p90 = group_quantile(duration, starts, n_valid, 0.9)
+        for g, p in enumerate(groups.tolist()):
+            place_sojourn[place_names[p]] = {
+                "mean":   float(sums[g] / n_valid[g]),
+                "median": float(median[g]),
+                "p90":    float(p90[g]),
+                "max":    float(duration[starts[g] + n_valid[g] - 1]),
+            }
+
+    return EnhancedNet(
+        transition_frequency=dict(transition_frequency),
+        place_frequency=dict(place_frequency),
+        arc_frequency=dict(arc_frequency),
+        place_sojourn=place_sojourn,
+        arc_sojourn=arc_sojourn,
+        n_variants=index.n_variants,
+        n_cases=int(counts.sum()),
+        elapsed=time.monotonic() - start,
+    )
+
+
+# ─── 내부 헬퍼 ───────────────────────────────────────────────────────────────
+def _replay_all(net: Any, im: Any, fm: Any, sequences: list[tuple], max_workers: int) -> list:
+    """바리언트 시퀀스 전체를 재생 · 주석합니다 (입력 순서 유지)."""
+    if max_workers <= 1 or len(sequences) < PARALLEL_VARIANTS:
+        return _replay(net, im, fm, sequences)
+    chunks = [sequences[i:i + CHUNK_SIZE] for i in range(0, len(sequences), CHUNK_SIZE)]
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(chunks)),
+        initializer=_init_worker,
+        initargs=(net, im, fm),
+    ) as executor:
+        return [a for part in executor.map(_replay_worker, chunks) for a in part]
+
+
+def _replay(net: Any, im: Any, fm: Any, sequences: list[tuple]) -> list:
+    """활동 시퀀스 묶음을 토큰 재생하고 시퀀스별 `_annotate` 결과를 반환합니다."""
+    from pm4py.algo.conformance.tokenreplay.variants import token_replay
+    from pm4py.objects.log.obj import Event, EventLog, Trace
+
+    log = EventLog([Trace([Event({"concept:name": a}) for a in seq]) for seq in sequences])
+    replayed = token_replay.apply(
+        log, net, im, fm, parameters={token_replay.Parameters.SHOW_PROGRESS_BAR: False}
+    )
+    return [
+        _annotate(seq, result["activated_transitions"], im)
+        for seq, result in zip(sequences, replayed)
+    ]
+
+
+def _annotate(
+    sequence: tuple, fired: list, im: Any
+) -> tuple[Counter, Counter, Counter, list[tuple[tuple, int, int]]]:
+    """
+    토큰 재생으로 발화된 전이 순서를 다시 실행하며 한 바리언트의 주석을 계산합니다.
+
+    PM4Py `calculate_annotation_for_trace`와 같은 규칙(숨은 전이는 입력 토큰 위치를 이어받음)을
+    따르되, 사용하지 않는 활성 전이 집계(매 단계 전체 전이 검사)를 생략합니다.
+    반환: (전이 발화 수, 플레이스 토큰 수, 아크 이동 수, [(아크, 소비 위치, 생산 위치)])
+    """
+    transitions: Counter = Counter()
+    places: Counter = Counter()
+    arcs: Counter = Counter()
+    performance: list[tuple[tuple, int, int]] = []
+
+    marking = Counter({p: n for p, n in im.items()})
+    tokens: dict[Any, list[int]] = {p: [0] * n for p, n in marking.items()}
+    for p, n in marking.items():
+        places[p.name] += n
+    seen = set(marking)
+    current = j = 0
+    for t in fired:
+        transitions[t.name] += 1
+        new_marking = marking.copy()
+        for a in t.in_arcs:
+            new_marking[a.source] -= a.weight
+            if new_marking[a.source] <= 0:
+                del new_marking[a.source]
+        for a in t.out_arcs:
+            new_marking[a.target] += a.weight
+        if not new_marking:
+            break
+        for p in new_marking.keys() - marking.keys() - seen:
+            places[p.name] += max(new_marking[p] - marking[p], 1)
+            seen.add(p)
+        marking = new_marking
+        if j < len(sequence):
+            current = j
+            if t.label == sequence[j]:
+                j += 1
+
+        waiting = [tokens[a.source][0] for a in t.in_arcs if tokens.get(a.source)]
+        first = min(waiting) if waiting else None
+        last = max(waiting) if waiting else None
+        for a in t.in_arcs:
+            key = (a.source.name, t.name)
+            arcs[key] += 1
+            queue = tokens.get(a.source)
+            if queue:
+                if t.label:
+                    performance.append((key, current, queue[0]))
+                elif first:
+                    performance.append((key, current, current))
+                del queue[0]
+        for a in t.out_arcs:
+            arcs[(t.name, a.target.name)] += 1
+            queue = tokens.setdefault(a.target, [])
+            if t.label:
+                queue.append(current)
+            elif last:
+                queue.append(last)
+    return transitions, places, arcs, performance
+
+
+# ─── 워커 프로세스 ───────────────────────────────────────────────────────────
+_WORKER_MODEL: Optional[tuple] = None
+
+
+def _init_worker(net: Any, im: Any, fm: Any) -> None:
+    """워커 시작 시 모델을 한 번만 받아 둡니다 (작업마다 Petri Net을 직렬화하지 않도록)."""
+    global _WORKER_MODEL
+    _WORKER_MODEL = (net, im, fm)
+
+
+def _replay_worker(sequences: list[tuple]) -> list:
+    return _replay(*_WORKER_MODEL, sequences)
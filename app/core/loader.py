@@ -1,39 +1,249 @@
 """
 데이터 로딩 모듈
-CSV 및 Excel 파일을 로드합니다. 인코딩 자동 감지 및 멀티 시트 처리를 지원합니다.
+CSV, Excel, Parquet, Arrow IPC 파일을 로드합니다. 인코딩 자동 감지 및 멀티 시트 처리를 지원하며,
+압축된 CSV(gzip · zstd · zip · bz2 · xz)는 압축을 푼 바이트를 메모리에 두지 않고 스트리밍으로 파싱합니다.
+파싱한 결과를 내용 해시 기준 Parquet 파일로 캐시할 수 있습니다.
+파티션 디렉토리(일자별 CSV/Parquet 등)는 프로세스 풀에서 병렬로 로드합니다.
 """
 from __future__ import annotations
 
+import bz2
+import codecs
+import gzip
+import hashlib
 import io
+import lzma
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
 
+from core.cache import DEFAULT_CACHE_DIR
+from core.timestamps import parse_timestamps
+
 ENCODINGS = ["utf-8-sig", "utf-8", "cp949", "euc-kr", "latin-1"]
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+ENCODING_PREFIX_SIZE = 1024 * 1024   # 인코딩 감지에 사용할 앞부분 바이트 수
+PREVIEW_ROWS = 5_000                 # 컬럼 매핑 추론용 미리보기 행 수
+EXCEL_BATCH_ROWS = 50_000            # Excel 스트리밍 읽기 시 배치당 행 수
+_ZIP_MAGIC = b"PK\x03\x04"          # xlsx(OOXML)는 zip 컨테이너
+CSV_CHUNK_ROWS = 200_000             # 스트리밍 파싱 시 청크당 행 수
+FRAME_CACHE_DIR = DEFAULT_CACHE_DIR / "frames"
+# 파일 시그니처(매직 바이트) → 압축 형식
+COMPRESSION_MAGIC = {
+    b"\x1f\x8b":             "gzip",
+    b"\x28\xb5\x2f\xfd":     "zstd",
+    _ZIP_MAGIC:              "zip",
+    b"BZh":                  "bz2",
+    b"\xfd7zXZ\x00":         "xz",
+}
+COMPRESSED_SUFFIXES = (".gz", ".zst", ".zip", ".bz2", ".xz")
+PARTITION_SUFFIXES = (".csv", ".parquet", ".arrow", ".feather", ".xlsx") + COMPRESSED_SUFFIXES
+
+# progress(읽은 바이트, 전체 바이트) — 전체 크기를 알 수 없으면 전체 바이트는 None
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+def file_fingerprint(file_obj) -> str:
+    """
+    파일 내용의 SHA-1 해시를 반환합니다.
+
+    같은 내용의 파일은 파일명·업로드 횟수와 관계없이 같은 값을 가지므로
+    파싱 결과를 재사용할지 판단하는 키로 사용합니다.
+    파일 포인터는 처음 위치로 되돌려 이후 로딩에 영향이 없도록 합니다.
+    """
+    digest = hashlib.sha1()
+    if hasattr(file_obj, "getbuffer"):
+        # BytesIO(Streamlit UploadedFile 포함): 복사 없이 버퍼를 바로 해시
+        digest.update(file_obj.getbuffer())
+    else:
+        pos = file_obj.tell()
+        file_obj.seek(0)
+        for chunk in iter(lambda: file_obj.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        file_obj.seek(pos)
+    return digest.hexdigest()
+
+
+def detect_encoding(prefix: bytes, candidates: Optional[list[str]] = None) -> Optional[str]:
+    """
+    파일 앞부분 바이트로 인코딩을 추정합니다.
+
+    ENCODINGS 순서대로 디코딩을 시도하여 처음 성공한 인코딩을 반환합니다.
+    prefix 끝에서 잘린 멀티바이트 문자는 오류로 보지 않습니다 (증분 디코더 사용).
+    """
+    for enc in candidates or ENCODINGS:
+        decoder = codecs.getincrementaldecoder(enc)()
+        try:
+            decoder.decode(prefix, final=False)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return None
 
 
-def load_csv(file_obj) -> pd.DataFrame:
+def _stream_size(file_obj) -> Optional[int]:
+    """파일 전체 크기(바이트). 알 수 없으면 None."""
+    if hasattr(file_obj, "getbuffer"):
+        return file_obj.getbuffer().nbytes
+    try:
+        return os.fstat(file_obj.fileno()).st_size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+def detect_compression(file_obj) -> Optional[str]:
+    """
+    파일 시그니처로 압축 형식("gzip" | "zstd" | "zip" | "bz2" | "xz")을 판별합니다.
+    압축되지 않았으면 None. 파일 포인터는 그대로 둡니다.
     """
-    CSV 파일을 로드합니다. 여러 인코딩을 순서대로 시도합니다.
+    pos = file_obj.tell()
+    head = file_obj.read(6)
+    file_obj.seek(pos)
+    for magic, kind in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return kind
+    return None
+
+
+def _zip_member(archive: zipfile.ZipFile) -> str:
+    """zip 안에서 읽을 CSV 파일을 고릅니다 (파일이 하나면 그 파일, 아니면 유일한 .csv)."""
+    names = [n for n in archive.namelist() if not n.endswith("/")]
+    if len(names) == 1:
+        return names[0]
+    csvs = [n for n in names if n.lower().endswith(".csv")]
+    if len(csvs) == 1:
+        return csvs[0]
+    raise ValueError(f"zip 파일에 CSV가 하나만 있어야 합니다: {names}")
+
+
+def _open_decompressed(file_obj, kind: str):
+    """압축된 원본 파일 객체 위에 압축을 풀며 읽는 바이너리 스트림을 엽니다."""
+    if kind == "gzip":
+        return gzip.GzipFile(fileobj=file_obj, mode="rb")
+    if kind == "bz2":
+        return bz2.BZ2File(file_obj, mode="rb")
+    if kind == "xz":
+        return lzma.LZMAFile(file_obj, mode="rb")
+    if kind == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().stream_reader(file_obj, closefd=False)
+    if kind == "zip":
+        archive = zipfile.ZipFile(file_obj)
+        return archive.open(_zip_member(archive))
+    raise ValueError(f"지원하지 않는 압축 형식입니다: {kind}")
+
+
+def _read_csv_chunks(
+    file_obj,
+    encoding: str,
+    chunksize: int,
+    progress: Optional[ProgressCallback],
+    total: Optional[int],
+    position: Optional[Callable[[], int]] = None,
+    **read_kwargs,
+) -> pd.DataFrame:
+    """
+    지정한 인코딩으로 CSV를 청크 단위로 파싱하여 하나의 DataFrame으로 합칩니다.
+    position은 진행률에 쓸 현재 위치(압축 파일이면 원본 파일 기준)이며, 생략하면 file_obj.tell().
+
+    청크는 받는 즉시 컬럼별 조각으로 나눠 두고, 마지막에 컬럼 하나씩 이어 붙이며 조각을 버립니다.
+    청크 목록과 합친 결과를 동시에 들고 있지 않으므로 최대 메모리는 결과 크기 + 컬럼 하나 수준입니다.
+    """
+    position = position or file_obj.tell
+    pieces: dict[str, list[pd.Series]] = {}
+    with pd.read_csv(
+        file_obj, encoding=encoding, chunksize=chunksize, **read_kwargs
+    ) as reader:
+        for chunk in reader:
+            for col in chunk.columns:
+                pieces.setdefault(col, []).append(chunk[col].copy())
+            del chunk
+            if progress is not None:
+                progress(position(), total)
+    if not pieces:
+        return pd.DataFrame()
+    columns = {}
+    for col in list(pieces):
+        parts = pieces.pop(col)
+        columns[col] = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+        del parts
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_csv(
+    file_obj,
+    usecols: Optional[list[str]] = None,
+    nrows: Optional[int] = None,
+    chunksize: int = CSV_CHUNK_ROWS,
+    progress: Optional[ProgressCallback] = None,
+) -> pd.DataFrame:
+    """
+    CSV 파일을 로드합니다.
+
+    앞부분(ENCODING_PREFIX_SIZE 바이트)으로 인코딩을 추정한 뒤, 원본 바이트를 메모리에
+    복사하지 않고 청크 단위로 한 번만 스트리밍 파싱합니다.
+    앞부분 이후에서 디코딩 · 파싱 오류가 나면 다음 후보 인코딩으로 처음부터 다시 파싱합니다.
+
+    gzip · zstd · zip · bz2 · xz 압축 파일은 시그니처로 판별해 압축을 풀면서 파싱합니다
+    (압축 해제된 전체 바이트를 메모리에 두지 않음). 진행률은 압축 파일 기준입니다.
 
     Parameters
     ----------
-    file_obj : file-like object (Streamlit UploadedFile 또는 경로)
+    file_obj  : file-like object (Streamlit UploadedFile) 또는 경로
+    usecols   : 읽을 컬럼 목록 (None이면 전체). 나머지 컬럼은 파싱하지 않습니다.
+    nrows     : 앞에서부터 읽을 행 수 (미리보기용, None이면 전체)
+    chunksize : 청크당 행 수
+    progress  : 진행률 콜백 progress(읽은 바이트, 전체 바이트)
 
     Returns
     -------
     pd.DataFrame
     """
-    raw_bytes = file_obj.read()
+    if isinstance(file_obj, (str, os.PathLike)):
+        with open(file_obj, "rb") as f:
+            return load_csv(
+                f, usecols=usecols, nrows=nrows, chunksize=chunksize, progress=progress
+            )
+
+    start = file_obj.tell()
+    total = _stream_size(file_obj)
+    compression = detect_compression(file_obj)
+
+    def _open():
+        # 인코딩을 바꿔 다시 파싱할 때마다 원본 처음부터 새 스트림을 엽니다
+        file_obj.seek(start)
+        if compression is None:
+            return file_obj
+        return _open_decompressed(file_obj, compression)
 
-    for enc in ENCODINGS:
+    stream = _open()
+    prefix = stream.read(ENCODING_PREFIX_SIZE)
+
+    candidates = list(ENCODINGS)
+    while candidates:
+        enc = detect_encoding(prefix, candidates)
+        if enc is None:
+            break
+        stream = _open()
         try:
-            df = pd.read_csv(io.BytesIO(raw_bytes), encoding=enc)
+            df = _read_csv_chunks(
+                stream, enc, chunksize, progress, total, position=file_obj.tell,
+                usecols=usecols, nrows=nrows,
+            )
             if not df.empty:
                 return df
         except (UnicodeDecodeError, pd.errors.ParserError):
-            continue
+            pass
+        # 앞부분 이후에서 디코딩 · 토큰화에 실패한 인코딩은 제외하고 다시 시도
+        candidates = candidates[candidates.index(enc) + 1:]
 
     raise ValueError(
         "지원되지 않는 파일 인코딩입니다. "
@@ -41,38 +251,583 @@ def load_csv(file_obj) -> pd.DataFrame:
     )
 
 
+def _is_xlsx(file_obj) -> bool:
+    """파일 시그니처로 xlsx(zip 기반) 여부를 판별합니다. 파일 포인터는 그대로 둡니다."""
+    if isinstance(file_obj, (str, os.PathLike)):
+        with open(file_obj, "rb") as f:
+            return f.read(4) == _ZIP_MAGIC
+    pos = file_obj.tell()
+    head = file_obj.read(4)
+    file_obj.seek(pos)
+    return head == _ZIP_MAGIC
+
+
+def _open_workbook(file_obj):
+    """openpyxl 읽기 전용(스트리밍) 모드로 워크북을 엽니다. 셀 데이터는 읽지 않습니다."""
+    from openpyxl import load_workbook
+
+    return load_workbook(file_obj, read_only=True, data_only=True, keep_links=False)
+
+
+def list_sheets(file_obj) -> list[str]:
+    """
+    Excel 파일의 시트명 목록을 반환합니다.
+    xlsx는 워크북 메타데이터만 읽고 시트 데이터는 파싱하지 않습니다.
+    """
+    if not _is_xlsx(file_obj):
+        return pd.ExcelFile(file_obj).sheet_names
+    wb = _open_workbook(file_obj)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _header_names(header: tuple) -> list[str]:
+    """헤더 행을 pandas.read_excel과 같은 규칙의 컬럼명으로 변환합니다 (빈 칸, 중복 처리)."""
+    names: list[str] = []
+    seen: dict[str, int] = {}
+    for i, value in enumerate(header):
+        name = f"Unnamed: {i}" if value is None or value == "" else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _read_xlsx_sheet(
+    wb,
+    sheet_name: Optional[str],
+    usecols: Optional[list[str]],
+    nrows: Optional[int],
+) -> pd.DataFrame:
+    """
+    읽기 전용 워크북의 시트를 EXCEL_BATCH_ROWS행 단위로 읽어 DataFrame으로 만듭니다.
+    usecols에 없는 셀은 배치에 담지 않으며, nrows를 채우면 나머지 행은 읽지 않습니다.
+    """
+    ws = wb[sheet_name] if sheet_name else wb.worksheets[0]
+    ws.reset_dimensions()  # 잘못 기록된 시트 크기 정보 무시
+    rows = ws.iter_rows(values_only=True)
+
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    names = _header_names(header)
+    if usecols is None:
+        positions = list(range(len(names)))
+    else:
+        missing = [c for c in usecols if c not in names]
+        if missing:
+            raise ValueError(f"시트에 없는 컬럼입니다: {missing}")
+        positions = [i for i, name in enumerate(names) if name in set(usecols)]
+    columns = [names[i] for i in positions]
+    width = len(names)
+
+    chunks: list[pd.DataFrame] = []
+    batch: list[list] = []
+    n_read = 0
+    last_nonempty = -1  # 끝부분 빈 행 제거용
+    for row in rows:
+        if len(row) < width:
+            row = row + (None,) * (width - len(row))
+        values = [row[i] for i in positions]
+        if any(v is not None for v in values):
+            last_nonempty = n_read
+        batch.append(values)
+        n_read += 1
+        if len(batch) >= EXCEL_BATCH_ROWS:
+            chunks.append(pd.DataFrame(batch, columns=columns).infer_objects())
+            batch = []
+        if nrows is not None and n_read >= nrows:
+            break
+    if batch or not chunks:
+        chunks.append(pd.DataFrame(batch, columns=columns).infer_objects())
+
+    df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+    return df.iloc[: last_nonempty + 1].infer_objects()
+
+
 def load_excel(
-    file_obj, sheet_name: Optional[str] = None
+    file_obj,
+    sheet_name: Optional[str] = None,
+    usecols: Optional[list[str]] = None,
+    nrows: Optional[int] = None,
 ) -> tuple[pd.DataFrame, list[str]]:
     """
     Excel 파일을 로드합니다.
 
+    xlsx는 openpyxl 읽기 전용 모드로 워크북을 한 번만 열고 선택한 시트를 행 배치 단위로
+    스트리밍합니다. xls 등 다른 형식은 pandas로 읽습니다.
+
+    Parameters
+    ----------
+    sheet_name : 시트명 (None이면 첫 시트)
+    usecols    : 읽을 컬럼 목록 (None이면 전체)
+    nrows      : 앞에서부터 읽을 행 수 (미리보기용, None이면 전체)
+
     Returns
     -------
     (DataFrame, 시트명 목록)
     """
-    xls = pd.ExcelFile(file_obj)
-    sheets = xls.sheet_names
-    selected = sheet_name if sheet_name else sheets[0]
-    df = pd.read_excel(xls, sheet_name=selected)
-    return df, sheets
+    if not _is_xlsx(file_obj):
+        xls = pd.ExcelFile(file_obj)
+        sheets = xls.sheet_names
+        selected = sheet_name if sheet_name else sheets[0]
+        df = pd.read_excel(xls, sheet_name=selected, usecols=usecols, nrows=nrows)
+        return df, sheets
+
+    wb = _open_workbook(file_obj)
+    try:
+        return _read_xlsx_sheet(wb, sheet_name, usecols, nrows), list(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def _arrow_source(file_obj):
+    """
+    pyarrow 입력 소스를 만듭니다.
+    경로는 memory map으로 열고, 업로드 버퍼는 복사 없이 BufferReader로 감쌉니다.
+    """
+    import pyarrow as pa
+
+    if isinstance(file_obj, (str, os.PathLike)):
+        return pa.memory_map(str(file_obj), "r")
+    if hasattr(file_obj, "getbuffer"):
+        return pa.BufferReader(pa.py_buffer(file_obj.getbuffer()))
+    return pa.PythonFile(file_obj, mode="r")
+
+
+def load_parquet(
+    file_obj,
+    columns: Optional[list[str]] = None,
+    nrows: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Parquet 파일을 로드합니다.
+
+    Parameters
+    ----------
+    file_obj : file-like object (Streamlit UploadedFile) 또는 경로
+    columns  : 읽을 컬럼 목록 (None이면 전체). 지정한 컬럼만 디스크에서 읽습니다.
+    nrows    : 앞에서부터 읽을 행 수 (미리보기용, 필요한 row group만 읽음)
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if nrows is None:
+        table = pq.read_table(_arrow_source(file_obj), columns=columns)
+    else:
+        parquet_file = pq.ParquetFile(_arrow_source(file_obj))
+        batches = parquet_file.iter_batches(batch_size=nrows, columns=columns)
+        first = next(batches, None)
+        if first is not None:
+            table = pa.Table.from_batches([first])
+        else:
+            table = parquet_file.schema_arrow.empty_table()
+            if columns is not None:
+                table = table.select(columns)
+    return table.to_pandas()
+
+
+def load_arrow(
+    file_obj,
+    columns: Optional[list[str]] = None,
+    nrows: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Arrow IPC(Feather v2) 파일 또는 스트림을 로드합니다.
+
+    Parameters
+    ----------
+    file_obj : file-like object (Streamlit UploadedFile) 또는 경로
+    columns  : 읽을 컬럼 목록 (None이면 전체)
+    nrows    : 앞에서부터 읽을 행 수 (미리보기용, None이면 전체)
+    """
+    import pyarrow as pa
+
+    source = _arrow_source(file_obj)
+    reader = _open_ipc(source)
+    if columns is not None:
+        # 필요한 컬럼 버퍼만 읽고 압축을 풉니다 (스키마를 본 뒤 projection 옵션으로 다시 엶)
+        names = reader.schema.names
+        missing = [c for c in columns if c not in names]
+        if missing:
+            raise KeyError(f"Arrow 파일에 없는 컬럼입니다: {missing}")
+        fields = sorted({names.index(c) for c in columns})
+        reader = _open_ipc(source, pa.ipc.IpcReadOptions(included_fields=fields))
+
+    if nrows is None:
+        table = reader.read_all()
+    else:
+        # 미리보기: nrows를 채울 때까지만 레코드 배치를 읽음
+        if isinstance(reader, pa.ipc.RecordBatchFileReader):
+            batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+        else:
+            batches = iter(reader)
+        parts, n = [], 0
+        for batch in batches:
+            if n >= nrows:
+                break
+            parts.append(batch)
+            n += batch.num_rows
+        table = pa.Table.from_batches(parts, schema=reader.schema).slice(0, nrows)
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas()
+
+
+def _open_ipc(source, options=None):
+    """Arrow IPC 파일 포맷으로 열고, 아니면 스트림 포맷으로 다시 엽니다."""
+    import pyarrow as pa
+
+    source.seek(0)
+    try:
+        return pa.ipc.open_file(source, options=options)
+    except pa.ArrowInvalid:
+        source.seek(0)
+        return pa.ipc.open_stream(source, options=options)
+
+
+def load_cached(
+    file_obj,
+    loader: Callable[..., pd.DataFrame],
+    variant: str = "",
+    cache_dir: Path = FRAME_CACHE_DIR,
+    fingerprint: Optional[str] = None,
+    columns: Optional[list[str]] = None,
+    mapping: Optional[dict] = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    파싱 결과를 Parquet 캐시와 함께 로드합니다 (opt-in).
+
+    처음 로드할 때 loader로 파싱한 DataFrame을 `{내용 해시}{variant}.parquet`로 저장하고,
+    이후 같은 내용의 파일은 다시 파싱하지 않고 캐시 파일을 memory map으로 읽습니다.
+    mapping을 주면 `normalize_dtypes`까지 적용한 프레임(category · datetime64)을 매핑별로 저장하므로,
+    캐시에서 읽은 결과는 타임스탬프 파싱 · category 변환을 다시 하지 않습니다.
+
+    Parameters
+    ----------
+    file_obj    : file-like object 또는 경로
+    loader      : 캐시가 없을 때 사용할 로더 (예: load_csv)
+    variant     : 같은 파일에서 여러 결과가 나오는 경우의 구분자 (예: Excel 시트명)
+    cache_dir   : 캐시 디렉토리
+    fingerprint : 이미 계산한 `file_fingerprint` 값 (생략하면 계산)
+    columns     : 반환할 컬럼 목록 (None이면 전체). 캐시에는 항상 전체 컬럼을 저장하므로
+                  다른 컬럼 조합으로 다시 로드해도 캐시를 사용합니다.
+    mapping     : {field: column_name} 컬럼 매핑 (None이면 파싱 결과를 그대로 저장)
+    kwargs      : loader에 전달할 추가 인자
+    """
+    digest = fingerprint
+    if digest is None and isinstance(file_obj, (str, os.PathLike)):
+        with open(file_obj, "rb") as f:
+            digest = file_fingerprint(f)
+    elif digest is None:
+        digest = file_fingerprint(file_obj)
+    if mapping:
+        variant = repr((variant, tuple(sorted(mapping.items()))))
+    path = _cache_path(cache_dir, digest, variant)
+
+    cached = _read_frame_cache(path, columns)
+    if cached is not None:
+        return cached
+
+    df = loader(file_obj, **kwargs)
+    if mapping:
+        df = normalize_dtypes(
+            df,
+            case_col=mapping["case_id"],
+            activity_col=mapping["activity"],
+            timestamp_col=mapping["timestamp"],
+            resource_col=mapping.get("resource"),
+        )
+    _write_frame_cache(path, df)
+    return df[columns] if columns is not None else df
+
+
+def _cache_path(cache_dir: Path, digest: str, variant: str = "") -> Path:
+    """파싱 결과 캐시 파일 경로: `{내용 해시}{variant 해시}.parquet`."""
+    suffix = hashlib.sha1(variant.encode("utf-8")).hexdigest()[:12] if variant else ""
+    return Path(cache_dir) / f"{digest}{suffix}.parquet"
+
+
+def _read_frame_cache(path: Path, columns: Optional[list[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    캐시 파일이 있으면 읽고, 없거나 손상되었으면 None을 반환합니다 (손상 파일만 삭제).
+    캐시에 없는 컬럼을 요청하면 파일은 그대로 두고 KeyError를 냅니다.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if not path.exists():
+        return None
+    try:
+        names = pq.read_schema(path).names
+    except (pa.ArrowInvalid, OSError):
+        path.unlink(missing_ok=True)
+        return None
+    missing = [c for c in columns or [] if c not in names]
+    if missing:
+        raise KeyError(f"캐시된 프레임에 없는 컬럼입니다: {missing}")
+    try:
+        return load_parquet(path, columns=columns)
+    except (pa.ArrowInvalid, OSError):
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _write_frame_cache(path: Path, df: pd.DataFrame) -> None:
+    """임시 파일에 쓴 뒤 교체합니다. Parquet로 저장할 수 없는 프레임(혼합 타입 등)은 캐시하지 않습니다."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+
+
+def normalize_dtypes(
+    df: pd.DataFrame,
+    case_col: str,
+    activity_col: str,
+    timestamp_col: str,
+    resource_col: Optional[str] = None,
+) -> pd.DataFrame:
+    """
+    매핑이 확정된 DataFrame의 컬럼 타입을 분석용으로 정규화합니다.
+
+    - Case ID / Activity / Resource : category (반복되는 문자열을 코드 + 사전으로 저장)
+    - Timestamp                     : datetime64[ns] (core.timestamps로 형식 추론 후 한 번만 파싱, 실패 값은 NaT)
+
+    이후 모듈(build_event_log, stats)은 이미 변환된 컬럼을 받으므로 다시 파싱하지 않습니다.
+    """
+    out = df.copy(deep=False)
+    for col in dict.fromkeys(c for c in (case_col, activity_col, resource_col) if c):
+        if not isinstance(out[col].dtype, pd.CategoricalDtype):
+            out[col] = out[col].astype("category")
+
+    out[timestamp_col] = parse_timestamps(out[timestamp_col])
+    return out
+
+
+# ─── 파티션 디렉토리 로딩 ─────────────────────────────────────────────────────
+@dataclass
+class PartitionTiming:
+    """파티션 파일 하나의 로딩 결과 요약."""
+    path: Path
+    rows: int
+    seconds: float
+    cached: bool  # 파싱 결과 캐시에서 읽었으면 True
+
+
+@dataclass
+class DirectoryLoad:
+    """
+    파티션 디렉토리 로딩 결과.
+
+    partitions : 파일 이름순 파티션별 DataFrame (같은 컬럼 · 같은 dtype)
+    timings    : 파티션별 로딩 시간 · 행 수 · 캐시 사용 여부 (partitions와 같은 순서)
+    """
+    partitions: list[pd.DataFrame] = field(default_factory=list)
+    timings: list[PartitionTiming] = field(default_factory=list)
+
+    @property
+    def n_rows(self) -> int:
+        return sum(len(p) for p in self.partitions)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        파티션을 하나의 DataFrame으로 이어 붙입니다.
+        category 컬럼은 파티션별 사전을 합집합으로 맞춘 뒤 붙이므로 결과도 category로 유지됩니다.
+        """
+        if not self.partitions:
+            return pd.DataFrame()
+        parts = _unify_categories(self.partitions)
+        if len(parts) == 1:
+            return parts[0]
+        return pd.concat(parts, ignore_index=True)
+
+
+def _unify_categories(parts: list[pd.DataFrame]) -> list[pd.DataFrame]:
+    """category 컬럼의 사전을 모든 파티션에서 같게 맞춥니다 (코드 재매핑만, 문자열 복사 없음)."""
+    cat_cols = [
+        c for c in parts[0].columns
+        if isinstance(parts[0][c].dtype, pd.CategoricalDtype)
+    ]
+    if not cat_cols or len(parts) == 1:
+        return parts
+    out = [p.copy(deep=False) for p in parts]
+    for col in cat_cols:
+        # 사전(고유값)끼리만 한 번 factorize하고, 각 파티션의 코드는 새 사전 위치로 재매핑
+        dictionaries = [p[col].cat.categories for p in parts]
+        new_codes, categories = pd.factorize(pd.concat([pd.Series(d) for d in dictionaries]))
+        dtype = pd.CategoricalDtype(categories)
+        bounds = np.cumsum([0] + [len(d) for d in dictionaries])
+        for i, p in enumerate(out):
+            remap = np.append(new_codes[bounds[i]:bounds[i + 1]], -1)  # 결측 코드 -1 유지
+            p[col] = pd.Categorical.from_codes(remap[p[col].cat.codes], dtype=dtype)
+    return out
+
+
+def _read_partition(path: Path, columns: Optional[list[str]]) -> pd.DataFrame:
+    """파일 확장자에 맞는 로더로 파티션 하나를 읽습니다."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv" or suffix in COMPRESSED_SUFFIXES:
+        return load_csv(path, usecols=columns)
+    if suffix == ".parquet":
+        return load_parquet(path, columns=columns)
+    if suffix in (".arrow", ".feather"):
+        return load_arrow(path, columns=columns)
+    if suffix == ".xlsx":
+        return load_excel(path, usecols=columns)[0]
+    raise ValueError(f"지원하지 않는 파티션 형식입니다: {path.name}")
+
+
+def _load_partition(
+    path: Path,
+    columns: Optional[list[str]],
+    mapping: Optional[dict],
+    cache_path: Optional[Path],
+) -> tuple[pd.DataFrame, float]:
+    """
+    파티션 하나를 읽고 매핑 기준으로 타입을 정규화합니다 (프로세스 풀 워커).
+    cache_path가 있으면 정규화된 결과를 캐시에 저장합니다.
+
+    Returns
+    -------
+    (DataFrame, 걸린 시간(초))
+    """
+    start = time.perf_counter()
+    df = _read_partition(path, columns)
+    if mapping:
+        df = normalize_dtypes(
+            df,
+            case_col=mapping["case_id"],
+            activity_col=mapping["activity"],
+            timestamp_col=mapping["timestamp"],
+            resource_col=mapping.get("resource"),
+        )
+    if cache_path is not None:
+        _write_frame_cache(cache_path, df)
+    return df, time.perf_counter() - start
+
+
+def _partition_key(path: Path, columns: Optional[list[str]], mapping: Optional[dict]) -> str:
+    """
+    파티션 캐시 키. 야간 적재 파티션은 한 번 쓰이면 바뀌지 않으므로 내용 해시 대신
+    (경로, 크기, 수정 시각)과 컬럼 · 매핑 조합을 사용합니다 (파일을 읽지 않고 판정).
+    """
+    stat = path.stat()
+    key = repr((
+        str(path.resolve()), stat.st_size, stat.st_mtime_ns,
+        tuple(columns) if columns is not None else None,
+        tuple(sorted(mapping.items())) if mapping else None,
+    ))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def load_directory(
+    directory,
+    pattern: str = "*",
+    columns: Optional[list[str]] = None,
+    mapping: Optional[dict] = None,
+    max_workers: Optional[int] = None,
+    use_cache: bool = True,
+    cache_dir: Path = FRAME_CACHE_DIR,
+) -> DirectoryLoad:
+    """
+    파티션 디렉토리(예: 일자별 CSV/Parquet)를 프로세스 풀에서 병렬로 로드합니다.
+
+    모든 파티션에 같은 컬럼 projection과 매핑 기준 타입 정규화(`normalize_dtypes`)를 적용합니다.
+    CSV(압축 포함)/Excel 파티션은 정규화된 결과를 Parquet로 캐시하며, 캐시가 있는 파티션은
+    워커에 보내지 않고 바로 읽습니다 (Parquet/Arrow 파티션은 캐시하지 않음).
+
+    Parameters
+    ----------
+    directory   : 파티션 파일이 있는 디렉토리
+    pattern     : 파일 glob 패턴 (PARTITION_SUFFIXES 확장자만 사용)
+    columns     : 읽을 컬럼 목록 (None이면 전체)
+    mapping     : {field: column_name} 컬럼 매핑 (None이면 타입 정규화 생략)
+    max_workers : 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 로드)
+    use_cache   : 파싱 결과 캐시 사용 여부
+    cache_dir   : 캐시 디렉토리
+
+    Returns
+    -------
+    DirectoryLoad — `to_frame()`으로 하나의 DataFrame으로 합치거나 partitions를 그대로 사용
+    """
+    paths = sorted(
+        p for p in Path(directory).glob(pattern)
+        if p.is_file() and p.suffix.lower() in PARTITION_SUFFIXES
+    )
+    if not paths:
+        raise FileNotFoundError(f"로드할 파티션 파일이 없습니다: {directory}/{pattern}")
+
+    frames: dict[Path, pd.DataFrame] = {}
+    timings: dict[Path, PartitionTiming] = {}
+    pending: dict[Path, Optional[Path]] = {}
+    for path in paths:
+        cache_path = None
+        if use_cache and path.suffix.lower() in (".csv", ".xlsx") + COMPRESSED_SUFFIXES:
+            cache_path = _cache_path(cache_dir, _partition_key(path, columns, mapping))
+            start = time.perf_counter()
+            cached = _read_frame_cache(cache_path)
+            if cached is not None:
+                frames[path] = cached
+                timings[path] = PartitionTiming(
+                    path, len(cached), time.perf_counter() - start, cached=True
+                )
+                continue
+        pending[path] = cache_path
+
+    def _done(path: Path, df: pd.DataFrame, seconds: float) -> None:
+        frames[path] = df
+        timings[path] = PartitionTiming(path, len(df), seconds, cached=False)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(pending))
+    if workers <= 1:
+        for path, cache_path in pending.items():
+            _done(path, *_load_partition(path, columns, mapping, cache_path))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                path: executor.submit(_load_partition, path, columns, mapping, cache_path)
+                for path, cache_path in pending.items()
+            }
+            for path, future in futures.items():
+                _done(path, *future.result())
+
+    return DirectoryLoad(
+        partitions=[frames[p] for p in paths],
+        timings=[timings[p] for p in paths],
+    )
 
 
-def load_sample(sample_type: str) -> pd.DataFrame:
+def load_sample(
+    sample_type: str,
+    usecols: Optional[list[str]] = None,
+    nrows: Optional[int] = None,
+) -> pd.DataFrame:
     """
     내장 샘플 데이터를 로드합니다.
 
     Parameters
     ----------
     sample_type : "purchase" | "running_example"
+    usecols     : 읽을 컬럼 목록 (None이면 전체)
+    nrows       : 앞에서부터 읽을 행 수 (None이면 전체)
     """
     base_dir = Path(__file__).parent.parent.parent / "sample_data"
 
     if sample_type == "purchase":
         path = base_dir / "purchase_process.csv"
-        return pd.read_csv(path, encoding="utf-8-sig")
+        return pd.read_csv(path, encoding="utf-8-sig", usecols=usecols, nrows=nrows)
     elif sample_type == "running_example":
         path = base_dir / "running_example.csv"
-        return pd.read_csv(path, encoding="utf-8")
+        return pd.read_csv(path, encoding="utf-8", usecols=usecols, nrows=nrows)
     else:
         raise ValueError(f"알 수 없는 샘플 타입: {sample_type}")
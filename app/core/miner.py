@@ -4,18 +4,29 @@ PM4Py를 래핑하여 Alpha, Heuristics, Inductive Miner를 제공합니다.
 """
 from __future__ import annotations
 
+import dataclasses
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 import pandas as pd
 import pm4py
 
+from core.cache import MinerCache, log_fingerprint, make_cache_key
+from core.compressed_log import CompressedLog, compress_log
+from core.dfg import DfgStatistics
+from core.pool import shutdown_pool
+from core.timestamps import parse_timestamps
+
 
 # ─── 결과 데이터 클래스 ──────────────────────────────────────────────────────
+# 필드나 통계 형식을 바꾸면 core.cache.CACHE_FORMAT_VERSION을 올립니다 (디스크 캐시 무효화).
 @dataclass
 class MinerResult:
     algorithm: str                       # "alpha" | "heuristics" | "inductive"
-    net: Any                             # PetriNet 객체
+    net: Any                             # PetriNet 객체 (모델 생성 실패 시 None)
     initial_marking: Any                 # Marking
     final_marking: Any                   # Marking
     dfg: dict                            # {(src, tgt): frequency}
@@ -23,21 +34,35 @@ class MinerResult:
     activities_count: dict               # {activity: frequency}
     start_activities: dict               # {activity: frequency}
     end_activities: dict                 # {activity: frequency}
-    event_log: Any                       # PM4Py EventLog
+    event_log: Any                       # PM4Py 형식 DataFrame 또는 EventLog
     parameters: dict = field(default_factory=dict)
     bpmn_model: Optional[Any] = None     # Inductive Miner 시에만 직접 생성
+    performance_stats: dict = field(default_factory=dict)
+    # {(src, tgt): {"mean", "median", "p90", "max"}} (초 단위)
+    error: Optional[str] = None          # 모델 생성 실패/시간 초과 사유 (DFG 통계는 유효)
+    process_tree: Optional[Any] = None   # Inductive Miner가 발견한 ProcessTree (재변환용)
+    enhancement: Optional[Any] = None    # EnhancedNet — Petri Net 성능 오버레이 (`enhance()`로 계산)
+
+    @property
+    def model_available(self) -> bool:
+        """Petri Net 모델이 생성되었는지 여부 (시간 초과 시 DFG 통계만 존재)."""
+        return self.net is not None
 
 
 # ─── 이벤트 로그 변환 ─────────────────────────────────────────────────────────
+LOG_OUTPUTS = ("event_log", "dataframe", "arrow")
+
+
 def build_event_log(
     df: pd.DataFrame,
     case_col: str,
     activity_col: str,
     timestamp_col: str,
     resource_col: Optional[str] = None,
+    output: str = "event_log",
 ) -> Any:
     """
-    pandas DataFrame을 PM4Py EventLog로 변환합니다.
+    pandas DataFrame을 PM4Py 표준 형식의 이벤트 로그로 변환합니다.
 
     Parameters
     ----------
@@ -46,10 +71,17 @@ def build_event_log(
     activity_col : Activity 컬럼명
     timestamp_col: Timestamp 컬럼명
     resource_col : Resource 컬럼명 (선택)
+    output       : "event_log" | "dataframe" | "arrow"
+                   - event_log : PM4Py EventLog (이벤트마다 Python 객체 생성, 메모리 사용 큼)
+                   - dataframe : PM4Py 형식으로 정리된 DataFrame (Discovery에 그대로 사용)
+                   - arrow     : dataframe 결과를 pyarrow.Table로 변환
+
+    매핑된 컬럼만 사용하므로 원본의 나머지 컬럼은 복사하지 않습니다.
     """
-    work = df.copy()
+    if output not in LOG_OUTPUTS:
+        raise ValueError(f"지원하지 않는 출력 형식: {output}")
 
-    # 표준 컬럼명으로 매핑
+    # 표준 컬럼명으로 매핑 (필요한 컬럼만 선택)
     rename_map = {
         case_col:      "case:concept:name",
         activity_col:  "concept:name",
@@ -58,17 +90,15 @@ def build_event_log(
     if resource_col:
         rename_map[resource_col] = "org:resource"
 
-    work = work.rename(columns=rename_map)
+    work = df[list(rename_map)].rename(columns=rename_map)
 
     # 타임스탬프 파싱
-    work["time:timestamp"] = pd.to_datetime(
-        work["time:timestamp"], errors="coerce", utc=False
-    )
+    work["time:timestamp"] = parse_timestamps(work["time:timestamp"])
 
     # 결측 타임스탬프 행 제거
     work = work.dropna(subset=["time:timestamp"])
 
-    # PM4Py 형식 변환
+    # PM4Py 형식 변환 (케이스 내 시간순 정렬 포함)
     work = pm4py.format_dataframe(
         work,
         case_id="case:concept:name",
@@ -76,145 +106,397 @@ def build_event_log(
         timestamp_key="time:timestamp",
     )
 
-    # 케이스 내 시간순 정렬
-    work = work.sort_values(["case:concept:name", "time:timestamp"])
-
+    if output == "dataframe":
+        return work
+    if output == "arrow":
+        import pyarrow as pa
+        return pa.Table.from_pandas(work, preserve_index=False)
     return pm4py.convert_to_event_log(work)
 
 
+def as_dataframe(event_log: Any) -> pd.DataFrame:
+    """이벤트 로그(EventLog / DataFrame / pyarrow.Table)를 PM4Py 형식 DataFrame으로 반환합니다."""
+    if isinstance(event_log, pd.DataFrame):
+        return event_log
+    if hasattr(event_log, "to_pandas"):  # pyarrow.Table
+        return event_log.to_pandas()
+    return pm4py.convert_to_dataframe(event_log)
+
+
+def as_event_log(event_log: Any) -> Any:
+    """
+    EventLog 객체가 필요한 알고리즘을 위해 필요할 때만 EventLog로 변환합니다.
+    이미 EventLog라면 그대로 반환합니다.
+    """
+    if isinstance(event_log, pd.DataFrame) or hasattr(event_log, "to_pandas"):
+        return pm4py.convert_to_event_log(as_dataframe(event_log))
+    return event_log
+
+
 # ─── 알고리즘 클래스 ──────────────────────────────────────────────────────────
 class ProcessMiner:
-    """Process Discovery 알고리즘 실행기."""
+    """
+    Process Discovery 알고리즘 실행기.
+
+    Parameters
+    ----------
+    cache : MinerCache (선택). 지정하면 같은 로그·알고리즘·파라미터 조합의 결과를 재사용합니다.
+    """
+
+    # 알고리즘별 기본 파라미터 (캐시 키 정규화에도 사용)
+    DEFAULT_PARAMS: dict[str, dict] = {
+        "alpha":      {},
+        "heuristics": {
+            "dependency_threshold": 0.5,
+            "and_threshold":        0.65,
+            "loop_two_threshold":   0.5,
+        },
+        "inductive":  {"noise_threshold": 0.0},
+    }
+
+    def __init__(self, cache: Optional[MinerCache] = None):
+        self.cache = cache
 
     def run(
         self,
         event_log: Any,
         algorithm: str,
         params: dict,
+        fingerprint: Optional[str] = None,
+        time_budget: Optional[float] = None,
     ) -> MinerResult:
         """
         알고리즘을 실행하고 결과를 반환합니다.
 
         Parameters
         ----------
-        event_log : PM4Py EventLog
-        algorithm : "alpha" | "heuristics" | "inductive"
-        params    : 알고리즘별 파라미터 딕셔너리
+        event_log   : PM4Py EventLog 또는 `build_event_log(output="dataframe" | "arrow")` 결과
+                      DataFrame은 EventLog로 변환하지 않고 그대로 Discovery에 사용합니다.
+        algorithm   : "alpha" | "heuristics" | "inductive"
+        params      : 알고리즘별 파라미터 딕셔너리
+        fingerprint : 로그 지문 (캐시 사용 시, 생략하면 로그 내용으로 계산)
+        time_budget : Discovery 제한 시간(초). 지정하면 모델 Discovery를 별도 워커 프로세스에서
+                      실행하고, 시간을 넘기면 워커를 종료한 뒤 DFG · 성능 통계만 담긴 결과를
+                      반환합니다 (`model_available == False`).
+        """
+        if algorithm not in self.DEFAULT_PARAMS:
+            raise ValueError(f"지원하지 않는 알고리즘: {algorithm}")
+
+        if time_budget is not None:
+            return self.run_many(
+                event_log, {algorithm: params},
+                timeout=time_budget, fingerprint=fingerprint,
+            )[algorithm]
+
+        if not isinstance(event_log, pd.DataFrame) and hasattr(event_log, "to_pandas"):
+            event_log = as_dataframe(event_log)
+
+        if self.cache is None:
+            return self._run(event_log, algorithm, params)
+
+        if fingerprint is None:
+            fingerprint = log_fingerprint(as_dataframe(event_log))
+        key = make_cache_key(
+            fingerprint, algorithm, {**self.DEFAULT_PARAMS[algorithm], **params}
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            return dataclasses.replace(cached, event_log=event_log, parameters=params)
+
+        result = self._run(event_log, algorithm, params)
+        self.cache.put(key, result)
+        return result
+
+    def run_many(
+        self,
+        event_log: Any,
+        requests: dict[str, dict],
+        timeout: Union[float, dict[str, float], None] = None,
+        max_workers: Optional[int] = None,
+        fingerprint: Optional[str] = None,
+    ) -> dict[str, MinerResult]:
+        """
+        여러 알고리즘을 프로세스 풀에서 동시에 실행합니다.
+
+        로그를 바리언트 압축 로그로 한 번 변환하여 DFG · 성능 통계를 모든 결과가 공유하고,
+        알고리즘별 Discovery와 BPMN 변환만 워커 프로세스에서 병렬로 수행합니다.
+        워커에는 이벤트 로그 대신 압축 로그만 전달됩니다.
+
+        Parameters
+        ----------
+        event_log   : `run()`과 동일
+        requests    : {algorithm: params} — 예: {"alpha": {}, "inductive": {"noise_threshold": 0.2}}
+        timeout     : 알고리즘별 제한 시간(초). 숫자면 모든 알고리즘 공통, dict면 알고리즘별
+                      시간 초과 시 DFG 통계만 담긴 결과(net=None, error 설정)를 반환
+        max_workers : 워커 프로세스 수 (기본: 실행할 알고리즘 수)
+        fingerprint : 로그 지문 (캐시 사용 시)
+
+        Returns
+        -------
+        {algorithm: MinerResult} (requests 순서)
+        """
+        for algorithm in requests:
+            if algorithm not in self.DEFAULT_PARAMS:
+                raise ValueError(f"지원하지 않는 알고리즘: {algorithm}")
+
+        if not isinstance(event_log, pd.DataFrame) and hasattr(event_log, "to_pandas"):
+            event_log = as_dataframe(event_log)
+
+        # 캐시 조회
+        results: dict[str, MinerResult] = {}
+        keys: dict[str, str] = {}
+        if self.cache is not None:
+            if fingerprint is None:
+                fingerprint = log_fingerprint(as_dataframe(event_log))
+            for algorithm, params in requests.items():
+                keys[algorithm] = make_cache_key(
+                    fingerprint, algorithm, {**self.DEFAULT_PARAMS[algorithm], **params}
+                )
+                cached = self.cache.get(keys[algorithm])
+                if cached is not None:
+                    results[algorithm] = dataclasses.replace(
+                        cached, event_log=event_log, parameters=params
+                    )
+
+        pending = [a for a in requests if a not in results]
+        if pending:
+            if not isinstance(timeout, dict):
+                timeout = {a: timeout for a in pending}
+
+            compressed = self._compress(event_log)
+            executor = ProcessPoolExecutor(max_workers=max_workers or len(pending))
+            timed_out: set = set()
+            try:
+                # 공유 DFG 통계를 한 번 계산해 결과 조립과 워커의 Discovery에 함께 사용
+                dfg_stats = compressed.dfg_statistics()
+                start = time.monotonic()
+                futures = {
+                    executor.submit(
+                        _discover_worker, compressed, dfg_stats, a, requests[a]
+                    ): a
+                    for a in pending
+                }
+
+                deadlines = {
+                    f: start + timeout[a] if timeout.get(a) is not None else math.inf
+                    for f, a in futures.items()
+                }
+                remaining = set(futures)
+                while remaining:
+                    now = time.monotonic()
+                    expired = {f for f in remaining if deadlines[f] <= now}
+                    timed_out |= expired
+                    remaining -= expired
+                    if not remaining:
+                        break
+                    next_deadline = min(deadlines[f] for f in remaining)
+                    wait(
+                        remaining,
+                        timeout=None if next_deadline == math.inf else next_deadline - now,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    remaining = {f for f in remaining if not f.done()}
+
+                for future, algorithm in futures.items():
+                    params = requests[algorithm]
+                    if future in timed_out:
+                        results[algorithm] = self._make_result(
+                            event_log, algorithm, params, dfg_stats,
+                            error=f"시간 초과 ({timeout[algorithm]:g}초)",
+                        )
+                        continue
+                    try:
+                        model = future.result()
+                    except Exception as e:
+                        results[algorithm] = self._make_result(
+                            event_log, algorithm, params, dfg_stats, error=str(e)
+                        )
+                        continue
+                    result = self._make_result(event_log, algorithm, params, dfg_stats, model)
+                    if self.cache is not None:
+                        self.cache.put(keys[algorithm], result)
+                    results[algorithm] = result
+            finally:
+                shutdown_pool(executor, terminate=bool(timed_out))
+
+        return {a: results[a] for a in requests}
+
+    def enhance(self, result: MinerResult, fingerprint: Optional[str] = None) -> MinerResult:
+        """
+        Petri Net 성능 오버레이(`core.enhancer.enhance_with_performance`)를 계산해 결과에 붙입니다.
+
+        이미 계산된 결과나 모델이 없는 결과는 그대로 반환합니다. 캐시를 사용하면
+        같은 키의 캐시 항목도 오버레이가 포함된 결과로 갱신하여 다음 실행에서 재사용합니다.
         """
-        dfg, start_acts, end_acts = pm4py.discover_dfg(event_log)
+        if result.enhancement is not None or not result.model_available:
+            return result
 
-        # Performance DFG: arc별 평균 Inter-Event Time (초 단위)
-        performance_dfg = self._compute_performance_dfg(event_log)
+        from core.enhancer import enhance_with_performance
 
-        # 활동별 빈도 계산
-        activities_count = self._compute_activities_count(event_log)
+        enhanced = dataclasses.replace(
+            result,
+            enhancement=enhance_with_performance(
+                result.net, result.initial_marking, result.final_marking, result.event_log
+            ),
+        )
+        if self.cache is not None:
+            if fingerprint is None:
+                fingerprint = log_fingerprint(as_dataframe(result.event_log))
+            key = make_cache_key(
+                fingerprint, result.algorithm,
+                {**self.DEFAULT_PARAMS[result.algorithm], **result.parameters},
+            )
+            self.cache.put(key, enhanced)
+        return enhanced
+
+    def _run(self, event_log: Any, algorithm: str, params: dict) -> MinerResult:
+        """캐시를 거치지 않고 Discovery를 실행합니다."""
+        compressed = self._compress(event_log)
+        # DFG · Performance DFG · 활동 빈도 · 시작/종료 활동을 바리언트 단위로 계산
+        dfg_stats = compressed.dfg_statistics()
+        model = self._discover(compressed, dfg_stats, algorithm, params)
+        return self._make_result(event_log, algorithm, params, dfg_stats, model)
+
+    def _discover(
+        self,
+        compressed: CompressedLog,
+        dfg_stats: DfgStatistics,
+        algorithm: str,
+        params: dict,
+    ) -> tuple:
+        """
+        바리언트 압축 로그에서 알고리즘별 모델을 발견합니다.
+        dfg_stats는 compressed.dfg_statistics() 결과로, Alpha · Heuristics가 재사용합니다.
 
+        Returns
+        -------
+        (net, initial_marking, final_marking, bpmn_model, process_tree)
+        """
+        process_tree = None
         if algorithm == "alpha":
-            net, im, fm = self._run_alpha(event_log)
+            net, im, fm = self._run_alpha(dfg_stats)
         elif algorithm == "heuristics":
-            net, im, fm = self._run_heuristics(event_log, params)
+            net, im, fm = self._run_heuristics(compressed, dfg_stats, params)
         elif algorithm == "inductive":
-            net, im, fm = self._run_inductive(event_log, params)
+            # Process Tree를 한 번만 발견하고 Petri Net · BPMN은 트리에서 변환
+            process_tree = self._run_inductive(compressed, params)
+            net, im, fm = pm4py.convert_to_petri_net(process_tree)
         else:
             raise ValueError(f"지원하지 않는 알고리즘: {algorithm}")
 
-        # BPMN 모델 생성 (Inductive Miner는 직접 생성, 나머지는 Petri Net 변환)
+        # BPMN 모델 생성 (Inductive Miner는 Process Tree 변환, 나머지는 Petri Net 변환)
         try:
-            if algorithm == "inductive":
-                noise = params.get("noise_threshold", 0.0)
-                bpmn_model = pm4py.discover_bpmn_inductive(
-                    event_log, noise_threshold=noise
-                )
+            if process_tree is not None:
+                bpmn_model = pm4py.convert_to_bpmn(process_tree)
             else:
                 bpmn_model = pm4py.convert_to_bpmn(net, im, fm)
         except Exception:
             bpmn_model = None
 
+        return net, im, fm, bpmn_model, process_tree
+
+    @staticmethod
+    def _make_result(
+        event_log: Any,
+        algorithm: str,
+        params: dict,
+        dfg_stats: Any,
+        model: Optional[tuple] = None,
+        error: Optional[str] = None,
+    ) -> MinerResult:
+        """DFG 통계와 모델로 MinerResult를 조립합니다. model이 없으면 DFG만 담긴 결과."""
+        net, im, fm, bpmn_model, process_tree = model if model is not None else (None,) * 5
         return MinerResult(
             algorithm=algorithm,
             net=net,
             initial_marking=im,
             final_marking=fm,
-            dfg=dfg,
-            performance_dfg=performance_dfg,
-            activities_count=activities_count,
-            start_activities=start_acts,
-            end_activities=end_acts,
+            dfg=dfg_stats.dfg,
+            performance_dfg=dfg_stats.performance_dfg,
+            activities_count=dfg_stats.activities_count,
+            start_activities=dfg_stats.start_activities,
+            end_activities=dfg_stats.end_activities,
             event_log=event_log,
             parameters=params,
             bpmn_model=bpmn_model,
+            performance_stats=dfg_stats.performance_stats,
+            error=error,
+            process_tree=process_tree,
         )
 
-    # ─── Performance DFG 계산 ─────────────────────────────────────────────────
-    def _compute_performance_dfg(self, event_log: Any) -> dict:
+    # ─── 바리언트 압축 ─────────────────────────────────────────────────────────
+    @staticmethod
+    def _compress(event_log: Any) -> CompressedLog:
         """
-        Arc별 평균 Inter-Event Time을 계산합니다 (단위: 초).
-
-        단일 타임스탬프 기반:
-          Arc Performance(A→B) = mean( timestamp(B) - timestamp(A) )
-          for all consecutive (A, B) pairs within each case
+        이벤트 로그를 바리언트 압축 로그로 변환합니다.
+        이벤트 단위 연산은 여기서 한 번만 수행하고, 이후 DFG 계산과 Discovery는
+        바리언트 수에 비례하는 비용으로 실행됩니다.
         """
-        try:
-            from pm4py.algo.discovery.dfg import algorithm as dfg_algo
-            perf_dfg = dfg_algo.apply(
-                event_log,
-                variant=dfg_algo.Variants.PERFORMANCE,
-            )
-            return perf_dfg  # {(src, tgt): mean_seconds}
-        except Exception:
-            # PM4Py API 실패 시 pandas 기반 직접 계산으로 fallback
-            return self._compute_performance_dfg_pandas(event_log)
-
-    def _compute_performance_dfg_pandas(self, event_log: Any) -> dict:
-        """pandas 기반 Performance DFG 계산 (fallback)."""
-        from collections import defaultdict
-        import statistics
-
-        arc_durations: dict = defaultdict(list)
-
-        for trace in event_log:
-            events = sorted(trace, key=lambda e: e["time:timestamp"])
-            for i in range(1, len(events)):
-                a_act = events[i - 1]["concept:name"]
-                b_act = events[i]["concept:name"]
-                a_ts  = events[i - 1]["time:timestamp"]
-                b_ts  = events[i]["time:timestamp"]
-                duration = (b_ts - a_ts).total_seconds()
-                if duration >= 0:
-                    arc_durations[(a_act, b_act)].append(duration)
-
-        return {
-            arc: statistics.mean(durs)
-            for arc, durs in arc_durations.items()
-            if durs
-        }
-
-    def _compute_activities_count(self, event_log: Any) -> dict:
-        """활동별 발생 빈도를 계산합니다."""
-        counts: dict = {}
-        for trace in event_log:
-            for event in trace:
-                act = event["concept:name"]
-                counts[act] = counts.get(act, 0) + 1
-        return counts
+        frame = as_dataframe(event_log)
+        return compress_log(
+            frame["case:concept:name"],
+            frame["concept:name"],
+            frame["time:timestamp"],
+        )
 
     # ─── 개별 알고리즘 ─────────────────────────────────────────────────────────
-    def _run_alpha(self, event_log: Any):
-        """Alpha Miner 실행."""
-        return pm4py.discover_petri_net_alpha(event_log)
-
-    def _run_heuristics(self, event_log: Any, params: dict):
-        """Heuristics Miner 실행."""
-        return pm4py.discover_petri_net_heuristics(
-            event_log,
-            dependency_threshold=params.get("dependency_threshold", 0.5),
-            and_threshold=params.get("and_threshold", 0.65),
-            loop_two_threshold=params.get("loop_two_threshold", 0.5),
+    def _run_alpha(self, stats: DfgStatistics):
+        """Alpha Miner 실행 (DFG + 시작/종료 활동 기반)."""
+        from pm4py.algo.discovery.alpha.variants import classic as alpha_classic
+
+        return alpha_classic.apply_dfg_sa_ea(
+            stats.dfg, stats.start_activities, stats.end_activities
         )
 
-    def _run_inductive(self, event_log: Any, params: dict):
-        """Inductive Miner (IMf) 실행."""
-        return pm4py.discover_petri_net_inductive(
-            event_log,
-            noise_threshold=params.get("noise_threshold", 0.0),
+    def _run_heuristics(self, compressed: CompressedLog, stats: DfgStatistics, params: dict):
+        """Heuristics Miner 실행 (DFG · 2칸 DFG · 빈도 3-쌍 기반)."""
+        from pm4py.algo.discovery.heuristics.variants import classic as heuristics_classic
+
+        p = {**self.DEFAULT_PARAMS["heuristics"], **params}
+        keys = heuristics_classic.Parameters
+        heu_net = heuristics_classic.apply_heu_dfg(
+            stats.dfg,
+            activities=list(stats.activities_count),
+            activities_occurrences=stats.activities_count,
+            start_activities=stats.start_activities,
+            end_activities=stats.end_activities,
+            dfg_window_2=compressed.window_dfg(2),
+            freq_triples=compressed.freq_triples(),
+            parameters={
+                keys.DEPENDENCY_THRESH:      p["dependency_threshold"],
+                keys.AND_MEASURE_THRESH:     p["and_threshold"],
+                keys.LOOP_LENGTH_TWO_THRESH: p["loop_two_threshold"],
+            },
         )
+        return pm4py.convert_to_petri_net(heu_net)
+
+    def _run_inductive(self, compressed: CompressedLog, params: dict):
+        """Inductive Miner 실행 (바리언트 압축 로그 기반). Process Tree를 반환합니다."""
+        from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
+        from pm4py.algo.discovery.inductive.variants.im import IMUVCL
+        from pm4py.algo.discovery.inductive.variants.imf import IMFUVCL
+        from pm4py.objects.process_tree.utils import generic as pt_util
+        from pm4py.util import constants
+
+        noise = params.get(
+            "noise_threshold", self.DEFAULT_PARAMS["inductive"]["noise_threshold"]
+        )
+        parameters = {
+            "noise_threshold":      noise,
+            "multiprocessing":      constants.ENABLE_MULTIPROCESSING_DEFAULT,
+            "disable_fallthroughs": False,
+        }
+        # pm4py.discover_process_tree_inductive와 동일하게 noise > 0이면 IMf, 아니면 IM
+        miner = IMFUVCL(parameters) if noise > 0 else IMUVCL(parameters)
+        tree = miner.apply(IMDataStructureUVCL(compressed.to_uvcl()), parameters)
+        tree = pt_util.fold(tree)
+        pt_util.tree_sort(tree)
+        return tree
+
+
+# ─── 프로세스 풀 헬퍼 ─────────────────────────────────────────────────────────
+def _discover_worker(
+    compressed: CompressedLog, dfg_stats: DfgStatistics, algorithm: str, params: dict
+) -> tuple:
+    """워커 프로세스에서 모델 Discovery와 BPMN 변환만 수행합니다."""
+    return ProcessMiner()._discover(compressed, dfg_stats, algorithm, params)
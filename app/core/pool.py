@@ -0,0 +1,34 @@
+"""
+프로세스 풀 유틸리티 모듈
+Discovery 비교 실행(core.miner)과 바리언트 재생(core.conformance)이 함께 쓰는
+ProcessPoolExecutor 종료 처리를 제공합니다.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+def shutdown_pool(executor: ProcessPoolExecutor, terminate: bool = False) -> None:
+    """
+    프로세스 풀을 종료합니다. 대기 중인 작업은 취소합니다.
+
+    terminate : True이면 실행 중인 작업이 남은 워커 프로세스를 강제 종료하고 기다리지 않습니다.
+                ProcessPoolExecutor는 실행 중인 작업을 취소할 수 없으므로 시간 초과 시 사용합니다.
+    """
+    if terminate:
+        terminate_workers(executor)
+    executor.shutdown(wait=not terminate, cancel_futures=True)
+
+
+def terminate_workers(executor: ProcessPoolExecutor) -> None:
+    """
+    풀의 살아 있는 워커 프로세스를 강제 종료합니다.
+    Python 3.14 이상은 공개 API(`terminate_workers`)를 쓰고, 이전 버전은 풀이 보관한
+    워커 프로세스 목록을 직접 종료합니다.
+    """
+    if hasattr(executor, "terminate_workers"):
+        executor.terminate_workers()
+        return
+    for process in list((getattr(executor, "_processes", None) or {}).values()):
+        if process.is_alive():
+            process.terminate()
@@ -1,19 +1,126 @@
 """
 프로세스 통계 모듈
 이벤트 로그(DataFrame)로부터 비즈니스 분석에 유용한 통계를 계산합니다.
+
+모든 통계 함수는 `build_case_table()`로 한 번 계산한 CaseTable을 공유합니다.
+타임스탬프 파싱, 케이스·시간순 정렬, 케이스별 집계는 CaseTable 생성 시 한 번만 수행됩니다.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+from core.timestamps import parse_timestamps
+from core.variants import VariantIndex, build_variant_index, encode_activities
+
+
+# ─── 공유 사전 계산 테이블 ────────────────────────────────────────────────────
+@dataclass
+class CaseTable:
+    """
+    통계 계산용 사전 계산 결과.
+
+    events : (case_code, ts) 순으로 정렬된 이벤트 테이블
+             columns = case, case_code, activity, ts, next_delta_h
+             next_delta_h 는 같은 케이스 내 다음 이벤트까지의 시간(h), 마지막 이벤트는 NaN
+    cases  : 케이스별 요약 (index = 케이스 ID)
+             columns = start, end, n_events, duration_h, variant_id
+    variants : 바리언트 엔진 결과 (activity_col 이 없으면 None)
+    """
+    events: pd.DataFrame
+    cases: pd.DataFrame
+    case_col: str
+    activity_col: Optional[str]
+    timestamp_col: str
+    variants: Optional[VariantIndex] = None
+
+
+def build_case_table(
+    df: pd.DataFrame,
+    case_col: str,
+    activity_col: Optional[str],
+    timestamp_col: str,
+) -> CaseTable:
+    """
+    케이스 테이블과 정렬된 이벤트 테이블을 한 번에 계산합니다.
+
+    activity_col 이 None 이면 바리언트 ID를 계산하지 않습니다.
+    Case ID가 결측인 이벤트는 이벤트 수에는 포함되지만 케이스 집계에서는 제외됩니다.
+    """
+    ts = parse_timestamps(df[timestamp_col]).reset_index(drop=True)
+    case_codes, case_labels = pd.factorize(df[case_col])
+
+    # (케이스, 시각) 정렬 — NaT는 케이스 내 마지막으로 보냄
+    ts_i8 = ts.array.asi8
+    sort_ts = np.where(ts.isna().to_numpy(), np.iinfo(np.int64).max, ts_i8)
+    order = np.lexsort((sort_ts, case_codes))
+
+    events = pd.DataFrame({
+        "case":      df[case_col].take(order).reset_index(drop=True),
+        "case_code": case_codes[order],
+        "ts":        ts.take(order).reset_index(drop=True),
+    })
+    if activity_col is not None:
+        events["activity"] = df[activity_col].take(order).reset_index(drop=True)
+
+    codes = events["case_code"].to_numpy()
+    same_case_next = np.append(codes[1:] == codes[:-1], False)
+    next_ts = events["ts"].shift(-1).where(same_case_next)
+    events["next_delta_h"] = (next_ts - events["ts"]).dt.total_seconds() / 3600
+
+    # 케이스별 시작/종료/이벤트 수
+    valid = events[codes >= 0]
+    grp = valid.groupby("case_code", sort=True)["ts"]
+    cases = pd.DataFrame({
+        "start":    grp.min(),
+        "end":      grp.max(),
+        "n_events": grp.size(),
+    })
+    cases["duration_h"] = (cases["end"] - cases["start"]).dt.total_seconds() / 3600
+
+    variants = None
+    if activity_col is not None:
+        # 결측 케이스(코드 -1)는 정렬 시 맨 앞에 모이므로 그 뒤부터 사용
+        n_missing = int(np.searchsorted(codes, 0))
+        act_codes, activities = encode_activities(events["activity"])
+        variants = build_variant_index(codes[n_missing:], act_codes[n_missing:], activities)
+        cases["variant_id"] = variants.variant_id
+
+    cases.index = pd.Index(case_labels.take(cases.index.to_numpy()), name=case_col)
+
+    return CaseTable(
+        events=events,
+        cases=cases,
+        case_col=case_col,
+        activity_col=activity_col,
+        timestamp_col=timestamp_col,
+        variants=variants,
+    )
 
+
+def _ensure_table(
+    table: Optional[CaseTable],
+    df: pd.DataFrame,
+    case_col: str,
+    activity_col: Optional[str],
+    timestamp_col: str,
+) -> CaseTable:
+    """전달된 CaseTable이 없으면 새로 계산합니다."""
+    if table is not None:
+        return table
+    return build_case_table(df, case_col, activity_col, timestamp_col)
+
+
+# ─── 통계 함수 ────────────────────────────────────────────────────────────────
 def compute_overview(
     df: pd.DataFrame,
     case_col: str,
     activity_col: str,
     timestamp_col: str,
+    table: Optional[CaseTable] = None,
 ) -> dict:
     """
     프로세스 개요 지표를 계산합니다.
@@ -31,26 +138,21 @@ def compute_overview(
         "avg_events_per_case": float,
     }
     """
-    ts = pd.to_datetime(df[timestamp_col], errors="coerce")
+    table = _ensure_table(table, df, case_col, activity_col, timestamp_col)
+    events, cases = table.events, table.cases
 
-    # 케이스별 시작/종료 시각
-    case_times = (
-        df.assign(_ts=ts)
-        .groupby(case_col)["_ts"]
-        .agg(["min", "max"])
-    )
-    case_durations_h = (case_times["max"] - case_times["min"]).dt.total_seconds() / 3600
-    events_per_case = df.groupby(case_col).size()
+    ts_min = cases["start"].min()
+    ts_max = cases["end"].max()
 
     return {
-        "n_cases":           int(df[case_col].nunique()),
-        "n_events":          int(len(df)),
-        "n_activities":      int(df[activity_col].nunique()),
-        "start_date":        ts.min().strftime("%Y-%m-%d") if pd.notna(ts.min()) else "-",
-        "end_date":          ts.max().strftime("%Y-%m-%d") if pd.notna(ts.max()) else "-",
-        "avg_case_duration_hours":    round(float(case_durations_h.mean()), 1),
-        "median_case_duration_hours": round(float(case_durations_h.median()), 1),
-        "avg_events_per_case":        round(float(events_per_case.mean()), 1),
+        "n_cases":           int(len(cases)),
+        "n_events":          int(len(events)),
+        "n_activities":      int(events["activity"].nunique()),
+        "start_date":        ts_min.strftime("%Y-%m-%d") if pd.notna(ts_min) else "-",
+        "end_date":          ts_max.strftime("%Y-%m-%d") if pd.notna(ts_max) else "-",
+        "avg_case_duration_hours":    round(float(cases["duration_h"].mean()), 1),
+        "median_case_duration_hours": round(float(cases["duration_h"].median()), 1),
+        "avg_events_per_case":        round(float(cases["n_events"].mean()), 1),
     }
 
 
@@ -59,6 +161,7 @@ def compute_activity_stats(
     case_col: str,
     activity_col: str,
     timestamp_col: str,
+    table: Optional[CaseTable] = None,
 ) -> pd.DataFrame:
     """
     활동별 통계를 계산합니다.
@@ -68,25 +171,28 @@ def compute_activity_stats(
     DataFrame with columns:
         activity, frequency, case_coverage_pct, avg_duration_hours
     """
-    ts = pd.to_datetime(df[timestamp_col], errors="coerce")
-    n_cases = df[case_col].nunique()
+    table = _ensure_table(table, df, case_col, activity_col, timestamp_col)
+    events = table.events
+    n_cases = len(table.cases)
+
+    by_activity = events.groupby("activity", observed=True)
 
     # 활동 빈도 & 케이스 커버리지
-    freq = df.groupby(activity_col).size().rename("frequency")
+    freq = by_activity.size().rename("frequency")
     coverage = (
-        df.groupby(activity_col)[case_col]
+        events[events["case_code"] >= 0]
+        .groupby("activity", observed=True)["case_code"]
         .nunique()
+        .div(n_cases)
+        .mul(100)
+        .round(1)
         .rename("case_coverage_pct")
-        .apply(lambda x: round(x / n_cases * 100, 1))
     )
 
     # 활동별 평균 소요 시간 (같은 케이스 내 다음 이벤트와의 시간 차)
-    work = df.assign(_ts=ts).sort_values([case_col, "_ts"])
-    work["_next_ts"] = work.groupby(case_col)["_ts"].shift(-1)
-    work["_duration_h"] = (work["_next_ts"] - work["_ts"]).dt.total_seconds() / 3600
     avg_duration = (
-        work[work["_duration_h"] >= 0]
-        .groupby(activity_col)["_duration_h"]
+        events[events["next_delta_h"] >= 0]
+        .groupby("activity", observed=True)["next_delta_h"]
         .mean()
         .round(1)
         .rename("avg_duration_hours")
@@ -94,11 +200,14 @@ def compute_activity_stats(
 
     result = (
         pd.concat([freq, coverage, avg_duration], axis=1)
+        .rename_axis("activity")
         .reset_index()
-        .rename(columns={activity_col: "activity"})
         .sort_values("frequency", ascending=False)
         .fillna({"avg_duration_hours": 0.0})
     )
+    if isinstance(result["activity"].dtype, pd.CategoricalDtype):
+        # 정규화된(category) 입력도 결과는 일반 문자열 컬럼으로 반환
+        result["activity"] = result["activity"].astype(result["activity"].cat.categories.dtype)
     return result
 
 
@@ -108,6 +217,7 @@ def compute_variants(
     activity_col: str,
     timestamp_col: str,
     top_n: int = 10,
+    table: Optional[CaseTable] = None,
 ) -> pd.DataFrame:
     """
     프로세스 바리언트(경로) 통계를 계산합니다.
@@ -117,37 +227,19 @@ def compute_variants(
     DataFrame with columns:
         variant, frequency, coverage_pct, avg_duration_hours
     """
-    ts = pd.to_datetime(df[timestamp_col], errors="coerce")
-
-    # 케이스별 활동 시퀀스
-    sequences = (
-        df.assign(_ts=ts)
-        .sort_values([case_col, "_ts"])
-        .groupby(case_col)[activity_col]
-        .apply(lambda s: " → ".join(s.astype(str).tolist()))
-        .rename("variant")
-        .reset_index()
-    )
-
-    # 케이스별 소요 시간
-    case_durations = (
-        df.assign(_ts=ts)
-        .groupby(case_col)["_ts"]
-        .agg(lambda s: (s.max() - s.min()).total_seconds() / 3600)
-        .rename("duration_h")
-        .reset_index()
-    )
-
-    merged = sequences.merge(case_durations, on=case_col)
+    table = _ensure_table(table, df, case_col, activity_col, timestamp_col)
+    cases = table.cases
 
     # 바리언트별 집계
-    total_cases = merged[case_col].nunique()
+    total_cases = len(cases)
     variant_stats = (
-        merged.groupby("variant")
+        cases.groupby("variant_id", sort=True)
         .agg(
-            frequency=(case_col, "count"),
+            frequency=("n_events", "size"),
             avg_duration_hours=("duration_h", "mean"),
         )
+        .sort_values("frequency", ascending=False, kind="stable")
+        .head(top_n)
         .reset_index()
     )
     variant_stats["coverage_pct"] = (
@@ -155,24 +247,22 @@ def compute_variants(
     ).round(1)
     variant_stats["avg_duration_hours"] = variant_stats["avg_duration_hours"].round(1)
 
-    return (
-        variant_stats
-        .sort_values("frequency", ascending=False)
-        .head(top_n)
-        .reset_index(drop=True)
-    )
+    # 표시 문자열은 반환할 상위 N개 바리언트에 대해서만 생성
+    variant_stats["variant"] = [
+        table.variants.label(v) for v in variant_stats["variant_id"]
+    ]
+
+    return variant_stats[
+        ["variant", "frequency", "avg_duration_hours", "coverage_pct"]
+    ].reset_index(drop=True)
 
 
 def compute_case_duration_distribution(
     df: pd.DataFrame,
     case_col: str,
     timestamp_col: str,
+    table: Optional[CaseTable] = None,
 ) -> pd.Series:
     """케이스 소요 시간 분포를 반환합니다 (시간 단위)."""
-    ts = pd.to_datetime(df[timestamp_col], errors="coerce")
-    case_durations = (
-        df.assign(_ts=ts)
-        .groupby(case_col)["_ts"]
-        .agg(lambda s: (s.max() - s.min()).total_seconds() / 3600)
-    )
-    return case_durations.dropna()
+    table = _ensure_table(table, df, case_col, None, timestamp_col)
+    return table.cases["duration_h"].dropna()
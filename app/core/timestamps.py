@@ -0,0 +1,341 @@
+"""
+타임스탬프 파싱 모듈
+컬럼 표본에서 날짜 형식(명시적 strptime 형식 · ISO 8601 · UNIX epoch 초/밀리초 · 시간대 오프셋)을
+추론한 뒤, 전체 컬럼을 그 형식으로 한 번에 벡터 파싱합니다.
+
+형식 없이 `pd.to_datetime`을 호출하면 형식이 섞인 컬럼에서 원소별 추론으로 떨어져 매우 느려지므로,
+모든 모듈은 이 모듈의 `parse_timestamps` / `infer_format`을 사용합니다.
+파싱 결과는 원본 컬럼(이름 + 내용 지문) 키로 캐시되어, 같은 컬럼을 다시 로드해도 재파싱하지 않습니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+TIMESTAMP_SAMPLE_SIZE = 200   # 형식 추론에 사용하는 표본 값 수
+PROBE_VALUES = 5              # 후보 형식을 표본 검증 전에 걸러내는 앞쪽 값 수
+MIN_SUCCESS_RATIO = 0.85      # 형식으로 인정하는 최소 파싱 성공률
+PARSE_CACHE_SIZE = 8          # 캐시에 보관할 파싱 결과(컬럼) 수
+
+# 자주 쓰이는 형식 후보 (guess_datetime_format 추측이 표본 검증에 실패했을 때 순서대로 시도)
+CANDIDATE_FORMATS = [
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d",
+    "%Y/%m/%d %H:%M:%S",
+    "%Y/%m/%d %H:%M",
+    "%Y/%m/%d",
+    "%Y.%m.%d %H:%M:%S",
+    "%Y.%m.%d",
+    "%d/%m/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y",
+    "%d.%m.%Y %H:%M:%S",
+    "%d.%m.%Y",
+    "%Y%m%d%H%M%S",
+    "%Y%m%d",
+]
+
+# 구분자 없는 형식 — 숫자열 컬럼(20240105)은 이 형식만 시도
+_COMPACT_FORMATS = [f for f in CANDIDATE_FORMATS if f.replace("%", "").isalpha()]
+
+# epoch 단위별로 1990-01-01 ~ 2100-01-01 범위에 해당하는 값 구간
+_EPOCH_RANGE_SECONDS = (631_152_000, 4_102_444_800)
+_EPOCH_UNITS = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+_OFFSET = re.compile(r"(?:Z|[+-]\d{2}:?\d{2})$")
+_NUMBER = re.compile(r"[+-]?\d+(?:\.\d*)?")
+# 날짜로 파싱될 수 있는 값은 숫자 묶음이 둘 이상이거나(2024-01-05, Jan 5 2024) 6자리 이상 숫자열(20240105)
+_DATE_HINT = re.compile(r"\d{1,4}\D+\d{1,2}|\d{6,}")
+
+
+# ─── 데이터 클래스 ───────────────────────────────────────────────────────────
+@dataclass(frozen=True)
+class TimestampFormat:
+    """
+    표본에서 추론한 타임스탬프 형식.
+
+    kind          : "datetime"(이미 datetime64) | "epoch" | "format" | "mixed" | "unparseable"
+    format        : strptime 형식 또는 "ISO8601" (kind == "format"일 때)
+    unit          : epoch 단위 "s" | "ms" | "us" | "ns" (kind == "epoch"일 때)
+    utc           : 시간대 오프셋이 있어 UTC 기준 tz-aware로 파싱하는지 여부
+    success_ratio : 표본 파싱 성공률 (0~1)
+    """
+    kind: str
+    format: Optional[str] = None
+    unit: Optional[str] = None
+    utc: bool = False
+    success_ratio: float = 0.0
+
+    @property
+    def parseable(self) -> bool:
+        return self.kind != "unparseable"
+
+
+_UNPARSEABLE = TimestampFormat("unparseable")
+
+
+# ─── 형식 추론 ──────────────────────────────────────────────────────────────
+def _sample_values(series: pd.Series, sample_size: int) -> pd.Series:
+    """결측을 제외하고 컬럼 전체 범위에서 고르게 sample_size개를 뽑습니다."""
+    values = series.dropna() if series.hasnans else series
+    if len(values) > sample_size:
+        positions = np.linspace(0, len(values) - 1, sample_size).astype(np.int64)
+        values = values.iloc[positions]
+    return values.reset_index(drop=True)
+
+
+def _epoch_unit(numbers: pd.Series) -> Optional[str]:
+    """모든 값이 같은 epoch 단위의 1990~2100년 범위에 들어가면 그 단위를 반환합니다."""
+    if numbers.isna().any():
+        return None
+    lo, hi = float(numbers.min()), float(numbers.max())
+    for unit, scale in _EPOCH_UNITS.items():
+        if _EPOCH_RANGE_SECONDS[0] * scale <= lo and hi <= _EPOCH_RANGE_SECONDS[1] * scale:
+            return unit
+    return None
+
+
+def _probe(values: list[str], fmt: str) -> bool:
+    """
+    앞쪽 값 중 하나라도 형식에 맞는지 Python 파서로 빠르게 확인합니다.
+    날짜가 아닌 컬럼에서 후보마다 pandas 파싱을 호출하지 않도록 표본 검증 전에 사용합니다.
+    """
+    for value in values:
+        try:
+            if fmt == "ISO8601":
+                datetime.fromisoformat(value)
+            else:
+                datetime.strptime(value, fmt)
+            return True
+        except ValueError:
+            continue
+    return False
+
+
+def _success_ratio(sample: list[str], **kwargs) -> float:
+    """주어진 to_datetime 인자로 표본을 파싱했을 때의 성공률."""
+    try:
+        parsed = pd.to_datetime(sample, errors="coerce", **kwargs)
+    except (ValueError, TypeError, OverflowError):
+        return 0.0
+    return float(parsed.notna().mean())
+
+
+def infer_format(
+    series: pd.Series,
+    sample_size: int = TIMESTAMP_SAMPLE_SIZE,
+) -> TimestampFormat:
+    """
+    컬럼 표본에서 타임스탬프 형식을 추론합니다.
+
+    1) datetime64 컬럼은 그대로 사용
+    2) 숫자(또는 숫자 문자열) 컬럼은 값 범위로 epoch 초 / 밀리초 / 마이크로초 / 나노초 판정
+    3) 문자열은 guess_datetime_format 추측 → ISO8601 → CANDIDATE_FORMATS 순으로 표본 검증
+    4) 어떤 명시적 형식도 MIN_SUCCESS_RATIO에 못 미치면 "mixed"(원소별 추론, 가장 느림)
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return TimestampFormat("datetime", success_ratio=1.0)
+
+    sample = _sample_values(series, sample_size)
+    if sample.empty or pd.api.types.is_bool_dtype(sample.dtype):
+        return _UNPARSEABLE
+
+    if pd.api.types.is_numeric_dtype(sample.dtype):
+        unit = _epoch_unit(sample)
+        return TimestampFormat("epoch", unit=unit, success_ratio=1.0) if unit else _UNPARSEABLE
+
+    # 표본이 작으므로 문자열 판정은 Python 리스트로 처리 (넓은 테이블에서 컬럼당 pandas 호출 비용 절감)
+    text = [str(value).strip() for value in sample.tolist()]
+    probe = text[:PROBE_VALUES]
+    if not any(_DATE_HINT.search(value) for value in probe):
+        return _UNPARSEABLE  # 코드 · 이름 등 — 후보 형식을 시도하지 않음
+
+    numeric = all(_NUMBER.fullmatch(value) for value in text)
+    if numeric:
+        unit = _epoch_unit(pd.Series(text, dtype="float64"))
+        if unit:
+            return TimestampFormat("epoch", unit=unit, success_ratio=1.0)
+
+    utc = any(_OFFSET.search(value) for value in text)
+    if numeric:
+        candidates = _COMPACT_FORMATS
+    else:
+        candidates = []
+        with warnings.catch_warnings():  # 일/월 순서 모호성 경고 — 아래 표본 검증으로 판정
+            warnings.simplefilter("ignore", UserWarning)
+            guessed = guess_datetime_format(text[0])
+        if guessed:
+            candidates.append(guessed)
+        candidates.append("ISO8601")
+        candidates.extend(f for f in CANDIDATE_FORMATS if f not in candidates)
+
+    best = _UNPARSEABLE
+    for fmt in candidates:
+        if not _probe(probe, fmt):
+            continue
+        ratio = _success_ratio(text, format=fmt, utc=utc)
+        if ratio > best.success_ratio:
+            best = TimestampFormat("format", format=fmt, utc=utc, success_ratio=ratio)
+        if ratio == 1.0:
+            return best
+    if best.success_ratio >= MIN_SUCCESS_RATIO or numeric:
+        return best if best.success_ratio > 0 else _UNPARSEABLE
+
+    # 명시적 형식으로 충분히 파싱되지 않으면 원소별 추론 (시간대가 섞일 수 있으므로 UTC 기준)
+    if _success_ratio(probe, format="mixed", utc=True) == 0:
+        return best if best.success_ratio > 0 else _UNPARSEABLE
+    ratio = _success_ratio(text, format="mixed", utc=True)
+    if ratio >= MIN_SUCCESS_RATIO:
+        return TimestampFormat("mixed", format="mixed", utc=True, success_ratio=ratio)
+    return best if best.success_ratio > 0 else _UNPARSEABLE
+
+
+# ─── 파싱 ───────────────────────────────────────────────────────────────────
+def _strptime(values: pd.Series, fmt: str, utc: bool) -> Optional[pd.Series]:
+    """
+    pyarrow strptime으로 명시적 형식을 파싱합니다 (pandas의 비 ISO 형식 파서보다 수십 배 빠름).
+    pyarrow가 지원하지 않는 형식(%f)이거나 문자열로 변환할 수 없으면 None.
+    """
+    if "%f" in fmt:
+        return None
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    try:
+        array = pa.array(values, type=pa.string(), from_pandas=True)
+        parsed = pc.strptime(array, format=fmt, unit="ns", error_is_null=True)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    result = pd.Series(parsed.to_pandas(), index=values.index)
+    if utc and result.dt.tz is None:
+        result = result.dt.tz_localize("UTC")
+    return result
+
+
+def _parse(series: pd.Series, fmt: TimestampFormat) -> pd.Series:
+    """추론된 형식으로 전체 컬럼을 벡터 파싱합니다. 실패 값은 NaT."""
+    if fmt.kind == "datetime":
+        parsed = series
+    elif fmt.kind == "epoch":
+        numbers = pd.to_numeric(series, errors="coerce")
+        parsed = pd.to_datetime(numbers, unit=fmt.unit, errors="coerce")
+    elif fmt.kind in ("format", "mixed"):
+        values = series if pd.api.types.is_string_dtype(series.dtype) else series.astype("str")
+        parsed = None
+        if fmt.format not in ("ISO8601", "mixed"):
+            parsed = _strptime(values, fmt.format, fmt.utc)
+        if parsed is None:  # ISO 8601 계열은 pandas 고속 경로 사용
+            parsed = pd.to_datetime(values, format=fmt.format, errors="coerce", utc=fmt.utc)
+    else:
+        parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+    return parsed.dt.as_unit("ns").rename(series.name)
+
+
+def _column_key(series: pd.Series) -> tuple:
+    """
+    원본 컬럼 캐시 키 (컬럼명 + 행 수 + dtype + 내용 지문).
+    지문은 Arrow 변환 결과의 버퍼를 그대로 해시합니다. category 컬럼(Arrow 버퍼가 코드만 담고
+    사전은 빠짐)과 변환할 수 없는 혼합 타입 컬럼은 원소별 해시(hash_pandas_object)를 사용합니다.
+    """
+    import pyarrow as pa
+
+    chunked = None
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        try:
+            chunked = pa.chunked_array([pa.array(series, from_pandas=True)])
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+    digest = hashlib.sha1()
+    if chunked is None:
+        digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+    else:
+        for chunk in chunked.chunks:
+            digest.update(f"{chunk.offset}:{len(chunk)}".encode())
+            for buffer in chunk.buffers():
+                if buffer is not None:
+                    digest.update(buffer)
+    return (series.name, len(series), str(series.dtype), digest.hexdigest())
+
+
+class _ParseCache:
+    """원본 컬럼 키 → (형식, 파싱된 값 배열) LRU 캐시. Streamlit 세션 간에 공유됩니다."""
+
+    def __init__(self, max_entries: int = PARSE_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = _ParseCache()
+
+
+def parse_timestamps(
+    series: pd.Series,
+    fmt: Optional[TimestampFormat] = None,
+    use_cache: bool = True,
+) -> pd.Series:
+    """
+    컬럼을 datetime64[ns] Series로 파싱합니다 (파싱 실패 값은 NaT, 인덱스는 원본 유지).
+
+    Parameters
+    ----------
+    series    : 원본 컬럼 (문자열 / 숫자 epoch / datetime)
+    fmt       : 미리 추론한 형식. None이면 표본에서 추론
+    use_cache : 같은 원본 컬럼의 이전 파싱 결과를 재사용할지 여부
+
+    시간대 오프셋이 있는 컬럼은 UTC 기준 tz-aware로, 나머지는 tz-naive로 반환합니다.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series.dt.as_unit("ns")
+
+    key = _column_key(series) if use_cache else None
+    entry = _cache.get(key) if key else None
+    if entry is not None and (fmt is None or entry[0] == fmt):
+        return pd.Series(entry[1], index=series.index, name=series.name, copy=False)
+
+    fmt = fmt or infer_format(series)
+    parsed = _parse(series, fmt)
+    if key:
+        _cache.put(key, (fmt, parsed.array))
+    return parsed
+
+
+def clear_cache() -> None:
+    """파싱 결과 캐시를 비웁니다."""
+    _cache.clear()
@@ -0,0 +1,140 @@
+"""
+바리언트 엔진 모듈
+활동을 정수 코드로 인코딩하고, 케이스별 활동 시퀀스를 NumPy 벡터 연산으로 해시하여
+바리언트 ID를 부여합니다. 표시 문자열("A → B → C")은 요청된 바리언트에 대해서만 생성합니다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+# splitmix64 상수
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_SEEDS = (np.uint64(0x243F6A8885A308D3), np.uint64(0x13198A2E03707344))
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """uint64 배열에 splitmix64 finalizer를 적용합니다 (오버플로는 mod 2^64)."""
+    x = x + _GOLDEN
+    x = (x ^ (x >> np.uint64(30))) * _MIX_1
+    x = (x ^ (x >> np.uint64(27))) * _MIX_2
+    return x ^ (x >> np.uint64(31))
+
+
+def encode_activities(activity: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """
+    활동명을 0부터 시작하는 작은 정수 코드로 변환합니다.
+
+    Returns
+    -------
+    (코드 배열(int32), 코드 → 활동명 Index)
+    결측 활동은 코드 -1
+    """
+    codes, labels = pd.factorize(activity)
+    return codes.astype(np.int32, copy=False), pd.Index(labels)
+
+
+def case_boundaries(case_codes: np.ndarray) -> np.ndarray:
+    """케이스 순으로 정렬된 코드 배열에서 각 케이스의 시작 위치를 반환합니다."""
+    if len(case_codes) == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.flatnonzero(np.r_[True, case_codes[1:] != case_codes[:-1]])
+
+
+# ─── 결과 데이터 클래스 ──────────────────────────────────────────────────────
+@dataclass
+class VariantIndex:
+    """
+    케이스별 바리언트 ID와 표시 문자열 생성에 필요한 최소 정보.
+
+    variant_id : 케이스별 바리언트 ID (케이스 순서, 첫 등장 순으로 0, 1, 2, ...)
+    starts     : 정렬된 이벤트 배열에서 케이스별 시작 위치
+    act_codes  : 정렬된 이벤트의 활동 코드
+    activities : 코드 → 활동명
+    """
+    variant_id: np.ndarray
+    starts: np.ndarray
+    act_codes: np.ndarray
+    activities: pd.Index
+
+    @property
+    def n_variants(self) -> int:
+        return int(self.variant_id.max()) + 1 if len(self.variant_id) else 0
+
+    def counts(self) -> np.ndarray:
+        """바리언트별 케이스 수."""
+        return np.bincount(self.variant_id, minlength=self.n_variants)
+
+    @cached_property
+    def representatives(self) -> np.ndarray:
+        """바리언트별 대표 케이스(첫 등장 케이스)의 위치."""
+        first = np.full(self.n_variants, -1, dtype=np.int64)
+        # 뒤에서부터 채워 가장 앞선 케이스가 남도록 함
+        idx = np.arange(len(self.variant_id))[::-1]
+        first[self.variant_id[::-1]] = idx
+        return first
+
+    def top(self, n: int) -> np.ndarray:
+        """케이스 수 내림차순 상위 n개 바리언트 ID (동률은 첫 등장 순)."""
+        counts = self.counts()
+        return np.argsort(-counts, kind="stable")[:n]
+
+    def codes(self, variant_id: int) -> np.ndarray:
+        """바리언트의 활동 코드 시퀀스."""
+        case = int(self.representatives[variant_id])
+        end = self.starts[case + 1] if case + 1 < len(self.starts) else len(self.act_codes)
+        return self.act_codes[self.starts[case]:end]
+
+    def sequence(self, variant_id: int) -> list[str]:
+        """바리언트의 활동명 시퀀스."""
+        return [str(self.activities[c]) if c >= 0 else "nan" for c in self.codes(variant_id)]
+
+    def label(self, variant_id: int, sep: str = " → ") -> str:
+        """바리언트의 표시 문자열."""
+        return sep.join(self.sequence(variant_id))
+
+
+# ─── 바리언트 계산 ────────────────────────────────────────────────────────────
+def build_variant_index(
+    case_codes: np.ndarray,
+    act_codes: np.ndarray,
+    activities: pd.Index,
+) -> VariantIndex:
+    """
+    케이스별 바리언트 ID를 계산합니다.
+
+    Parameters
+    ----------
+    case_codes : (케이스, 시각) 순으로 정렬된 이벤트의 케이스 코드 (같은 케이스는 연속)
+    act_codes  : 같은 순서의 활동 코드 (`encode_activities` 결과)
+    activities : 코드 → 활동명
+
+    각 이벤트의 (케이스 내 위치, 활동 코드)를 splitmix64로 섞은 값을 케이스 단위로 합산하여
+    순서를 반영한 64bit 해시 2개를 만들고, (해시1, 해시2, 길이) 조합으로 바리언트를 구분합니다.
+    """
+    starts = case_boundaries(case_codes)
+    n_events = len(case_codes)
+    if n_events == 0:
+        return VariantIndex(np.empty(0, dtype=np.int64), starts, act_codes, activities)
+
+    lengths = np.diff(np.append(starts, n_events))
+    position = np.arange(n_events, dtype=np.int64) - np.repeat(starts, lengths)
+    token = (position.astype(np.uint64) << np.uint64(32)) | (
+        (act_codes.astype(np.int64) + 1).astype(np.uint64)
+    )
+
+    with np.errstate(over="ignore"):
+        hashes = [np.add.reduceat(_splitmix64(token ^ seed), starts) for seed in _SEEDS]
+
+    variant_id = (
+        pd.DataFrame({"h1": hashes[0], "h2": hashes[1], "n": lengths})
+        .groupby(["h1", "h2", "n"], sort=False)
+        .ngroup()
+        .to_numpy()
+    )
+    return VariantIndex(variant_id, starts, act_codes, activities)
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import tempfile
 import os
-from typing import Any
+from typing import Any, Optional
 
 # ─── SVG Pan/Zoom HTML 템플릿 ────────────────────────────────────────────────
 _SVG_TEMPLATE = """<!DOCTYPE html>
@@ -253,6 +253,74 @@ def _fmt_dur(seconds: float) -> str:
         return f"{seconds / 86400:.1f}일"
 
 
+# ─── Petri Net 성능 오버레이 헬퍼 함수 ────────────────────────────────────────
+def _light_freq_color(freq: int, max_freq: int) -> str:
+    """
+    빈도 기반 연한 파랑 → 중간 파랑 색상 (hex 문자열).
+    PM4Py Petri Net 전이는 글자색이 검정으로 고정되어 진한 색을 쓰지 않습니다.
+    """
+    t = max(0.0, min(1.0, freq / max_freq)) if max_freq else 0.0
+    r = int(235 + (93  - 235) * t)
+    g = int(245 + (173 - 245) * t)
+    b = int(251 + (226 - 251) * t)
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def _petri_decorations(net: Any, enhancement: Any) -> dict:
+    """
+    EnhancedNet(이름 기준 통계)을 PM4Py Petri Net 시각화 decorations({요소: 속성})로 변환합니다.
+
+    · 전이     : 발화 횟수 레이블 + 빈도 기반 파란색 (숨은 전이는 기본 검정 유지)
+    · 플레이스 : 평균 체류 시간 레이블 + 성능 기반 초록 → 노랑 → 빨강
+    · 아크     : 토큰 이동 빈도 비례 두께 (1 ~ 6 px), 플레이스 → 전이 아크는 체류 시간 색상
+    """
+    decorations: dict = {}
+
+    trans_freq = enhancement.transition_frequency
+    visible_max = max(
+        (trans_freq.get(t.name, 0) for t in net.transitions if t.label is not None), default=0
+    )
+    for t in net.transitions:
+        if t.label is None:
+            continue
+        freq = trans_freq.get(t.name, 0)
+        decorations[t] = {
+            "label": f"{t.label}\n{freq:,}회",
+            "color": _light_freq_color(freq, visible_max),
+        }
+
+    sojourn = enhancement.place_sojourn
+    means = [v["mean"] for v in sojourn.values()]
+    max_mean = max(means, default=0.0)
+    min_mean = min(means, default=0.0)
+    for p in net.places:
+        stats = sojourn.get(p.name)
+        if stats is None:
+            continue
+        t = (stats["mean"] - min_mean) / (max_mean - min_mean) if max_mean > min_mean else 0.5
+        decorations[p] = {"label": _fmt_dur(stats["mean"]), "color": _perf_color(t)}
+
+    arc_freq = enhancement.arc_frequency
+    freq_vals = list(arc_freq.values())
+    max_freq = max(freq_vals, default=0)
+    min_freq = min(freq_vals, default=0)
+    arc_perf = enhancement.arc_sojourn
+    perf_vals = list(arc_perf.values())
+    max_perf = max(perf_vals, default=0.0)
+    min_perf = min(perf_vals, default=0.0)
+    for a in net.arcs:
+        key = (a.source.name, a.target.name)
+        freq = arc_freq.get(key, 0)
+        nf = (freq - min_freq) / (max_freq - min_freq) if max_freq > min_freq else 0.5
+        decoration = {"penwidth": f"{1.0 + nf * 5.0:.1f}", "label": f"{freq:,}"}
+        perf = arc_perf.get(key)
+        if perf is not None:
+            np_ = (perf - min_perf) / (max_perf - min_perf) if max_perf > min_perf else 0.5
+            decoration["color"] = _perf_color(np_)
+        decorations[a] = decoration
+    return decorations
+
+
 # ─── 공개 API ────────────────────────────────────────────────────────────────
 class ProcessVisualizer:
     """Process Mining 모델을 인터랙티브 HTML로 렌더링합니다."""
@@ -301,6 +369,7 @@ class ProcessVisualizer:
         end_activities: dict,
         activities_count: dict,
         height: int = 640,
+        performance_stats: Optional[dict] = None,
     ) -> str:
         """
         빈도(Frequency) + 성능(Performance)을 결합한 DFG를 한 화면에 렌더링합니다.
@@ -319,6 +388,7 @@ class ProcessVisualizer:
         start_activities : {activity: frequency}
         end_activities   : {activity: frequency}
         activities_count : {activity: event_count}
+        performance_stats: {(src, tgt): {"mean", "median", "p90", "max"}} — 엣지 툴팁 (선택)
         """
         try:
             import graphviz
@@ -461,6 +531,19 @@ class ProcessVisualizer:
                 else:
                     lbl = f"{freq:,}"
 
+                # 툴팁 (평균 / 중앙값 / p90 / 최대)
+                arc_stats = (performance_stats or {}).get((src, tgt))
+                if arc_stats:
+                    tooltip = (
+                        f"{src} → {tgt}\n"
+                        f"평균 {_fmt_dur(arc_stats['mean'])} · "
+                        f"중앙값 {_fmt_dur(arc_stats['median'])} · "
+                        f"p90 {_fmt_dur(arc_stats['p90'])} · "
+                        f"최대 {_fmt_dur(arc_stats['max'])}"
+                    )
+                else:
+                    tooltip = f"{src} → {tgt}"
+
                 dot.edge(
                     src, tgt,
                     label=lbl,
@@ -468,6 +551,7 @@ class ProcessVisualizer:
                     color=ecolor,
                     fontsize="9",
                     fontcolor="#555555",
+                    tooltip=tooltip,
                 )
 
             svg = _model_to_svg(dot)
@@ -482,12 +566,25 @@ class ProcessVisualizer:
         im: Any,
         fm: Any,
         height: int = 620,
+        enhancement: Optional[Any] = None,
     ) -> str:
-        """Petri Net을 HTML로 렌더링합니다."""
+        """
+        Petri Net을 HTML로 렌더링합니다.
+
+        enhancement(`core.enhancer.EnhancedNet`)를 주면 전이 발화 빈도 · 플레이스 체류 시간 ·
+        아크 빈도를 색상과 두께로 겹쳐 그립니다 (재생 없이 계산된 통계만 사용).
+        """
         from pm4py.visualization.petri_net import visualizer as pn_vis
 
         try:
-            gviz = pn_vis.apply(net, im, fm)
+            if enhancement is None:
+                gviz = pn_vis.apply(net, im, fm)
+            else:
+                gviz = pn_vis.apply(
+                    net, im, fm,
+                    aggregated_statistics=_petri_decorations(net, enhancement),
+                    variant=pn_vis.Variants.PERFORMANCE,
+                )
             svg = _model_to_svg(gviz)
             return _wrap_svg(svg, height=height)
         except Exception as e:
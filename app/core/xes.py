@@ -0,0 +1,362 @@
+"""
+XES 입출력 모듈
+IEEE XES(eXtensible Event Stream) 이벤트 로그를 스트리밍으로 읽고 씁니다.
+
+PM4Py 기본 XES 리더는 전체 로그를 Python 객체(EventLog)로 메모리에 올리지만,
+이 모듈은 iterparse로 trace 단위로 읽고 처리한 요소는 즉시 해제하므로
+로그 크기와 관계없이 배치 크기만큼의 메모리만 사용합니다.
+읽은 결과는 `build_event_log(output="dataframe")`와 같은 표준 컬럼 배치(DataFrame)입니다.
+"""
+from __future__ import annotations
+
+import gzip
+import io
+import os
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional, Union
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+import pandas as pd
+
+from core.loader import _open_decompressed, detect_compression
+from core.timestamps import TimestampFormat, parse_timestamps
+
+XES_BATCH_EVENTS = 100_000   # 읽기 · 쓰기 배치당 최대 이벤트 수 (trace 경계에서 나눔)
+
+CASE_PREFIX = "case:"
+# 표준 컬럼 순서 (build_event_log 결과와 동일)
+CANONICAL_COLUMNS = [
+    "case:concept:name", "concept:name", "time:timestamp", "org:resource",
+]
+INDEX_COLUMNS = ["@@index", "@@case_index"]
+
+_SIMPLE_TYPES = {"string", "date", "int", "float", "boolean", "id"}
+# XES date 속성은 표준상 ISO 8601 (오프셋 포함) — 추론 없이 UTC 기준으로 파싱
+_XES_DATE_FORMAT = TimestampFormat("format", format="ISO8601", utc=True)
+
+
+# ─── 읽기 ─────────────────────────────────────────────────────────────────────
+def _local(tag: str) -> str:
+    """네임스페이스를 제거한 태그명."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _open_source(source) -> tuple[IO[bytes], Optional[IO[bytes]]]:
+    """
+    XES 입력 스트림을 엽니다. gzip 등 압축 파일은 압축을 풀면서 읽습니다.
+
+    Returns
+    -------
+    (읽을 스트림, 함수 안에서 연 원본 파일 — 닫아야 하면 값이 있음)
+    """
+    owned = None
+    if isinstance(source, (str, os.PathLike)):
+        source = owned = open(source, "rb")
+    compression = detect_compression(source)
+    if compression is None:
+        return source, owned
+    return _open_decompressed(source, compression), owned
+
+
+def _convert(values: list, xes_type: str) -> pd.Series:
+    """XES 속성 문자열 값을 선언된 타입에 맞게 변환합니다."""
+    series = pd.Series(values, dtype=object)
+    if xes_type == "date":
+        return parse_timestamps(series, _XES_DATE_FORMAT, use_cache=False)
+    if xes_type in ("int", "float"):
+        return pd.to_numeric(series, errors="coerce")
+    if xes_type == "boolean":
+        return series.map({"true": True, "false": False})
+    return series.astype("string")  # 결측은 NA 유지 ("str"은 pandas 2에서 None → "None")
+
+
+def _build_batch(
+    columns: dict[str, list],
+    types: dict[str, str],
+    n_events: int,
+    first_index: int,
+    case_index: list[int],
+) -> pd.DataFrame:
+    """수집한 속성 값 목록으로 배치 DataFrame을 만듭니다 (표준 컬럼 → 나머지 순)."""
+    data = {}
+    ordered = [c for c in CANONICAL_COLUMNS if c in columns]
+    ordered += sorted(c for c in columns if c not in CANONICAL_COLUMNS)
+    for key in ordered:
+        values = columns[key]
+        if len(values) < n_events:  # 배치 뒤쪽 이벤트에만 있는 속성
+            values.extend([None] * (n_events - len(values)))
+        data[key] = _convert(values, types[key])
+    data["@@index"] = np.arange(first_index, first_index + n_events, dtype=np.int64)
+    data["@@case_index"] = np.asarray(case_index, dtype=np.int64)
+    return pd.DataFrame(data)
+
+
+def iter_xes(
+    source,
+    batch_size: int = XES_BATCH_EVENTS,
+    attributes: Optional[list[str]] = None,
+    max_events: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    XES 파일을 스트리밍으로 읽어 이벤트 DataFrame 배치를 차례로 반환합니다.
+
+    Parameters
+    ----------
+    source     : 경로 또는 바이너리 file-like (gzip · zstd 등 압축 파일 가능)
+    batch_size : 배치당 이벤트 수. 한 trace는 한 배치에만 들어가도록 trace 경계에서 나눕니다.
+    attributes : 읽을 컬럼 목록 (None이면 전체). trace 속성은 `case:` 접두어가 붙은 이름입니다.
+    max_events : 읽을 최대 이벤트 수 (미리보기용, None이면 전체)
+
+    각 배치의 컬럼은 `build_event_log(output="dataframe")`와 같습니다.
+      case:concept:name, concept:name, time:timestamp(UTC), org:resource, 그 외 속성,
+      @@index(로그 전체 이벤트 순번), @@case_index(로그 전체 trace 순번)
+    list / container 같은 중첩 속성과 로그 수준 속성은 읽지 않습니다.
+    """
+    stream, owned = _open_source(source)
+    wanted = set(attributes) if attributes is not None else None
+
+    columns: dict[str, list] = {}
+    types: dict[str, str] = {}
+    case_index: list[int] = []
+    n_batch = 0          # 현재 배치의 이벤트 수
+    n_total = 0          # 지금까지 읽은 이벤트 수
+    n_traces = 0
+    first_index = 0
+
+    trace_attrs: dict[str, tuple[str, str]] = {}
+    trace_events: Optional[list[dict[str, tuple[str, str]]]] = None  # trace 밖이면 None
+    event: Optional[dict[str, tuple[str, str]]] = None
+    depth = 0            # trace/event 바로 아래 속성만 읽기 위한 중첩 깊이
+    root = None
+
+    def _keep(key: str) -> bool:
+        return wanted is None or key in wanted
+
+    try:
+        for kind, elem in iterparse(stream, events=("start", "end")):
+            tag = _local(elem.tag)
+            if root is None:
+                root = elem
+            if kind == "start":
+                if tag == "trace":
+                    trace_attrs, trace_events, depth = {}, [], 0
+                elif tag == "event":
+                    event, depth = {}, 0
+                elif tag in _SIMPLE_TYPES or tag in ("list", "container"):
+                    depth += 1
+                continue
+
+            # ── end ──
+            if tag in _SIMPLE_TYPES or tag in ("list", "container"):
+                depth -= 1
+                if tag in _SIMPLE_TYPES and depth == 0 and "key" in elem.attrib:
+                    key = elem.attrib["key"]
+                    value = (tag, elem.attrib.get("value"))
+                    if event is not None:
+                        event[key] = value
+                    elif trace_events is not None:
+                        trace_attrs[CASE_PREFIX + key] = value
+            elif tag == "event" and event is not None:
+                trace_events.append(event)
+                event = None
+            elif tag == "trace":
+                if max_events is not None:
+                    trace_events = trace_events[: max_events - n_total]
+                for ev in trace_events:
+                    for key, (xes_type, value) in (*trace_attrs.items(), *ev.items()):
+                        if not _keep(key):
+                            continue
+                        values = columns.get(key)
+                        if values is None:
+                            values = columns[key] = [None] * n_batch
+                            types[key] = xes_type
+                        elif len(values) < n_batch:
+                            values.extend([None] * (n_batch - len(values)))
+                        values.append(value)
+                    case_index.append(n_traces)
+                    n_batch += 1
+                n_total += len(trace_events)
+                n_traces += 1
+                trace_events = None
+                root.clear()  # 처리한 trace 해제 (메모리 상한 유지)
+
+                done = max_events is not None and n_total >= max_events
+                if n_batch and (n_batch >= batch_size or done):
+                    yield _build_batch(columns, types, n_batch, first_index, case_index)
+                    first_index += n_batch
+                    columns, case_index, n_batch = {}, [], 0
+                if done:
+                    return
+        if n_batch:
+            yield _build_batch(columns, types, n_batch, first_index, case_index)
+    finally:
+        if owned is not None:
+            owned.close()
+
+
+def load_xes(
+    source,
+    columns: Optional[list[str]] = None,
+    nrows: Optional[int] = None,
+    batch_size: int = XES_BATCH_EVENTS,
+) -> pd.DataFrame:
+    """
+    XES 파일 전체(또는 앞 nrows 이벤트)를 하나의 DataFrame으로 로드합니다.
+    @@index · @@case_index 보조 컬럼은 제외합니다 (`build_event_log`가 다시 만듦).
+
+    Parameters
+    ----------
+    source  : 경로 또는 바이너리 file-like (Streamlit UploadedFile, 압축 파일 가능)
+    columns : 반환할 컬럼 목록 (None이면 전체)
+    nrows   : 앞에서부터 읽을 이벤트 수 (미리보기용, None이면 전체)
+    """
+    batches = [
+        batch.drop(columns=INDEX_COLUMNS)
+        for batch in iter_xes(source, batch_size, attributes=columns, max_events=nrows)
+    ]
+    if not batches:
+        return pd.DataFrame(columns=columns or CANONICAL_COLUMNS[:3])
+    df = batches[0] if len(batches) == 1 else pd.concat(batches, ignore_index=True)
+    if columns is not None:
+        df = df.reindex(columns=columns)
+    return df
+
+
+# ─── 쓰기 ─────────────────────────────────────────────────────────────────────
+_XES_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8" ?>\n'
+    '<log xes.version="1.0" xes.features="nested-attributes" '
+    'xmlns="http://www.xes-standard.org/">\n'
+    '\t<extension name="Concept" prefix="concept" uri="http://www.xes-standard.org/concept.xesext"/>\n'
+    '\t<extension name="Time" prefix="time" uri="http://www.xes-standard.org/time.xesext"/>\n'
+    '\t<extension name="Organizational" prefix="org" uri="http://www.xes-standard.org/org.xesext"/>\n'
+    '\t<extension name="Lifecycle" prefix="lifecycle" uri="http://www.xes-standard.org/lifecycle.xesext"/>\n'
+)
+
+
+def _xes_type(series: pd.Series) -> str:
+    """컬럼 dtype에 대응하는 XES 속성 타입."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return "date"
+    if pd.api.types.is_bool_dtype(series):
+        return "boolean"
+    if pd.api.types.is_integer_dtype(series):
+        return "int"
+    if pd.api.types.is_float_dtype(series):
+        return "float"
+    return "string"
+
+
+def _attribute_tags(series: pd.Series, xes_type: str, head: str) -> np.ndarray:
+    """
+    컬럼 값마다 `{head}"값"/>` 태그 문자열을 만듭니다 (결측은 빈 문자열).
+    문자열 값은 고유값에 대해서만 XML 이스케이프하고 코드로 펼칩니다.
+    """
+    missing = series.isna().to_numpy()
+    if xes_type == "date":
+        ts = series.dt.tz_convert("UTC") if series.dt.tz is not None else series
+        text = np.datetime_as_string(ts.to_numpy(dtype="datetime64[us]"), unit="us")
+        suffix = '+00:00"/>\n' if series.dt.tz is not None else '"/>\n'
+        tags = (head + '"') + text.astype(object) + suffix
+    elif xes_type == "string":
+        codes, uniques = pd.factorize(series)
+        quoted = np.array([f"{head}{quoteattr(str(u))}/>\n" for u in uniques] + [""], dtype=object)
+        return quoted[codes]  # 결측 코드 -1 → 빈 문자열
+    else:
+        values = series.map({True: "true", False: "false"}) if xes_type == "boolean" else series
+        values = values.to_numpy(dtype=object)
+        values[missing] = ""
+        tags = (head + '"') + values.astype(str).astype(object) + '"/>\n'
+    tags = np.asarray(tags, dtype=object)
+    tags[missing] = ""
+    return tags
+
+
+def _attribute_lines(frame: pd.DataFrame, indent: str) -> np.ndarray:
+    """행마다 `<type key=... value=.../>` 속성 XML 문자열을 만듭니다."""
+    lines = np.full(len(frame), "", dtype=object)
+    for col in frame.columns:
+        xes_type = _xes_type(frame[col])
+        key = col[len(CASE_PREFIX):] if col.startswith(CASE_PREFIX) else col
+        lines += _attribute_tags(frame[col], xes_type, f"{indent}<{xes_type} key={quoteattr(key)} value=")
+    return lines
+
+
+def _write_frame(out: IO[str], frame: pd.DataFrame, case_col: str) -> None:
+    """
+    DataFrame의 trace들을 씁니다. 같은 케이스의 이벤트는 연속되어 있어야 합니다.
+    XES_BATCH_EVENTS 이벤트 안팎의 trace 묶음 단위로 XML 문자열을 만들어 씁니다.
+    """
+    if frame.empty:
+        return
+    frame = frame.drop(columns=[c for c in INDEX_COLUMNS if c in frame.columns])
+    trace_cols = [c for c in frame.columns if c.startswith(CASE_PREFIX)]
+    event_cols = [c for c in frame.columns if not c.startswith(CASE_PREFIX)]
+
+    codes, _ = pd.factorize(frame[case_col])
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.append(starts[1:], len(frame))
+
+    # trace 경계에서 XES_BATCH_EVENTS 이벤트씩 묶어 처리
+    group = starts // XES_BATCH_EVENTS
+    cuts = np.flatnonzero(np.r_[True, group[1:] != group[:-1], True])
+    for lo, hi in zip(cuts[:-1].tolist(), cuts[1:].tolist()):
+        first, last = int(starts[lo]), int(ends[hi - 1])
+        trace_lines = _attribute_lines(frame[trace_cols].iloc[starts[lo:hi]], "\t\t")
+        event_lines = _attribute_lines(frame[event_cols].iloc[first:last], "\t\t\t")
+        parts: list[str] = []
+        for i in range(hi - lo):
+            parts.append("\t<trace>\n")
+            parts.append(trace_lines[i])
+            for line in event_lines[starts[lo + i] - first:ends[lo + i] - first]:
+                parts.append("\t\t<event>\n")
+                parts.append(line)
+                parts.append("\t\t</event>\n")
+            parts.append("\t</trace>\n")
+        out.write("".join(parts))
+
+
+def write_xes(
+    log: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    target: Union[str, os.PathLike, IO[bytes]],
+    case_col: str = "case:concept:name",
+) -> None:
+    """
+    이벤트 DataFrame(또는 DataFrame 배치 스트림)을 XES로 스트리밍 저장합니다.
+
+    Parameters
+    ----------
+    log      : PM4Py 형식 DataFrame (build_event_log 결과 등) 또는 `iter_xes` 같은 배치 이터러블.
+               배치 이터러블은 한 케이스가 여러 배치에 걸치지 않아야 합니다.
+    target   : 경로(.gz 확장자면 gzip 압축) 또는 바이너리 file-like
+    case_col : Case ID 컬럼명
+
+    `case:` 접두어 컬럼은 trace 속성(케이스 첫 이벤트 값), 나머지는 event 속성으로 씁니다.
+    XML 트리를 만들지 않고 배치 단위로 바로 쓰므로 메모리 사용량은 배치 크기에 비례합니다.
+    """
+    if isinstance(log, pd.DataFrame):
+        # 케이스별로 이벤트가 연속되도록 정렬 (케이스 첫 등장 순서 · 원래 이벤트 순서 유지)
+        codes, _ = pd.factorize(log[case_col])
+        order = np.argsort(codes, kind="stable")
+        log = [log.take(order)]
+
+    owned = None
+    if isinstance(target, (str, os.PathLike)):
+        path = Path(target)
+        raw = owned = gzip.open(path, "wb") if path.suffix == ".gz" else open(path, "wb")
+    else:
+        raw = target
+
+    out = io.TextIOWrapper(raw, encoding="utf-8", write_through=False)
+    try:
+        out.write(_XES_HEADER)
+        for frame in log:
+            _write_frame(out, frame, case_col)
+        out.write("</log>\n")
+        out.flush()
+    finally:
+        out.detach()
+        if owned is not None:
+            owned.close()
@@ -5,8 +5,10 @@ Process Mining App — 메인 진입점
 """
 from __future__ import annotations
 
+import hashlib
 import os
 import sys
+from typing import Optional
 
 # core/ 패키지 임포트 경로 설정
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -16,16 +18,34 @@ import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from core.column_mapper import ColumnMapper
-from core.loader import load_csv, load_excel, load_sample
-from core.miner import ProcessMiner, build_event_log
+from core.cache import MinerCache, log_fingerprint
+from core.column_mapper import ColumnMapper, MappingStore, profile_columns, schema_fingerprint
+from core.conformance import ConformanceCache, check_conformance, model_fingerprint
+from core.connector import DatabaseConnector
+from core.loader import (
+    COMPRESSED_SUFFIXES,
+    PREVIEW_ROWS,
+    file_fingerprint,
+    list_sheets,
+    load_arrow,
+    load_cached,
+    load_csv,
+    load_excel,
+    load_parquet,
+    load_sample,
+    normalize_dtypes,
+)
+from core.miner import MinerResult, ProcessMiner, build_event_log
 from core.stats import (
+    CaseTable,
+    build_case_table,
     compute_activity_stats,
     compute_case_duration_distribution,
     compute_overview,
     compute_variants,
 )
 from core.visualizer import ProcessVisualizer
+from core.xes import load_xes
 
 # ─── 페이지 설정 ─────────────────────────────────────────────────────────────
 st.set_page_config(
@@ -37,18 +57,38 @@ st.set_page_config(
 
 # ─── 세션 상태 초기화 ─────────────────────────────────────────────────────────
 _DEFAULTS = {
-    "df_raw":        None,   # 업로드된 원본 DataFrame
+    "df_raw":        None,   # 분석용 DataFrame (매핑 컬럼 + 선택 속성만 로드, 타입 정규화)
+    "df_raw_key":    None,   # df_raw를 만든 (출처, 매핑, 컬럼) 키
+    "df_preview":    None,   # 컬럼 매핑 추론용 미리보기 (앞 PREVIEW_ROWS행, 전체 컬럼)
+    "df_reader":     None,   # 현재 출처의 로더 reader(columns=None, nrows=None, mapping=None)
     "df_sheets":     [],     # Excel 시트 목록
+    "sheet_frames":  {},     # {(내용 해시, 시트, 컬럼, 행 수): DataFrame} — 최근 읽은 Excel 시트 미리보기
+    "source_key":    None,   # 현재 데이터의 출처 (내용 해시 + 시트 / 샘플명)
+    "upload_key":    None,   # 마지막으로 처리한 업로드 파일의 내용 해시
+    "upload_hashes": {},     # {file_id: 내용 해시}
     "mapping":       {},     # {field: column_name}
     "mapping_results": [],   # MappingResult 목록
-    "event_log":     None,   # PM4Py EventLog
+    "column_profiles": {},   # {컬럼명: ColumnProfile} — 매핑 추론 · 검증 공유
+    "schema_fingerprint": None,  # 미리보기 스키마 지문 (매핑 저장소 키)
+    "event_log":     None,   # PM4Py 형식 이벤트 로그 (DataFrame)
+    "event_log_key": None,   # event_log를 만든 (출처, 매핑) 키
+    "log_fingerprint": None, # event_log 내용 지문 (결과 캐시 키)
     "miner_result":  None,   # MinerResult
+    "miner_results": {},     # {algorithm: MinerResult} — 알고리즘 비교 실행 결과
+    "case_table":    None,   # (키, CaseTable) — 통계 탭 공유 사전 계산
+    "conformance":   {},     # {(로그 지문, 모델 지문, 방식): ConformanceResult}
     "run_triggered": False,  # 분석 실행 여부
 }
 for k, v in _DEFAULTS.items():
     if k not in st.session_state:
         st.session_state[k] = v
 
+_ALGO_KEYS = {
+    "Alpha Miner":     "alpha",
+    "Heuristics Miner": "heuristics",
+    "Inductive Miner": "inductive",
+}
+
 
 # ════════════════════════════════════════════════════════════════════════════
 #  헬퍼 함수
@@ -56,18 +96,311 @@ for k, v in _DEFAULTS.items():
 def _reset_analysis():
     """데이터 변경 시 분석 결과를 초기화합니다."""
     st.session_state["event_log"]    = None
+    st.session_state["event_log_key"] = None
     st.session_state["miner_result"] = None
+    st.session_state["miner_results"] = {}
+    st.session_state["case_table"]   = None
+    st.session_state["conformance"]  = {}
     st.session_state["run_triggered"] = False
 
 
-def _load_and_infer(df: pd.DataFrame):
-    """DataFrame을 받아 컬럼 매핑을 추론하고 세션에 저장합니다."""
-    st.session_state["df_raw"] = df
+@st.cache_resource
+def _mapping_store() -> MappingStore:
+    """세션 간 공유되는 스키마 지문별 확정 매핑 저장소."""
+    return MappingStore()
+
+
+def _load_and_infer(preview: pd.DataFrame):
+    """미리보기 DataFrame으로 컬럼 매핑을 추론하고 세션에 저장합니다."""
+    st.session_state["df_preview"] = preview
+    st.session_state["df_raw"] = None
+    st.session_state["df_raw_key"] = None
     _reset_analysis()
     mapper = ColumnMapper()
-    results = mapper.map(df)
+    fingerprint = schema_fingerprint(preview)
+    stored = _mapping_store().get(fingerprint)
+    if stored is not None:
+        # 이전에 확정한 양식 — 프로파일링 없이 저장된 매핑 사용 (검증에 필요한 컬럼만 나중에 프로파일링)
+        profiles = {}
+        results = mapper.stored_results(stored, list(preview.columns))
+    else:
+        profiles = profile_columns(preview)
+        results = mapper.map(preview, profiles)
+    st.session_state["column_profiles"] = profiles
+    st.session_state["schema_fingerprint"] = fingerprint
     st.session_state["mapping_results"] = results
     st.session_state["mapping"] = {r.field: r.column for r in results}
+    # 이전 데이터의 selectbox 선택값이 새 추론 결과를 덮어쓰지 않도록 제거
+    for f in ColumnMapper.ALL_FIELDS:
+        st.session_state.pop(f"map_{f}", None)
+    st.session_state.pop("attr_columns", None)
+
+
+def _ingest(source_key: str, reader) -> bool:
+    """
+    출처(source_key)가 바뀐 경우에만 미리보기를 읽고 매핑을 추론합니다 (1단계).
+
+    reader(columns=None, nrows=None, mapping=None)는 출처별 로더로, 세션에 보관했다가
+    분석 실행 시 매핑된 컬럼만 전체 로드하는 데 사용합니다 (2단계, `_full_frame`).
+    mapping은 파싱 결과 캐시가 정규화된 프레임을 저장할 때만 쓰입니다.
+
+    Streamlit은 위젯 조작마다 스크립트 전체를 다시 실행하므로,
+    같은 출처라면 세션에 저장된 DataFrame·매핑·분석 결과를 그대로 유지합니다.
+
+    Returns
+    -------
+    새로 로드했으면 True
+    """
+    if st.session_state["source_key"] == source_key:
+        return False
+    _load_and_infer(reader(nrows=PREVIEW_ROWS))
+    st.session_state["df_reader"] = reader
+    st.session_state["source_key"] = source_key
+    return True
+
+
+def _full_frame(mapping: dict, attributes: list[str]) -> pd.DataFrame:
+    """
+    현재 출처에서 매핑된 컬럼과 추가 속성만 전체 행을 로드하고 타입을 정규화합니다.
+    (출처, 매핑, 속성) 조합별로 한 번만 읽습니다.
+    """
+    mapped = [mapping[f] for f in ColumnMapper.ALL_FIELDS if mapping.get(f)]
+    columns = list(dict.fromkeys(mapped + attributes))
+    key = (st.session_state["source_key"], tuple(mapped), tuple(columns))
+    if st.session_state["df_raw_key"] != key:
+        df = st.session_state["df_reader"](columns=columns, mapping=mapping)
+        st.session_state["df_raw"] = normalize_dtypes(
+            df,
+            case_col=mapping["case_id"],
+            activity_col=mapping["activity"],
+            timestamp_col=mapping["timestamp"],
+            resource_col=mapping.get("resource"),
+        )
+        st.session_state["df_raw_key"] = key
+    return st.session_state["df_raw"]
+
+
+@st.cache_resource
+def _miner_cache() -> MinerCache:
+    """세션 간 공유되는 분석 결과 캐시 (메모리 LRU + 디스크)."""
+    return MinerCache()
+
+
+@st.cache_resource
+def _conformance_cache() -> ConformanceCache:
+    """세션 간 공유되는 (모델, 바리언트)별 재생 결과 캐시."""
+    return ConformanceCache()
+
+
+def _enhance(result: MinerResult) -> MinerResult:
+    """
+    Petri Net 성능 오버레이를 결과당 한 번만 계산합니다.
+    계산된 결과는 세션의 MinerResult와 결과 캐시 항목을 교체하여 이후 토글에서 재사용합니다.
+    """
+    if result.enhancement is not None:
+        return result
+    enhanced = ProcessMiner(cache=_miner_cache()).enhance(
+        result, fingerprint=st.session_state["log_fingerprint"]
+    )
+    if st.session_state["miner_result"] is result:
+        st.session_state["miner_result"] = enhanced
+    for algorithm, other in st.session_state["miner_results"].items():
+        if other is result:
+            st.session_state["miner_results"][algorithm] = enhanced
+    return enhanced
+
+
+def _event_log(df: pd.DataFrame, mapping: dict):
+    """이벤트 로그를 출처·매핑 조합별로 한 번만 생성하고 지문과 함께 세션에 저장합니다."""
+    key = (st.session_state["source_key"],) + tuple(
+        mapping.get(f) for f in ColumnMapper.ALL_FIELDS
+    )
+    if st.session_state["event_log_key"] != key:
+        event_log = build_event_log(
+            df=df,
+            case_col=mapping["case_id"],
+            activity_col=mapping["activity"],
+            timestamp_col=mapping["timestamp"],
+            resource_col=mapping.get("resource"),
+            output="dataframe",
+        )
+        st.session_state["event_log"] = event_log
+        st.session_state["log_fingerprint"] = log_fingerprint(event_log)
+        st.session_state["event_log_key"] = key
+    return st.session_state["event_log"]
+
+
+def _case_table(df: pd.DataFrame, case_col: str, act_col: str, ts_col: str) -> CaseTable:
+    """통계용 CaseTable을 출처·매핑 조합별로 한 번만 계산합니다."""
+    key = (st.session_state["source_key"], case_col, act_col, ts_col)
+    cached = st.session_state["case_table"]
+    if cached is None or cached[0] != key:
+        cached = (key, build_case_table(df, case_col, act_col, ts_col))
+        st.session_state["case_table"] = cached
+    return cached[1]
+
+
+def _upload_key(uploaded) -> str:
+    """
+    업로드 파일의 식별 키(내용 해시)를 반환합니다.
+    해시는 file_id별로 한 번만 계산하므로 재실행 시 파일을 다시 읽지 않습니다.
+    """
+    file_id = getattr(uploaded, "file_id", None) or uploaded.name
+    hashes = st.session_state["upload_hashes"]
+    if file_id not in hashes:
+        hashes.clear()
+        hashes[file_id] = file_fingerprint(uploaded)
+    return hashes[file_id]
+
+
+def _read_upload(uploaded, reader, **kwargs):
+    """업로드 파일을 처음부터 읽도록 포인터를 되돌린 뒤 reader를 호출합니다."""
+    uploaded.seek(0)
+    return reader(uploaded, **kwargs)
+
+
+def _load_csv_with_progress(
+    uploaded,
+    cache_key: Optional[str] = None,
+    columns: Optional[list[str]] = None,
+    mapping: Optional[dict] = None,
+) -> pd.DataFrame:
+    """
+    CSV를 스트리밍 파싱하며 진행률을 표시합니다.
+    cache_key(파일 내용 해시)를 주면 Parquet 캐시를 거칩니다 (mapping 기준으로 정규화된 프레임 저장).
+    """
+    bar = st.progress(0.0, text="CSV 파싱 중...")
+
+    def _report(done: int, total: Optional[int]) -> None:
+        if total:
+            ratio = min(done / total, 1.0)
+            bar.progress(ratio, text=f"CSV 파싱 중... {ratio:.0%}")
+
+    try:
+        if cache_key is not None:
+            return _read_upload(
+                uploaded, load_cached, loader=load_csv, fingerprint=cache_key,
+                columns=columns, mapping=mapping, progress=_report,
+            )
+        return _read_upload(uploaded, load_csv, usecols=columns, progress=_report)
+    finally:
+        bar.empty()
+
+
+_SHEET_CACHE_SIZE = 4  # 세션에 보관할 Excel 시트 미리보기 수
+
+
+def _cached_sheet(key: tuple, load) -> pd.DataFrame:
+    """
+    (내용 해시, 시트, 컬럼, 행 수)별 Excel 미리보기 읽기 결과를 세션에 보관합니다 (최근 사용 순 LRU).
+    시트를 오가도 워크북을 다시 파싱하지 않습니다. 전체 읽기는 `df_raw`(와 디스크 캐시)가
+    보관하므로 여기에 두지 않습니다 — 원본 프레임이 정규화된 `df_raw`와 함께 세션에 남지 않도록.
+    """
+    frames = st.session_state["sheet_frames"]
+    if key in frames:
+        frames[key] = frames.pop(key)  # 최근 사용으로 갱신
+        return frames[key]
+    df = load()
+    frames[key] = df
+    while len(frames) > _SHEET_CACHE_SIZE:
+        frames.pop(next(iter(frames)))
+    return df
+
+
+def _upload_reader(uploaded, ext: str, file_key: str, sheet: Optional[str], use_cache: bool):
+    """
+    업로드 파일의 reader(columns=None, nrows=None, mapping=None)를 만듭니다.
+    nrows가 있으면 미리보기 읽기이며 캐시를 거치지 않습니다.
+    """
+    def reader(
+        columns: Optional[list[str]] = None,
+        nrows: Optional[int] = None,
+        mapping: Optional[dict] = None,
+    ) -> pd.DataFrame:
+        if ext == "parquet":
+            return _read_upload(uploaded, load_parquet, columns=columns, nrows=nrows)
+        if ext in ("arrow", "feather"):
+            return _read_upload(uploaded, load_arrow, columns=columns, nrows=nrows)
+        if ext == "xes":
+            return _read_upload(uploaded, load_xes, columns=columns, nrows=nrows)
+        if ext == "csv":
+            if nrows is not None:
+                return _read_upload(uploaded, load_csv, usecols=columns, nrows=nrows)
+            return _load_csv_with_progress(
+                uploaded, file_key if use_cache else None, columns, mapping
+            )
+        # Excel
+        if nrows is not None:
+            key = (file_key, sheet, tuple(columns or ()), nrows)
+            return _cached_sheet(key, lambda: _read_upload(
+                uploaded, load_excel, sheet_name=sheet, usecols=columns, nrows=nrows
+            )[0])
+        if not use_cache:
+            return _read_upload(uploaded, load_excel, sheet_name=sheet, usecols=columns)[0]
+        return _read_upload(
+            uploaded, load_cached,
+            loader=lambda f: load_excel(f, sheet_name=sheet)[0],
+            variant=sheet, fingerprint=file_key, columns=columns, mapping=mapping,
+        )
+
+    return reader
+
+
+_DB_SCHEMA_TTL = 300  # DB 테이블 · 컬럼 목록 캐시 유지 시간(초)
+
+
+@st.cache_data(ttl=_DB_SCHEMA_TTL, show_spinner=False)
+def _db_tables(db_url: str) -> list[str]:
+    """연결 문자열별 테이블 목록. 재실행마다 DB에 새로 연결하지 않도록 캐시합니다."""
+    return DatabaseConnector(db_url).tables()
+
+
+@st.cache_data(ttl=_DB_SCHEMA_TTL, show_spinner=False)
+def _db_columns(db_url: str, table: str) -> list[str]:
+    """(연결 문자열, 테이블)별 컬럼 목록."""
+    return DatabaseConnector(db_url).columns(table)
+
+
+def _db_source_key(db_url: str, *parts) -> str:
+    """DB 출처 키. 자격 증명이 세션 상태 · 분석 키에 남지 않도록 연결 문자열은 해시로 넣습니다."""
+    digest = hashlib.sha256(db_url.encode("utf-8")).hexdigest()[:16]
+    return ":".join(["db", digest, *map(str, parts)])
+
+
+def _db_reader(
+    connector: DatabaseConnector,
+    table: str,
+    timestamp_col: Optional[str],
+    start,
+    end,
+):
+    """
+    DB 테이블의 reader(columns=None, nrows=None, mapping=None)를 만듭니다.
+    컬럼 projection · 기간 조건 · 미리보기 행 수는 SQL로 내려 보냅니다.
+    """
+    def reader(
+        columns: Optional[list[str]] = None,
+        nrows: Optional[int] = None,
+        mapping: Optional[dict] = None,
+    ) -> pd.DataFrame:
+        return connector.load(
+            table, columns=columns, timestamp_col=timestamp_col,
+            start=start, end=end, limit=nrows,
+        )
+
+    return reader
+
+
+def _sample_reader(sample_type: str):
+    """내장 샘플의 reader(columns=None, nrows=None, mapping=None)를 만듭니다."""
+    def reader(
+        columns: Optional[list[str]] = None,
+        nrows: Optional[int] = None,
+        mapping: Optional[dict] = None,
+    ) -> pd.DataFrame:
+        return load_sample(sample_type, usecols=columns, nrows=nrows)
+
+    return reader
 
 
 # ════════════════════════════════════════════════════════════════════════════
@@ -82,44 +415,98 @@ with st.sidebar:
     st.subheader("📂 데이터 소스")
     data_source = st.radio(
         "데이터 선택",
-        ["샘플: 구매 프로세스 (KR)", "샘플: Running Example (EN)", "파일 업로드"],
+        ["샘플: 구매 프로세스 (KR)", "샘플: Running Example (EN)", "파일 업로드", "데이터베이스"],
         label_visibility="collapsed",
     )
 
     if data_source == "샘플: 구매 프로세스 (KR)":
         if st.button("샘플 불러오기", use_container_width=True):
             with st.spinner("샘플 데이터 로딩 중..."):
-                _load_and_infer(load_sample("purchase"))
+                _ingest("sample:purchase", _sample_reader("purchase"))
             st.success("구매 프로세스 샘플 로드 완료")
 
     elif data_source == "샘플: Running Example (EN)":
         if st.button("샘플 불러오기", use_container_width=True):
             with st.spinner("샘플 데이터 로딩 중..."):
-                _load_and_infer(load_sample("running_example"))
+                _ingest("sample:running_example", _sample_reader("running_example"))
             st.success("Running Example 샘플 로드 완료")
 
+    elif data_source == "데이터베이스":
+        db_url = st.text_input(
+            "연결 문자열",
+            placeholder="sqlite:///events.db · postgresql://user:pw@host/db",
+        )
+        if db_url:
+            try:
+                connector = DatabaseConnector(db_url)
+                tables = _db_tables(db_url)
+            except Exception as e:
+                st.error(f"DB 연결 실패: {e}")
+                tables = []
+            if tables:
+                table = st.selectbox("테이블", tables)
+                ts_col = st.selectbox(
+                    "기간 필터 컬럼", ["(없음)"] + _db_columns(db_url, table),
+                    help="선택하면 아래 기간 조건을 SQL WHERE 절로 DB에서 먼저 걸러냅니다.",
+                )
+                start = end = None
+                if ts_col != "(없음)":
+                    c1, c2 = st.columns(2)
+                    start = c1.date_input("시작일", value=None)
+                    end_date = c2.date_input("종료일", value=None)
+                    # 종료일은 포함 — 다음 날 0시 미만으로 조회
+                    end = end_date + pd.Timedelta(days=1) if end_date else None
+                if st.button("불러오기", use_container_width=True):
+                    timestamp_col = None if ts_col == "(없음)" else ts_col
+                    # 같은 조건으로 다시 누르면 새로 적재된 행을 반영하도록 항상 다시 조회
+                    st.session_state["source_key"] = None
+                    _db_tables.clear()
+                    _db_columns.clear()
+                    with st.spinner("DB에서 미리보기 로딩 중..."):
+                        _ingest(
+                            _db_source_key(db_url, table, timestamp_col, start, end),
+                            _db_reader(connector, table, timestamp_col, start, end),
+                        )
+                    st.success(f"테이블 로드 완료: {table}")
+
     else:
         uploaded = st.file_uploader(
-            "CSV 또는 Excel 파일 업로드",
-            type=["csv", "xlsx", "xls"],
+            "CSV · Excel · Parquet · Arrow · XES 파일 업로드 (CSV/XES는 gz · zst · zip · bz2 · xz 압축 가능)",
+            type=[
+                "csv", "xlsx", "xls", "parquet", "arrow", "feather", "xes",
+                "gz", "zst", "zip", "bz2", "xz",
+            ],
             label_visibility="collapsed",
         )
+        use_frame_cache = st.checkbox(
+            "파싱 결과 캐시 (Parquet)",
+            value=False,
+            help="CSV/Excel 파싱 결과를 디스크에 Parquet로 저장해 같은 파일을 다시 열 때 파싱을 건너뜁니다.",
+        )
         if uploaded:
             ext = uploaded.name.rsplit(".", 1)[-1].lower()
-            if ext == "csv":
-                df_new = load_csv(uploaded)
-                _load_and_infer(df_new)
-            else:
-                df_new, sheets = load_excel(uploaded)
-                st.session_state["df_sheets"] = sheets
-                if len(sheets) > 1:
-                    sel_sheet = st.selectbox("시트 선택", sheets)
-                    df_new, _ = load_excel(uploaded, sheet_name=sel_sheet)
-                _load_and_infer(df_new)
+            if f".{ext}" in COMPRESSED_SUFFIXES:
+                # 압축 파일: 이름이 *.xes.gz 등이면 XES, 그 외는 CSV (로더가 압축을 풀며 파싱)
+                inner = uploaded.name.lower().rsplit(".", 2)
+                ext = "xes" if len(inner) == 3 and inner[1] == "xes" else "csv"
+            file_key = _upload_key(uploaded)
+            sheet = None
+            if ext in ("xlsx", "xls"):
+                if st.session_state["upload_key"] != file_key:
+                    with st.spinner("시트 목록 읽는 중..."):
+                        st.session_state["df_sheets"] = _read_upload(uploaded, list_sheets)
+                sheets = st.session_state["df_sheets"]
+                sheet = st.selectbox("시트 선택", sheets) if len(sheets) > 1 else sheets[0]
+            with st.spinner("미리보기 로딩 중..."):
+                _ingest(
+                    f"{file_key}:{sheet or ext}",
+                    _upload_reader(uploaded, ext, file_key, sheet, use_frame_cache),
+                )
+            st.session_state["upload_key"] = file_key
             st.success(f"파일 로드 완료: {uploaded.name}")
 
     # ── 2. 컬럼 매핑 ─────────────────────────────────────────────────────
-    df: pd.DataFrame | None = st.session_state["df_raw"]
+    df: pd.DataFrame | None = st.session_state["df_preview"]
     if df is not None:
         st.divider()
         st.subheader("🔧 컬럼 매핑")
@@ -157,11 +544,26 @@ with st.sidebar:
 
             new_mapping[r.field] = sel if sel != "(없음)" else None
 
+        # 수정한 매핑은 분석 실행 시 확정되어 MappingStore에 저장됩니다 (위젯 재실행마다 쓰지 않음)
         st.session_state["mapping"] = new_mapping
 
+        # 추가 속성 컬럼 (매핑 컬럼과 함께 전체 로드)
+        mapped_cols = {c for c in new_mapping.values() if c}
+        attr_options = [c for c in df.columns if c not in mapped_cols]
+        st.session_state["attr_columns"] = [
+            c for c in st.session_state.get("attr_columns", []) if c in attr_options
+        ]
+        st.multiselect(
+            "추가 속성 컬럼",
+            attr_options,
+            key="attr_columns",
+            help="분석 실행 시 매핑된 컬럼과 함께 읽을 컬럼입니다. "
+                 "선택하지 않은 컬럼은 로드하지 않아 메모리와 파싱 시간이 줄어듭니다.",
+        )
+
         # 유효성 검사 메시지
         mapper = ColumnMapper()
-        msgs = mapper.validate(df, new_mapping)
+        msgs = mapper.validate(df, new_mapping, st.session_state["column_profiles"])
         for m in msgs:
             if m["level"] == "error":
                 st.error(m["message"], icon="🚫")
@@ -205,6 +607,20 @@ with st.sidebar:
             "Inductive Miner": "📖 재귀 분할 기반. Fitness 100% 보장, 실무 권장.",
         }
         st.caption(algo_info[algorithm])
+        algo_key = _ALGO_KEYS[algorithm]
+
+        time_budget = st.number_input(
+            "Discovery 시간 제한 (초)",
+            min_value=5, max_value=3600, value=120, step=5,
+            help="제한 시간을 넘기면 모델 생성을 중단하고 DFG와 통계만 표시합니다.",
+        )
+
+        compare_all = st.checkbox(
+            "세 알고리즘 동시 실행 (비교)",
+            help="Alpha · Heuristics · Inductive를 병렬로 실행합니다. "
+                 "이후 알고리즘을 바꾸면 재실행 없이 결과를 전환합니다. "
+                 "선택하지 않은 알고리즘은 기본 파라미터를 사용합니다.",
+        )
 
         # ── 4. 시각화 타입 ──────────────────────────────────────────────
         st.divider()
@@ -217,8 +633,15 @@ with st.sidebar:
             label_visibility="collapsed",
         )
 
+        perf_overlay = False
         if viz_type == "DFG":
             st.caption("📊 빈도(노드 색상·엣지 두께)와 성능(엣지 색상)을 동시에 표시합니다.")
+        elif viz_type == "Petri Net":
+            perf_overlay = st.checkbox(
+                "성능 오버레이",
+                help="전이 발화 빈도(색상), 플레이스 평균 체류 시간(레이블·색상), "
+                     "아크 토큰 빈도(두께)를 표시합니다. 결과당 한 번 계산 후 캐시됩니다.",
+            )
 
         # ── 5. 실행 버튼 ─────────────────────────────────────────────────
         st.divider()
@@ -243,25 +666,30 @@ with st.sidebar:
 # ════════════════════════════════════════════════════════════════════════════
 if "run_btn" in dir() and run_btn:
     mapping = st.session_state["mapping"]
+    _mapping_store().put(st.session_state["schema_fingerprint"], mapping)
     with st.spinner("분석 실행 중..."):
         try:
-            event_log = build_event_log(
-                df=st.session_state["df_raw"],
-                case_col=mapping["case_id"],
-                activity_col=mapping["activity"],
-                timestamp_col=mapping["timestamp"],
-                resource_col=mapping.get("resource"),
-            )
-            st.session_state["event_log"] = event_log
-
-            algo_key = {
-                "Alpha Miner":     "alpha",
-                "Heuristics Miner": "heuristics",
-                "Inductive Miner": "inductive",
-            }[algorithm]
-
-            miner = ProcessMiner()
-            result = miner.run(event_log, algo_key, algo_params)
+            df_full = _full_frame(mapping, st.session_state.get("attr_columns", []))
+            event_log = _event_log(df_full, mapping)
+
+            miner = ProcessMiner(cache=_miner_cache())
+            if compare_all:
+                requests = {a: {} for a in _ALGO_KEYS.values()}
+                requests[algo_key] = algo_params
+                results = miner.run_many(
+                    event_log, requests,
+                    timeout=time_budget,
+                    fingerprint=st.session_state["log_fingerprint"],
+                )
+                st.session_state["miner_results"] = results
+                result = results[algo_key]
+            else:
+                st.session_state["miner_results"] = {}
+                result = miner.run(
+                    event_log, algo_key, algo_params,
+                    fingerprint=st.session_state["log_fingerprint"],
+                    time_budget=time_budget,
+                )
             st.session_state["miner_result"] = result
             st.session_state["run_triggered"] = True
         except Exception as e:
@@ -273,7 +701,11 @@ if "run_btn" in dir() and run_btn:
 #  메인 영역
 # ════════════════════════════════════════════════════════════════════════════
 miner_result = st.session_state.get("miner_result")
+if "algo_key" in dir() and algo_key in st.session_state["miner_results"]:
+    # 비교 실행 결과가 있으면 현재 선택한 알고리즘의 결과를 표시
+    miner_result = st.session_state["miner_results"][algo_key]
 df_raw: pd.DataFrame | None = st.session_state.get("df_raw")
+df_preview: pd.DataFrame | None = st.session_state.get("df_preview")
 
 if not st.session_state.get("run_triggered") or miner_result is None:
     # ── 랜딩 화면 ─────────────────────────────────────────────────────────
@@ -295,11 +727,14 @@ if not st.session_state.get("run_triggered") or miner_result is None:
     with col3:
         st.info("**3️⃣ 알고리즘 선택 후 실행**\n\n원하는 Discovery 알고리즘과 시각화 방식을 선택하고 분석을 실행하세요.")
 
-    if df_raw is not None:
+    if df_preview is not None:
         st.divider()
         st.subheader("📋 데이터 미리보기")
-        st.dataframe(df_raw.head(10), use_container_width=True)
-        st.caption(f"총 {len(df_raw):,}행 × {len(df_raw.columns)}열")
+        st.dataframe(df_preview.head(10), use_container_width=True)
+        st.caption(
+            f"미리보기 {len(df_preview):,}행 × {len(df_preview.columns)}열 "
+            "(분석 실행 시 매핑된 컬럼만 전체 로드)"
+        )
 
 else:
     # ── 분석 결과 화면 ────────────────────────────────────────────────────
@@ -308,8 +743,10 @@ else:
     act_col  = mapping["activity"]
     ts_col   = mapping["timestamp"]
 
+    case_table = _case_table(df_raw, case_col, act_col, ts_col)
+
     # 4가지 핵심 지표
-    overview = compute_overview(df_raw, case_col, act_col, ts_col)
+    overview = compute_overview(df_raw, case_col, act_col, ts_col, table=case_table)
 
     m1, m2, m3, m4 = st.columns(4)
     m1.metric("📦 케이스 수",   f"{overview['n_cases']:,}")
@@ -330,8 +767,22 @@ else:
     viz_label = viz_type if "viz_type" in dir() else "DFG"
     st.subheader(f"🗺️ 프로세스 모델 — {viz_label}")
 
+    if not miner_result.model_available:
+        st.warning(
+            f"모델 생성에 실패했습니다 ({miner_result.error}). DFG와 통계만 표시됩니다.",
+            icon="⏱",
+        )
+
     visualizer = ProcessVisualizer()
 
+    show_overlay = viz_label == "Petri Net" and "perf_overlay" in dir() and perf_overlay
+    if show_overlay and miner_result.model_available and miner_result.enhancement is None:
+        with st.spinner("성능 오버레이 계산 중 (바리언트 재생)..."):
+            try:
+                miner_result = _enhance(miner_result)
+            except Exception as e:
+                st.warning(f"성능 오버레이 계산에 실패했습니다: {e}", icon="⚠️")
+
     with st.spinner("시각화 렌더링 중..."):
         if viz_label == "DFG":
             html_content = visualizer.render_dfg_combined(
@@ -340,12 +791,18 @@ else:
                 miner_result.start_activities,
                 miner_result.end_activities,
                 miner_result.activities_count,
+                performance_stats=miner_result.performance_stats,
+            )
+        elif not miner_result.model_available:
+            html_content = ProcessVisualizer._error_html(
+                "프로세스 모델이 없습니다. DFG를 선택하거나 다시 실행해주세요."
             )
         elif viz_label == "Petri Net":
             html_content = visualizer.render_petri_net(
                 miner_result.net,
                 miner_result.initial_marking,
                 miner_result.final_marking,
+                enhancement=miner_result.enhancement if show_overlay else None,
             )
         else:  # BPMN
             if miner_result.bpmn_model is None:
@@ -359,13 +816,113 @@ else:
     st.components.v1.html(html_content, height=640, scrolling=False)
     st.caption("🖱️ 드래그로 이동 · 스크롤로 확대/축소 · 버튼으로 초기화")
 
+    # ── 적합도 검사 ────────────────────────────────────────────────────────
+    if miner_result.model_available:
+        st.divider()
+        st.subheader("✅ 적합도 검사 (Conformance)")
+
+        col_method, col_btn = st.columns([3, 1])
+        with col_method:
+            method_label = st.radio(
+                "검사 방식",
+                ["Token Replay", "Alignments"],
+                horizontal=True,
+                help="Token Replay는 빠르고, Alignments는 정확하지만 느립니다. "
+                     "두 방식 모두 고유 바리언트만 재생해 케이스 수로 가중합니다.",
+            )
+        conf_method = {"Token Replay": "token_replay", "Alignments": "alignments"}[method_label]
+        conf_key = (
+            st.session_state["log_fingerprint"],
+            model_fingerprint(
+                miner_result.net, miner_result.initial_marking, miner_result.final_marking
+            ),
+            conf_method,
+        )
+        conformance = st.session_state["conformance"].get(conf_key)
+        with col_btn:
+            conf_btn = st.button(
+                "적합도 계산" if conformance is None or conformance.complete else "이어서 계산",
+                use_container_width=True,
+            )
+
+        if conf_btn and (conformance is None or not conformance.complete):
+            with st.spinner("바리언트 재생 중..."):
+                try:
+                    conformance = check_conformance(
+                        miner_result.event_log,
+                        miner_result.net,
+                        miner_result.initial_marking,
+                        miner_result.final_marking,
+                        method=conf_method,
+                        cache=_conformance_cache(),
+                        time_budget=time_budget if "time_budget" in dir() else None,
+                    )
+                    st.session_state["conformance"][conf_key] = conformance
+                except Exception as e:
+                    st.error(f"적합도 검사 중 오류가 발생했습니다: {e}")
+
+        if conformance is None:
+            st.caption(
+                "모델이 이벤트 로그를 얼마나 재현하는지(Fitness)와 "
+                "로그에 없는 흐름을 얼마나 허용하는지(Precision)를 계산합니다."
+            )
+        else:
+            c1, c2, c3, c4 = st.columns(4)
+            c1.metric("🎯 Fitness",
+                      "-" if pd.isna(conformance.fitness) else f"{conformance.fitness:.3f}",
+                      help="로그 수준 적합도 (1.0 = 모든 케이스를 모델로 재현)")
+            c2.metric("🔍 Precision",
+                      "-" if conformance.precision is None else f"{conformance.precision:.3f}",
+                      help="ETConformance 토큰 기반 정밀도 (시간 초과 시 미표시)")
+            c3.metric("✔️ 적합 케이스",
+                      "-" if pd.isna(conformance.percentage_fit_cases)
+                      else f"{conformance.percentage_fit_cases:.1f}%")
+            c4.metric("📐 평가 범위", f"{conformance.coverage * 100:.1f}%",
+                      help="재생을 마친 바리언트에 속한 케이스 비율")
+            if conformance.error:
+                st.warning(
+                    f"{conformance.error}. 케이스 수가 많은 바리언트부터 평가했습니다. "
+                    "'이어서 계산'을 누르면 평가한 바리언트는 캐시에서 재사용합니다.",
+                    icon="⏱",
+                )
+            st.caption(
+                f"바리언트 {conformance.n_variants:,}개 중 {conformance.n_evaluated:,}개 평가 · "
+                f"캐시 재사용 {conformance.cache_hits:,}건 · {conformance.elapsed:.1f}초"
+            )
+
+            col_case, col_variant = st.columns(2)
+            with col_case:
+                st.markdown("**케이스별 Fitness** (낮은 순)")
+                st.dataframe(
+                    conformance.case_fitness
+                    .sort_values("fitness", kind="stable")
+                    .rename(columns={
+                        "case": "케이스", "variant_id": "바리언트",
+                        "fitness": "Fitness", "is_fit": "적합",
+                    }),
+                    use_container_width=True,
+                    hide_index=True,
+                    height=320,
+                )
+            with col_variant:
+                st.markdown("**바리언트별 Fitness** (케이스 수 순)")
+                st.dataframe(
+                    conformance.variant_fitness.rename(columns={
+                        "variant_id": "바리언트", "variant": "활동 순서", "cases": "케이스 수",
+                        "fitness": "Fitness", "is_fit": "적합",
+                    }),
+                    use_container_width=True,
+                    hide_index=True,
+                    height=320,
+                )
+
     # ── 통계 섹션 ──────────────────────────────────────────────────────────
     st.divider()
 
     tab1, tab2, tab3 = st.tabs(["📈 활동별 통계", "🔀 프로세스 바리언트", "📋 이벤트 로그"])
 
     with tab1:
-        act_stats = compute_activity_stats(df_raw, case_col, act_col, ts_col)
+        act_stats = compute_activity_stats(df_raw, case_col, act_col, ts_col, table=case_table)
 
         col_chart, col_table = st.columns([3, 2])
         with col_chart:
@@ -401,7 +958,9 @@ else:
             )
 
         # 케이스 소요 시간 분포
-        durations = compute_case_duration_distribution(df_raw, case_col, ts_col)
+        durations = compute_case_duration_distribution(
+            df_raw, case_col, ts_col, table=case_table
+        )
         if len(durations) > 0:
             fig2 = px.histogram(
                 durations,
@@ -414,7 +973,9 @@ else:
             st.plotly_chart(fig2, use_container_width=True)
 
     with tab2:
-        variants_df = compute_variants(df_raw, case_col, act_col, ts_col, top_n=10)
+        variants_df = compute_variants(
+            df_raw, case_col, act_col, ts_col, top_n=10, table=case_table
+        )
         st.dataframe(
             variants_df.rename(columns={
                 "variant": "프로세스 경로",
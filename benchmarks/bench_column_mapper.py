@@ -0,0 +1,100 @@
+"""
+컬럼 매핑 추론 벤치마크
+SAP 추출 형태의 넓은 테이블(컬럼 50~500개)에서 프로파일링 · 스코어링 시간을
+컬럼 수와 워커 수별로 측정합니다.
+
+실행: python benchmarks/bench_column_mapper.py [--rows 20000] [--columns 50 100 200 500] [--workers 1 4]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+
+from core.column_mapper import ColumnMapper, profile_columns  # noqa: E402
+
+
+# ──────────────────────────────────────────────
+# 넓은 테이블 생성
+# ──────────────────────────────────────────────
+
+def make_wide_table(n_columns: int, n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    이벤트 로그 필수 컬럼 4개 + SAP 필드 형태의 부가 컬럼으로 된 테이블을 만듭니다.
+
+    부가 컬럼은 자재번호(0 채운 숫자열) · 전기일(dd.mm.yyyy) · 수량(실수) · 플랜트 코드(결측 포함) ·
+    코스트센터(정수)를 순서대로 반복합니다.
+    """
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2024-01-01")
+    case_ids = np.sort(rng.integers(0, n_rows // 6 + 1, n_rows))
+    columns = {
+        "주문번호": pd.Series(case_ids).map("PO-{:07d}".format),
+        "활동명": rng.choice(["구매요청", "승인", "발주", "입고검수", "대금지급"], n_rows),
+        "시작시각": (base + pd.to_timedelta(rng.integers(0, 10**7, n_rows), unit="s"))
+                   .strftime("%Y-%m-%d %H:%M:%S"),
+        "담당자": rng.choice([f"user{i:02d}" for i in range(30)], n_rows),
+    }
+    for i in range(n_columns - len(columns)):
+        kind = i % 5
+        if kind == 0:
+            columns[f"MATNR_{i}"] = pd.Series(rng.integers(0, 10**6, n_rows)).astype(str).str.zfill(10)
+        elif kind == 1:
+            offsets = pd.to_timedelta(rng.integers(0, 10**7, n_rows), unit="s")
+            columns[f"BUDAT_{i}"] = (base + offsets).strftime("%d.%m.%Y")
+        elif kind == 2:
+            columns[f"MENGE_{i}"] = rng.random(n_rows) * 100
+        elif kind == 3:
+            columns[f"WERKS_{i}"] = rng.choice(["1000", "2000", "3000", None], n_rows)
+        else:
+            columns[f"KOSTL_{i}"] = rng.integers(0, 50, n_rows)
+    return pd.DataFrame(columns)
+
+
+# ──────────────────────────────────────────────
+# 측정
+# ──────────────────────────────────────────────
+
+def bench(df: pd.DataFrame, workers: int, repeat: int) -> tuple[float, float, dict]:
+    """(프로파일링 초, 스코어링 초, 매핑) — repeat회 중 최솟값."""
+    profile_times, score_times = [], []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        profiles = profile_columns(df, max_workers=workers)
+        t1 = time.perf_counter()
+        results = ColumnMapper().map(df, profiles)
+        t2 = time.perf_counter()
+        profile_times.append(t1 - t0)
+        score_times.append(t2 - t1)
+    mapping = {r.field: r.column for r in results}
+    return min(profile_times), min(score_times), mapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--columns", type=int, nargs="+", default=[50, 100, 200, 500])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"rows={args.rows:,}  cpu={os.cpu_count()}")
+    print(f"{'columns':>8} {'workers':>8} {'profile(s)':>11} {'score(s)':>9} {'ms/col':>7}  mapping")
+    for n_columns in args.columns:
+        df = make_wide_table(n_columns, args.rows)
+        for workers in dict.fromkeys(args.workers):
+            profile_s, score_s, mapping = bench(df, workers, args.repeat)
+            per_col = (profile_s + score_s) / n_columns * 1e3
+            mapped = ", ".join(f"{f}={c}" for f, c in mapping.items())
+            print(f"{n_columns:>8} {workers:>8} {profile_s:>11.3f} {score_s:>9.3f} {per_col:>7.2f}  {mapped}")
+
+
+if __name__ == "__main__":
+    main()